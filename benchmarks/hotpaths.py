@@ -0,0 +1,183 @@
+"""
+hotpaths.py
+
+Benchmarks for the controller hot paths and the demo simulators:
+
+    PIDController.step, FSMController.step, HybridController.step,
+    AITLLLM.adjust, demo 06 simulate (scalar and day-batched),
+    demo 13 simulate_metrics
+
+Usage:
+    python benchmarks/hotpaths.py                   # run + compare to baseline
+    python benchmarks/hotpaths.py --save            # write baseline JSON
+    python benchmarks/hotpaths.py --only pid.step --threshold 0.2
+
+Exit status is 1 when any metric regresses beyond --threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+sys.path.append(str(REPO / "src"))
+
+import numpy as np
+
+from aitl.controllers.fsm import FSMController
+from aitl.controllers.hybrid import HybridController
+from aitl.controllers.pid import PIDController
+from aitl.models.llm import AITLLLM
+from aitl.scenarios import get as get_scenario
+from aitl.sim.bench import Case, compare, load_baseline, run_suite, save_baseline
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+DT = 0.01
+
+
+# -----------------------------
+# Controller workloads
+# -----------------------------
+def _errors(n, seed=0):
+    return iter(np.random.default_rng(seed).normal(scale=0.5, size=n).tolist())
+
+
+def _transitions():
+    return {
+        "normal": [(lambda e: abs(e) > 0.40, "high")],
+        "high":   [(lambda e: abs(e) < 0.18, "normal")],
+    }
+
+
+def _pid_map():
+    return {
+        "normal": PIDController(1.0, 0.4, 0.01, DT),
+        "high":   PIDController(3.2, 0.4, 0.08, DT),
+    }
+
+
+def make_pid(n):
+    pid = PIDController(1.0, 0.4, 0.01, DT)
+    err = _errors(n)
+    return (lambda: pid.step(next(err))), n
+
+
+def make_fsm(n):
+    fsm = FSMController(_pid_map(), _transitions(), "normal")
+    err = _errors(n)
+    clock = iter(np.arange(n) * DT)
+    return (lambda: fsm.step(next(err), next(clock))), n
+
+
+def make_hybrid(n, instrument=False):
+    pid_map = _pid_map()
+    fsm = FSMController({k: None for k in pid_map}, _transitions(), "normal")
+    hybrid = HybridController(fsm, pid_map, tuner=AITLLLM(), instrument=instrument)
+    err = _errors(n)
+    clock = iter(np.arange(n) * DT)
+    return (lambda: hybrid.step(next(err), next(clock))), n
+
+
+def make_hybrid_timed(n):
+    return make_hybrid(n, instrument=True)
+
+
+def make_llm(n):
+    llm = AITLLLM()
+    err = _errors(n)
+    kp = [1.0]
+
+    def step():
+        kp[0] = llm.adjust("high", kp[0], next(err))
+    return step, n
+
+
+# -----------------------------
+# Demo simulators (scenario registry)
+# -----------------------------
+def make_demo06(T_s):
+    fa = get_scenario("friction_aging")
+    dt = 0.001
+    return (lambda: fa.simulate(1000, "AITL", T=float(T_s), dt=dt)), int(T_s / dt)
+
+
+def make_demo06_batch(n_days):
+    fa = get_scenario("friction_aging")
+    days = np.linspace(0, 2000, n_days)
+    dt, T = 0.001, 2.0
+    return (lambda: fa.simulate_batch(days, "AITL", T=T, dt=dt)), n_days * int(T / dt)
+
+
+def make_demo13(T_s):
+    rl = get_scenario("rl_current")
+    dt = 0.001
+    plant = dict(L_h=0.08, R0_ohm=1.2, v_max=6.0,
+                 R_step_time=2.4, R_step_ratio=0.6, R_ramp_per_s=0.03)
+
+    def run():
+        rl.simulate_metrics(
+            case="AITL", T=float(T_s), dt=dt, plant_params=plant,
+            pid_normal=(2.2, 12.0, 0.0), pid_high=(3.6, 16.0, 0.0),
+            fsm_params=dict(e_hi=0.18, e_lo=0.08, hold_s=0.18),
+            tuner_params=dict(kp_min=1.6, kp_max=7.0, step=0.25,
+                              improve_window_s=0.18, min_improve_ratio=0.82),
+        )
+    return run, int(round(T_s / dt))
+
+
+CASES = [
+    Case("pid.step",         make_pid,    sizes=(1_000, 10_000, 100_000)),
+    Case("fsm.step",         make_fsm,    sizes=(1_000, 10_000, 100_000)),
+    Case("hybrid.step",      make_hybrid, sizes=(1_000, 10_000, 100_000)),
+    Case("hybrid.step+timing", make_hybrid_timed, sizes=(1_000, 10_000, 100_000)),
+    Case("llm.adjust",       make_llm,    sizes=(1_000, 10_000, 100_000)),
+    # whole simulations: mean step time per run and its spread over `repeat` runs
+    Case("demo06.simulate",  make_demo06, sizes=(1, 5, 20), kind="run", repeat=10),
+    Case("demo06.simulate_batch", make_demo06_batch, sizes=(1, 16, 256), kind="run", repeat=10),
+    Case("demo13.simulate_metrics", make_demo13, sizes=(1, 3, 6), kind="run", repeat=10),
+]
+
+
+# -----------------------------
+# Main
+# -----------------------------
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    ap.add_argument("--save", action="store_true", help="store results as the new baseline")
+    ap.add_argument("--threshold", type=float, default=0.10,
+                    help="relative change counted as a regression (default 0.10)")
+    ap.add_argument("--only", nargs="*", help="case names to run")
+    args = ap.parse_args(argv)
+
+    os.chdir(REPO)
+    results = run_suite(CASES, only=args.only)
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"[saved] {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"(no baseline at {args.baseline}; run with --save to create one)")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), threshold=args.threshold)
+    if not regressions:
+        print(f"\nNo regressions beyond {args.threshold:.0%}.")
+        return 0
+
+    print(f"\n=== Regressions beyond {args.threshold:.0%} ===")
+    for r in regressions:
+        print(f"{r['name']:28s} size={r['size']:>8d}  {r['metric']:12s} "
+              f"{r['baseline']:12.3f} -> {r['current']:12.3f}  ({r['change']:+.1%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
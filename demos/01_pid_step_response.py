@@ -6,7 +6,7 @@ sys.path.append(ROOT)
 
 import numpy as np
 import matplotlib.pyplot as plt
-from controllers.pid import PIDController
+from aitl.controllers.pid import PIDController
 
 
 def main():
@@ -4,7 +4,7 @@ import sys
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 sys.path.append(ROOT)
 
-from controllers.fsm import FSMController
+from aitl.controllers.fsm import FSMController
 
 
 def main():
@@ -7,9 +7,10 @@ sys.path.append(ROOT)
 import numpy as np
 import matplotlib.pyplot as plt
 
-from controllers.fsm import FSMController
-from controllers.pid import PIDController
-from controllers.hybrid import HybridController
+from aitl.controllers.fsm import FSMController
+from aitl.controllers.pid import PIDController
+from aitl.controllers.hybrid import HybridController
+from aitl.sim.trace import TraceRecorder
 
 
 def main():
@@ -39,21 +40,22 @@ def main():
 
     setpoint = 1.0
     x = 0.0
-    xs, us, states_hist, ts = [], [], [], []
+    steps = 1000
+    trace = TraceRecorder(
+        {"t": "f8", "x": "f8", "u": "f8", "state": tuple(pid_map)},
+        capacity=steps,
+    )
 
-    for i in range(1000):
+    for i in range(steps):
         t = i * dt
         error = setpoint - x
         u, state = hybrid.step(error)
         x += (u - x) * dt
 
-        xs.append(x)
-        us.append(u)
-        states_hist.append(state)
-        ts.append(t)
+        trace.record(t=t, x=x, u=u, state=state)
 
     fig = plt.figure(figsize=(9, 4))
-    plt.plot(ts, xs)
+    plt.plot(trace["t"], trace["x"])
     plt.axhline(setpoint, linestyle="--", color="gray")
     plt.title("Hybrid PID × FSM Response")
 
@@ -61,9 +63,7 @@ def main():
     fig.savefig(out_graph)
 
     out_csv = os.path.join(DATA, "hybrid_states.csv")
-    with open(out_csv, "w") as f:
-        for t, s in zip(ts, states_hist):
-            f.write(f"{t:.4f},{s}\n")
+    trace.to_csv(out_csv, "{t:.4f},{state}")
 
     print("Saved", out_graph)
     print("Saved", out_csv)
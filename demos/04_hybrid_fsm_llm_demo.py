@@ -7,10 +7,10 @@ sys.path.append(ROOT)
 import numpy as np
 import matplotlib.pyplot as plt
 
-from controllers.fsm import FSMController
-from controllers.pid import PIDController
-from controllers.hybrid import HybridController
-from models.llm import AITLLLM
+from aitl.controllers.fsm import FSMController
+from aitl.controllers.pid import PIDController
+from aitl.controllers.hybrid import HybridController
+from aitl.models.llm import AITLLLM
 
 
 def main():
@@ -87,7 +87,8 @@ def main():
             original = {s: {"kp": pid_map[s].kp, "ki": pid_map[s].ki, "kd": pid_map[s].kd}
                         for s in pid_map}
 
-            new_params = llm.analyze_and_adjust(original)
+            new_params = {s: dict(original[s], kp=llm.adjust(s, original[s]["kp"], error))
+                          for s in pid_map}
 
             for s in pid_map:
                 pid_map[s].kp = new_params[s]["kp"]
@@ -1,3 +1,4 @@
+import argparse
 import os, sys, time
 import numpy as np
 import matplotlib.pyplot as plt
@@ -8,13 +9,90 @@ import matplotlib.pyplot as plt
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 sys.path.append(ROOT)
 
-from controllers.fsm import FSMController
-from controllers.pid import PIDController
-from controllers.hybrid import HybridController
-from models.llm import AITLLLM
+from aitl.controllers.fsm import FSMController
+from aitl.controllers.pid import PIDController
+from aitl.controllers.hybrid import HybridController
+from aitl.models.llm import AITLLLM
+from aitl.sim.animate import render_animation
+from aitl.sim.profiles import Impulse, Profile
+from aitl.sim.trace import TraceRecorder
 
 
-def main():
+# -------------------------------------------------
+# Figure (shared by the PNG and the animation)
+# -------------------------------------------------
+def plot_panels(ts, xs, fsm_arr, kp_normal, kp_high, events, dpi=None):
+    fig, ax = plt.subplots(3, 1, figsize=(11, 12), sharex=True, dpi=dpi)
+
+    # ==========================
+    # 1. System Response
+    # ==========================
+    ax[0].plot(ts, xs, label="x(t)", color="#0060C0", linewidth=2.0)
+    ax[0].axhline(1.0, ls="--", color="#888888", label="reference r")
+
+    for td in events:
+        ax[0].axvline(td, color="red", ls="--", alpha=0.8)
+        ax[0].text(td, 1.45, "disturb", color="red")
+
+    ax[0].grid(alpha=0.4)
+    ax[0].set_title("System Response + A-type LLM", fontsize=13)
+    ax[0].legend()
+
+    # ==========================
+    # 2. FSM States
+    # ==========================
+    ax[1].step(ts, fsm_arr, where="post", color="#2040FF", linewidth=2.5)
+    ax[1].set_yticks([0, 1])
+    ax[1].set_yticklabels(["normal", "high"])
+    ax[1].grid(alpha=0.4)
+    ax[1].set_title("FSM States", fontsize=13)
+
+    # FSM 判別用の境界線
+    for i in range(1, len(fsm_arr)):
+        if fsm_arr[i] != fsm_arr[i - 1]:
+            ax[1].axvline(ts[i], color="gray", ls="--", alpha=0.5)
+
+    # ==========================
+    # 3. Kp (state-dependent)
+    # ==========================
+    kp_normal_plot = np.where(fsm_arr == 0, kp_normal, np.nan)
+    kp_high_plot   = np.where(fsm_arr == 1, kp_high,   np.nan)
+
+    ax[2].step(ts, kp_normal_plot, where="mid",
+               label="kp[normal]", color="#0070FF", linewidth=3)
+    ax[2].step(ts, kp_high_plot, where="mid",
+               label="kp[high]", color="#FF8000", linewidth=3)
+
+    # FSM境界線（Kpプロットにも重ねる）
+    for i in range(1, len(fsm_arr)):
+        if fsm_arr[i] != fsm_arr[i - 1]:
+            ax[2].axvline(ts[i], color="gray", ls="--", alpha=0.5)
+
+    ax[2].grid(alpha=0.4)
+    ax[2].legend(loc="lower right")
+    ax[2].set_title("LLM Adjusted kp (state-dependent)", fontsize=13)
+
+    return fig, ax
+
+
+def cursor_setup(stride=4, dpi=100, **data):
+    """Animation frames: the full figure plus a time cursor every `stride` steps."""
+    fig, ax = plot_panels(dpi=dpi, **data)
+    ts = data["ts"]
+    ax[-1].set_xlim(ts[0], ts[-1])
+    fig.tight_layout()
+    cursors = [a.axvline(ts[0], color="gray", linewidth=2.5, alpha=0.5) for a in ax]
+
+    def update(i):
+        t = ts[min(i * stride, len(ts) - 1)]
+        for c in cursors:
+            c.set_xdata([t, t])
+        return cursors
+
+    return fig, update
+
+
+def main(animate=None, workers=1, fps=25, stride=4, out=None):
     print("Running AITL Full Demo (IDEAL)…")
 
     DATA = os.path.join(os.path.dirname(__file__), "..", "data")
@@ -54,13 +132,17 @@ def main():
     setpoint = 1.0
     x = 0.0
 
-    xs, ts, fsm_hist = [], [], []
-    kp_log = {s: [] for s in pid_map}
+    trace = TraceRecorder(
+        # fsm is categorical: codes 0 = normal, 1 = high (the plot's y levels)
+        {"t": "f8", "x": "f8", "fsm": tuple(pid_map), **{f"kp_{s}": "f8" for s in pid_map}},
+        capacity=steps,
+    )
 
-    disturbance = {
-        500: +0.8,
-        1500: -1.0,
-    }
+    disturbance = Profile(
+        Impulse(5.0, +0.8),
+        Impulse(15.0, -1.0),
+    )
+    x_kick = disturbance.sample(np.arange(steps) * dt)
 
     # -------------------------------------------------
     # Simulation loop
@@ -75,80 +157,47 @@ def main():
 
         u = pid_map[state].step(error)
 
-        if i in disturbance:
-            x += disturbance[i]
+        x += x_kick[i]
 
         tau = 0.18
         x += (u - x) * dt / tau
 
         pid_map[state].kp = llm.adjust(state, pid_map[state].kp, error)
 
-        xs.append(x)
-        ts.append(t)
-        fsm_hist.append(1 if state == "high" else 0)
-        for s in pid_map:
-            kp_log[s].append(pid_map[s].kp)
+        trace.record(t=t, x=x, fsm=state,
+                     **{f"kp_{s}": pid_map[s].kp for s in pid_map})
 
     # -------------------------------------------------
     # Plot (教材仕上げ版)
     # -------------------------------------------------
-    fig, ax = plt.subplots(3, 1, figsize=(11, 12), sharex=True)
-
-    # ==========================
-    # 1. System Response
-    # ==========================
-    ax[0].plot(ts, xs, label="x(t)", color="#0060C0", linewidth=2.0)
-    ax[0].axhline(1.0, ls="--", color="#888888", label="reference r")
-
-    for k in disturbance:
-        td = k * dt
-        ax[0].axvline(td, color="red", ls="--", alpha=0.8)
-        ax[0].text(td, 1.45, "disturb", color="red")
-
-    ax[0].grid(alpha=0.4)
-    ax[0].set_title("System Response + A-type LLM", fontsize=13)
-    ax[0].legend()
-
-    # ==========================
-    # 2. FSM States
-    # ==========================
-    ax[1].step(ts, fsm_hist, where="post", color="#2040FF", linewidth=2.5)
-    ax[1].set_yticks([0, 1])
-    ax[1].set_yticklabels(["normal", "high"])
-    ax[1].grid(alpha=0.4)
-    ax[1].set_title("FSM States", fontsize=13)
-
-    # FSM 判別用の境界線
-    fsm_arr = np.array(fsm_hist)
-    for i in range(1, len(fsm_arr)):
-        if fsm_arr[i] != fsm_arr[i - 1]:
-            ax[1].axvline(ts[i], color="gray", ls="--", alpha=0.5)
-
-    # ==========================
-    # 3. Kp (state-dependent)
-    # ==========================
-    kp_normal_plot = np.where(fsm_arr == 0, kp_log["normal"], np.nan)
-    kp_high_plot   = np.where(fsm_arr == 1, kp_log["high"],   np.nan)
-
-    ax[2].step(ts, kp_normal_plot, where="mid",
-               label="kp[normal]", color="#0070FF", linewidth=3)
-    ax[2].step(ts, kp_high_plot, where="mid",
-               label="kp[high]", color="#FF8000", linewidth=3)
-
-    # FSM境界線（Kpプロットにも重ねる）
-    for i in range(1, len(fsm_arr)):
-        if fsm_arr[i] != fsm_arr[i - 1]:
-            ax[2].axvline(ts[i], color="gray", ls="--", alpha=0.5)
-
-    ax[2].grid(alpha=0.4)
-    ax[2].legend(loc="lower right")
-    ax[2].set_title("LLM Adjusted kp (state-dependent)", fontsize=13)
+    data = dict(ts=trace["t"], xs=trace["x"], fsm_arr=trace["fsm"],
+                kp_normal=trace["kp_normal"], kp_high=trace["kp_high"],
+                events=disturbance.events())
+    fig, ax = plot_panels(**data)
 
     # Save
-    out = os.path.join(DATA, f"aitl_full_demo_ideal_{int(time.time())}.png")
+    if out is None:
+        out = os.path.join(DATA, f"aitl_full_demo_ideal_{int(time.time())}.png")
     fig.savefig(out, dpi=150, bbox_inches="tight")
     print("Saved to:", out)
 
+    # Animation: one video/GIF instead of per-frame PNG dumps
+    if animate:
+        n_frames = -(-steps // stride)
+        render_animation(cursor_setup, n_frames, animate,
+                         setup_kwargs=dict(stride=stride, **data),
+                         fps=fps, workers=workers)
+        print("Saved to:", animate)
+
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--animate", metavar="PATH",
+                    help="also render a cursor animation (.gif/.mp4/.webm)")
+    ap.add_argument("--workers", type=int, default=1, help="processes rendering frame chunks")
+    ap.add_argument("--fps", type=int, default=25)
+    ap.add_argument("--stride", type=int, default=4, help="simulation steps per frame")
+    ap.add_argument("--out", metavar="PATH", help="PNG path (default: timestamped under data/)")
+    args = ap.parse_args()
+    main(animate=args.animate, workers=args.workers, fps=args.fps, stride=args.stride,
+         out=args.out)
@@ -1,17 +1,32 @@
 """
 07_reliability_metrics_dt_amp.py
 
-Reliability metrics demo (self-contained):
+Reliability metrics demo:
 - Δt   : timing deviation (peak-to-peak)
 - Amp  : amplitude ratio (motion authority)
 
-This script is intentionally independent from 06_ demos.
+Keeps its own copy of the friction-aging plant and controller (it does
+not import demo 06 or scenarios.friction_aging); the shared helpers
+(RollingWindow, peak finding, TraceStore) come from src/.
 """
 
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(ROOT)
+
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+from aitl.core.window import RollingWindow
+from aitl.sim.peaks import find_peaks, min_dist_steps
+from aitl.sim.tracestore import TraceStore
+
+# Stream waveforms to memory-mapped trace stores here (None = keep in RAM)
+TRACE_DIR = None
+
 # =========================================================
 # Utility
 # =========================================================
@@ -102,7 +117,8 @@ def retune_pid(base, state):
 def simulate(day, controller_type,
              base_gains=(25.0, 50.0, 0.3),
              T=20.0, dt=0.001,
-             Vmax=12.0, Imax=6.0):
+             Vmax=12.0, Imax=6.0,
+             store=None):
 
     p = plant_params(day)
     pid = PID(*base_gains, dt)
@@ -114,37 +130,54 @@ def simulate(day, controller_type,
     n = int(T / dt)
     slow_N = int(0.1 / dt)
 
-    xs = np.zeros(n)
-    Is = np.zeros(n)
-
-    for k in range(n):
-        e = x_ref - x
-
-        u_unsat = pid.kp*e + pid.ki*pid.i \
-                  + pid.kd*((e - pid.e_prev)/dt)
-
-        V_pre = sat(u_unsat, -Vmax, Vmax)
-        I_pre = sat(V_pre / p["R"], -Imax, Imax)
-
-        if controller_type == "AITL" and k > 500 and k % slow_N == 0:
-            win = Is[max(0, k-500):k]
-            metrics = {
-                "isat_rate": np.mean(np.abs(win) >= (Imax - 1e-6)),
-                "low_speed_error": abs(e) if abs(v) < 0.01 else 0.0
-            }
-            state = fsm_state(metrics)
-            pid.kp, pid.ki, pid.kd = retune_pid(base_gains, state)
-
-        u = pid.step(e, V_pre, u_unsat)
-        V = sat(u, -Vmax, Vmax)
-        I = sat(V / p["R"], -Imax, Imax)
-
-        a = (p["Kt"]*I - p["b"]*v - friction(v, p)) / p["m"]
-        v += a * dt
-        x += v * dt
-
-        xs[k] = x
-        Is[k] = I
+    # last 500 |I| samples for the AITL saturation metric (O(1) per step)
+    win_N = 500
+    Is_win = RollingWindow(win_N, thresholds=(Imax - 1e-6,))
+
+    if store is None:
+        xs = np.zeros(n)
+    else:
+        out = TraceStore(store, {"t": "f8", "x": "f8", "I": "f8"},
+                         attrs=dict(day=day, controller=controller_type, dt=dt))
+
+    try:
+        for k in range(n):
+            e = x_ref - x
+
+            u_unsat = pid.kp*e + pid.ki*pid.i \
+                      + pid.kd*((e - pid.e_prev)/dt)
+
+            V_pre = sat(u_unsat, -Vmax, Vmax)
+            I_pre = sat(V_pre / p["R"], -Imax, Imax)
+
+            if controller_type == "AITL" and k > win_N and k % slow_N == 0:
+                metrics = {
+                    "isat_rate": Is_win.fraction_above(),
+                    "low_speed_error": abs(e) if abs(v) < 0.01 else 0.0
+                }
+                state = fsm_state(metrics)
+                pid.kp, pid.ki, pid.kd = retune_pid(base_gains, state)
+
+            u = pid.step(e, V_pre, u_unsat)
+            V = sat(u, -Vmax, Vmax)
+            I = sat(V / p["R"], -Imax, Imax)
+
+            a = (p["Kt"]*I - p["b"]*v - friction(v, p)) / p["m"]
+            v += a * dt
+            x += v * dt
+
+            Is_win.push(abs(I))
+            if store is None:
+                xs[k] = x
+            else:
+                out.append(t=k * dt, x=x, I=I)
+    finally:
+        if store is not None:
+            out.close()
+
+    if store is not None:
+        trace = TraceStore.open(store)
+        return trace["t"], trace["x"]
 
     t = np.arange(n) * dt
     return t, xs
@@ -154,14 +187,7 @@ def simulate(day, controller_type,
 # =========================================================
 
 def find_peaks_simple(t, x, min_dist_s=0.8):
-    idx = np.where((x[1:-1] > x[:-2]) & (x[1:-1] > x[2:]))[0] + 1
-    min_dist = int(min_dist_s / (t[1]-t[0]))
-    peaks, last = [], -10**9
-    for i in idx:
-        if i - last >= min_dist:
-            peaks.append(i)
-            last = i
-    return np.array(peaks, dtype=int)
+    return find_peaks(x, min_dist_steps(t, min_dist_s)).astype(int)
 
 def compute_dt(t, x_ref, x_cmp):
     pr = find_peaks_simple(t, x_ref)
@@ -183,9 +209,12 @@ def amplitude(x):
 if __name__ == "__main__":
 
     # --- simulate ---
-    t, x_ref        = simulate(0,    "PID")
-    _, x_pid_1000   = simulate(1000, "PID")
-    _, x_aitl_1000  = simulate(1000, "AITL")
+    def store(name):
+        return None if TRACE_DIR is None else Path(TRACE_DIR) / name
+
+    t, x_ref        = simulate(0,    "PID",  store=store("PID_0d"))
+    _, x_pid_1000   = simulate(1000, "PID",  store=store("PID_1000d"))
+    _, x_aitl_1000  = simulate(1000, "AITL", store=store("AITL_1000d"))
 
     # --- Δt ---
     dt_pid  = compute_dt(t, x_ref, x_pid_1000)
@@ -1,7 +1,7 @@
 """
 08_reliability_fsm_dt_amp_guard.py
 
-- Uses demo 06 via runpy (avoid importing module names starting with digits)
+- Uses the demo 06 scenario via the importable registry (scenarios.friction_aging)
 - Computes:
     Δt mean (using demo06.compute_dt)
     Amp ratio (A/A0)
@@ -16,14 +16,18 @@
 from __future__ import annotations
 
 import os
-import runpy
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+from aitl import scenarios
+from aitl.sim.cache import ResultCache, default_cache_dir
+
 
 # -----------------------------
 # Config
@@ -36,6 +40,16 @@ AMP_MIN = 0.90      # motion authority lower bound
 OUT_DIR = Path("data")
 OUT_DIR.mkdir(exist_ok=True)
 
+# If set, waveforms are streamed to memory-mapped trace stores under this
+# directory and metrics read them back zero-copy (run length bounded by disk).
+TRACE_DIR: Optional[Path] = None
+
+# Identical simulate_response() calls are served from an on-disk cache
+# keyed by parameters + the source of demo 06 and every src/ module it
+# imports ($AITL_CACHE_DIR to relocate; the directory appears on first write).
+USE_CACHE = True
+CACHE = ResultCache(default_cache_dir() / "simulate_response")
+
 
 # -----------------------------
 # Metrics
@@ -110,30 +124,23 @@ def decide(dt: float, amp: float, dt_max: float, amp_min: float) -> FsmDecision:
 
 
 # -----------------------------
-# Load demo 06 via runpy
+# Load demo 06 scenario
 # -----------------------------
 def get_repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def load_demo06(repo_root: Path) -> Dict:
-    demo06_path = repo_root / "demos" / "06_pid_initial_vs_aitl_friction_aging_demo.py"
-    if not demo06_path.exists():
-        raise FileNotFoundError(f"demo 06 not found: {demo06_path}")
-
-    env = runpy.run_path(str(demo06_path))
-
-    # must have simulate_response
-    if "simulate_response" not in env:
-        raise RuntimeError(
-            "demo 06 loaded, but simulate_response() was not found.\n"
-            "Please add simulate_response() to demo 06 (see provided patch)."
-        )
-    return env
+def load_demo06() -> Dict:
+    """Namespace of the friction-aging scenario (imported once, no re-exec)."""
+    return vars(scenarios.get("friction_aging"))
 
 def simulate(env: Dict, controller: str, aging_days: int, variant: str) -> Tuple[np.ndarray, np.ndarray]:
     fn = env["simulate_response"]
-    t, x = fn(controller=controller, aging_days=aging_days, variant=variant)
+    if TRACE_DIR is None and USE_CACHE:
+        t, x = CACHE.call(fn, controller=controller, aging_days=aging_days, variant=variant)
+    else:
+        store = None if TRACE_DIR is None else TRACE_DIR / f"{controller}_{variant}_{aging_days}d"
+        t, x = fn(controller=controller, aging_days=aging_days, variant=variant, store=store)
     t = np.asarray(t, dtype=float)
     x = np.asarray(x, dtype=float)
     return t, x
@@ -178,7 +185,7 @@ def main() -> None:
     repo_root = get_repo_root()
     os.chdir(repo_root)  # ensure relative data/ path
 
-    env06 = load_demo06(repo_root)
+    env06 = load_demo06()
 
     # Reference: Initial (day=0, PID)
     t_ref, x_ref = simulate(env06, controller="PID", aging_days=0, variant="initial")
@@ -1,7 +1,7 @@
 """
 09_reliability_cost_tradeoff.py
 
-- Uses demo 06 via runpy
+- Uses the demo 06 scenario via the importable registry
 - Computes:
     Δt mean
     Amplitude ratio
@@ -14,13 +14,17 @@
 from __future__ import annotations
 
 import os
-import runpy
+import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+from aitl import scenarios
+from aitl.sim.cache import ResultCache, default_cache_dir
+
 
 # =========================================================
 # Config
@@ -37,6 +41,15 @@ W_AMP = 4.0         # penalize authority loss strongly
 OUT_DIR = Path("data")
 OUT_DIR.mkdir(exist_ok=True)
 
+# Stream waveforms to memory-mapped trace stores here (None = keep in RAM)
+TRACE_DIR: Optional[Path] = None
+
+# Identical simulate_response() calls are served from an on-disk cache
+# keyed by parameters + the source of demo 06 and every src/ module it
+# imports ($AITL_CACHE_DIR to relocate; the directory appears on first write).
+USE_CACHE = True
+CACHE = ResultCache(default_cache_dir() / "simulate_response")
+
 
 # =========================================================
 # Metrics
@@ -69,19 +82,22 @@ def get_repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
-def load_demo06(repo_root: Path) -> Dict:
-    demo06_path = repo_root / "demos" / "06_pid_initial_vs_aitl_friction_aging_demo.py"
-    env = runpy.run_path(str(demo06_path))
-    if "simulate_response" not in env:
-        raise RuntimeError("simulate_response() not found in demo 06")
-    return env
+def load_demo06() -> Dict:
+    return vars(scenarios.get("friction_aging"))
 
 
 def simulate(env: Dict, controller: str, aging_days: int, variant: str) -> Tuple[np.ndarray, np.ndarray]:
+    if TRACE_DIR is None and USE_CACHE:
+        t, x = CACHE.call(env["simulate_response"],
+                          controller=controller, aging_days=aging_days, variant=variant)
+        return np.asarray(t), np.asarray(x)
+
+    store = None if TRACE_DIR is None else TRACE_DIR / f"{controller}_{variant}_{aging_days}d"
     t, x = env["simulate_response"](
         controller=controller,
         aging_days=aging_days,
-        variant=variant
+        variant=variant,
+        store=store,
     )
     return np.asarray(t), np.asarray(x)
 
@@ -110,7 +126,7 @@ def main():
     repo_root = get_repo_root()
     os.chdir(repo_root)
 
-    env06 = load_demo06(repo_root)
+    env06 = load_demo06()
 
     # Reference
     t_ref, x_ref = simulate(env06, "PID", 0, "initial")
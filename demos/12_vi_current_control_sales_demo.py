@@ -1,36 +1,15 @@
 from __future__ import annotations
-import math
 import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(ROOT)
+
 import numpy as np
 import matplotlib.pyplot as plt
 
-# ============================================================
-# Plant: RL current dynamics (V -> I)
-# ============================================================
-class RLPlant:
-    def __init__(self, L_h: float, R0_ohm: float, v_max: float):
-        self.L = L_h
-        self.R0 = R0_ohm
-        self.v_max = v_max
-        self.I = 0.0
-
-    def reset(self, I0: float = 0.0):
-        self.I = I0
-
-    def R_of_t(self, t, R_step_time, R_step_ratio, R_ramp):
-        R = self.R0
-        if t >= R_step_time:
-            R = self.R0 * (1.0 + R_step_ratio)
-        R *= (1.0 + R_ramp * t)
-        return R
-
-    def step(self, V_cmd, t, dt, R_step_time, R_step_ratio, R_ramp, I_dist):
-        V = float(np.clip(V_cmd, -self.v_max, self.v_max))
-        R = self.R_of_t(t, R_step_time, R_step_ratio, R_ramp)
-        self.I += ((V - R * self.I) / self.L) * dt
-        self.I += I_dist
-        return self.I, V, R
-
+from aitl.models.plant import RLPlant
+from aitl.sim.profiles import Piecewise, Profile, Pulse, SineBurst
 
 # ============================================================
 # PID
@@ -96,18 +75,12 @@ class KpTuner:
 # ============================================================
 # Profiles
 # ============================================================
-def Iref(t):
-    if t < 0.6: return 0.0
-    if t < 3.0: return 1.2
-    return 1.6
-
+IREF = Profile(Piecewise([0.6, 3.0], [1.2, 1.6]))
 
-def disturb(t):
-    if 2.0 <= t < 2.12:
-        return -0.05
-    if 3.6 <= t < 4.4:
-        return 0.006 * math.sin(2 * math.pi * 18 * t)
-    return 0.0
+DISTURB = Profile(
+    Pulse(2.0, 2.12, -0.05),
+    SineBurst(3.6, 4.4, 0.006, 18.0),
+)
 
 
 # ============================================================
@@ -117,18 +90,22 @@ def run_case(name, T, dt, plant_p, pid_n, pid_h, fsm_p, tuner_p):
     n = int(T / dt)
     t = np.linspace(0, T, n)
 
-    plant = RLPlant(plant_p["L_h"], plant_p["R0_ohm"], plant_p["v_max"])
+    plant = RLPlant(plant_p["L_h"], plant_p["R0_ohm"], plant_p["v_max"],
+                    method=plant_p.get("method", "euler"))
     pid = PID(*pid_n, dt, -plant_p["v_max"], plant_p["v_max"])
     fsm = ErrorFSM(dt=dt, **fsm_p)
     tuner = KpTuner(**tuner_p) if tuner_p else None
 
+    iref = IREF.sample(t)
+    i_dist = DISTURB.sample(t)
+
     I = np.zeros(n)
     e = np.zeros(n)
     kp = np.zeros(n)
     mode = np.zeros(n)
 
     for k in range(n):
-        e[k] = Iref(t[k]) - plant.I
+        e[k] = iref[k] - plant.I
         m = "normal" if name == "Fixed PID" else fsm.update(e[k])
 
         if m == "high":
@@ -144,7 +121,7 @@ def run_case(name, T, dt, plant_p, pid_n, pid_h, fsm_p, tuner_p):
                    plant_p["R_step_time"],
                    plant_p["R_step_ratio"],
                    plant_p["R_ramp_per_s"],
-                   disturb(t[k]))
+                   i_dist[k])
 
         I[k] = plant.I
         kp[k] = pid.kp
@@ -183,7 +160,7 @@ def main():
 
     for c, (name, _) in enumerate(cases):
         t, I, e, kp, mode = results[c]
-        axes[0, c].plot(t, [Iref(x) for x in t], "--")
+        axes[0, c].plot(t, IREF.sample(t), "--")
         axes[0, c].plot(t, I)
         axes[0, c].set_title(name)
 
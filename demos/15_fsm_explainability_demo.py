@@ -14,25 +14,13 @@ from __future__ import annotations
 import numpy as np
 import matplotlib.pyplot as plt
 import os
+import sys
 
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.append(ROOT)
 
-# ============================
-# Minimal plant (V -> I)
-# ============================
-class RLPlant:
-    def __init__(self, L, R, v_max):
-        self.L = L
-        self.R = R
-        self.v_max = v_max
-        self.I = 0.0
-
-    def reset(self):
-        self.I = 0.0
-
-    def step(self, V, dt):
-        V = float(np.clip(V, -self.v_max, self.v_max))
-        self.I += ((V - self.R * self.I) / self.L) * dt
-        return self.I
+from aitl.models.plant import RLPlant
+from aitl.sim.profiles import Piecewise, Profile, Pulse
 
 
 # ============================
@@ -87,19 +75,9 @@ class ExplainableFSM:
 # ============================
 # Scenario
 # ============================
-def Iref(t):
-    if t < 0.5:
-        return 0.0
-    elif t < 2.0:
-        return 1.0
-    else:
-        return 1.4
+IREF = Profile(Piecewise([0.5, 2.0], [1.0, 1.4]))
 
-
-def disturbance(t):
-    if 1.2 <= t < 1.35:
-        return -0.06
-    return 0.0
+DISTURBANCE = Profile(Pulse(1.2, 1.35, -0.06))
 
 
 # ============================
@@ -111,7 +89,7 @@ def main():
     n = int(T / dt)
     t = np.linspace(0, T, n)
 
-    plant = RLPlant(L=0.08, R=1.3, v_max=6.0)
+    plant = RLPlant(L_h=0.08, R0_ohm=1.3, v_max=6.0)
     pid_n = PID(kp=2.2, ki=10.0, dt=dt, u_lim=6.0)
     pid_h = PID(kp=3.8, ki=12.0, dt=dt, u_lim=6.0)
 
@@ -121,11 +99,14 @@ def main():
     e = np.zeros(n)
     mode = np.zeros(n)
 
+    iref = IREF.sample(t)
+    i_dist = DISTURBANCE.sample(t)
+
     plant.reset()
     fsm.reset()
 
     for k in range(n):
-        ref = Iref(t[k])
+        ref = iref[k]
         e[k] = ref - plant.I
 
         m = fsm.update(e[k], t[k])
@@ -136,8 +117,8 @@ def main():
             V = pid_n.update(e[k])
             mode[k] = 0.0
 
-        plant.step(V, dt)
-        plant.I += disturbance(t[k])
+        plant.step(V, t[k], dt)
+        plant.I += i_dist[k]
         I[k] = plant.I
 
     # ============================
@@ -155,7 +136,7 @@ def main():
     # ============================
     fig, ax = plt.subplots(3, 1, figsize=(9, 7), sharex=True)
 
-    ax[0].plot(t, [Iref(x) for x in t], "--", label="Iref")
+    ax[0].plot(t, iref, "--", label="Iref")
     ax[0].plot(t, I, label="I")
     ax[0].set_ylabel("I [A]")
     ax[0].legend()
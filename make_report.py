@@ -0,0 +1,97 @@
+"""
+make_report.py
+
+Regenerates every demo figure under data/ headlessly (Agg backend), in a
+process pool, plus a PDF copy of each PNG and data/manifest.json.
+Demos whose script, imported src/ modules and args are unchanged since
+the last run (and whose outputs are untouched) are skipped.
+
+Usage:
+    python make_report.py                     # rebuild stale figures
+    python make_report.py --force             # rebuild everything
+    python make_report.py --only 12_vi_current_control 13_aging_sweep
+    python make_report.py --list
+
+Exit status is 1 when any demo fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent
+sys.path.append(str(REPO / "src"))
+
+from aitl.sim.report import Job, build_report
+
+# Every job must exit 0 with its outputs written; 02-04 are also run end
+# to end by tests/test_demos.py.
+JOBS = [
+    Job("01_pid_step_response", "demos/01_pid_step_response.py",
+        outputs=["data/pid_step_response.png"]),
+    Job("02_fsm_mode_switch", "demos/02_fsm_mode_switch.py",
+        outputs=["data/fsm_transition_log.txt"]),
+    Job("03_hybrid_pid_fsm", "demos/03_hybrid_pid_fsm_demo.py",
+        outputs=["data/hybrid_response.png", "data/hybrid_states.csv"]),
+    Job("04_hybrid_fsm_llm", "demos/04_hybrid_fsm_llm_demo.py",
+        outputs=["data/fsm_llm_demo.png"]),
+    Job("05_aitl_full", "demos/05_aitl_full_demo.py",
+        args=["--out", "data/aitl_full_demo_ideal.png"],
+        outputs=["data/aitl_full_demo_ideal.png"]),
+    Job("06_friction_aging", "demos/06_pid_initial_vs_aitl_friction_aging_demo.py",
+        outputs=["data/pid_vs_aitl_friction_aging.png"]),
+    Job("07_reliability_metrics", "demos/07_reliability_metrics_dt_amp.py",
+        outputs=["data/metric_dt.png", "data/metric_amp_ratio.png"]),
+    Job("08_reliability_guard", "demos/08_reliability_fsm_dt_amp_guard.py",
+        outputs=["data/metric_dt_mean_fsm.png", "data/metric_amp_ratio_guard.png"]),
+    Job("09_reliability_cost", "demos/09_reliability_cost_tradeoff.py",
+        outputs=["data/metric_reliability_cost.png"]),
+    Job("12_vi_current_control", "demos/12_vi_current_control_sales_demo.py",
+        outputs=["data/12_vi_current_control_sales_demo.png"]),
+    # the report pool already spreads demos over the cores
+    Job("13_aging_sweep", "demos/13_aging_sweep_delta_t.py", args=["--workers", "1"],
+        outputs=["data/13_aging_sweep_delta_t.png"]),
+    Job("15_fsm_explainability", "demos/15_fsm_explainability_demo.py",
+        outputs=["data/15_fsm_explainability_demo.png"]),
+]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--workers", type=int, default=None,
+                    help="process pool size (default: all cores, 1 = serial)")
+    ap.add_argument("--force", action="store_true", help="ignore the manifest and rebuild all")
+    ap.add_argument("--only", nargs="*", help="job names to consider")
+    ap.add_argument("--manifest", type=Path, default=REPO / "data" / "manifest.json")
+    ap.add_argument("--list", action="store_true", help="print job names and exit")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for job in JOBS:
+            print(f"{job.name:26s} {job.script}")
+        return 0
+
+    jobs = [j for j in JOBS if not args.only or j.name in args.only]
+    unknown = set(args.only or ()) - {j.name for j in jobs}
+    if unknown:
+        ap.error(f"unknown job(s): {', '.join(sorted(unknown))}")
+
+    t0 = time.perf_counter()
+    results = build_report(jobs, root=REPO, manifest=args.manifest,
+                           workers=args.workers, force=args.force)
+
+    print(f"{'job':26s} {'status':8s} {'seconds':>8s}")
+    for name, r in results.items():
+        print(f"{name:26s} {r['status']:8s} {r['seconds']:8.2f}")
+        if r["status"] == "failed":
+            print("    " + r["error"].rstrip().replace("\n", "\n    "))
+    print(f"total {time.perf_counter() - t0:.2f} s -> {args.manifest}")
+    return int(any(r["status"] == "failed" for r in results.values()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
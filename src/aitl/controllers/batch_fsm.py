@@ -0,0 +1,78 @@
+import numpy as np
+
+from aitl.controllers.fsm_table import TransitionTable
+
+
+class BatchFSM:
+    """
+    N FSM instances sharing one compiled TransitionTable.
+
+    update_state() applies min_dwell and the first matching rule for every
+    instance in one vectorized pass, with the same semantics as
+    FSMController.update_state.
+    """
+
+    def __init__(self, table, n, initial_state):
+        self.table = table
+        self.n = int(n)
+        self.initial_state = initial_state
+        self.state = np.full(self.n, table.index[initial_state], dtype=np.intp)
+        self.last_transition_time = np.zeros(self.n)
+
+    @classmethod
+    def from_transitions(cls, transitions, n, initial_state, min_dwell=None):
+        table = TransitionTable.compile(transitions, min_dwell, states=[initial_state])
+        return cls(table, n, initial_state)
+
+    @classmethod
+    def from_controller(cls, fsm, n):
+        table = TransitionTable.compile(fsm.transitions, fsm.min_dwell,
+                                        states=list(fsm.states))
+        batch = cls(table, n, fsm.current_state)
+        batch.last_transition_time[:] = fsm.last_transition_time
+        return batch
+
+    def reset(self, idx=None):
+        sel = slice(None) if idx is None else idx
+        self.state[sel] = self.table.index[self.initial_state]
+        self.last_transition_time[sel] = 0.0
+
+    @property
+    def current_state(self):
+        return np.asarray(self.table.states, dtype=object)[self.state]
+
+    def _signal_matrix(self, observation):
+        tab = self.table
+        rows = []
+        for name in tab.signals:
+            if name in ("e", "abs_e"):
+                e = observation["e"] if isinstance(observation, dict) else observation
+                v = np.asarray(e, dtype=float)
+                v = np.abs(v) if name == "abs_e" else v
+            else:
+                v = np.asarray(observation[name], dtype=float)
+            rows.append(np.broadcast_to(v, (self.n,)))
+        return np.stack(rows)
+
+    def update_state(self, observation, t):
+        a = self.table.arrays()
+        if len(a["src"]) == 0:
+            return self.state
+
+        sig = self._signal_matrix(observation)              # (signals, n)
+        v = sig[a["signal"]]                                # (rules, n)
+        thr = a["threshold"][:, None]
+
+        hit = np.where(a["above"][:, None], v > thr, v < thr)
+        hit |= a["inclusive"][:, None] & (v == thr)
+        hit &= a["src"][:, None] == self.state[None, :]
+
+        dwell = t - self.last_transition_time
+        hit &= ~(dwell < a["min_dwell"][self.state])[None, :]
+
+        fired = hit.any(axis=0)
+        first = hit.argmax(axis=0)
+
+        self.state[fired] = a["dst"][first[fired]]
+        self.last_transition_time[fired] = np.broadcast_to(t, self.n)[fired]
+        return self.state
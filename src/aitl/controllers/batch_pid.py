@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class BatchPIDController:
+    """
+    N independent PID loops advanced in one NumPy call.
+
+    Same update as PIDController.step, applied element-wise:
+    kp/ki/kd/integral/prev_error are contiguous float64 arrays of length n.
+    """
+
+    def __init__(self, kp, ki, kd, dt=0.01, n=None):
+        if n is None:
+            n = max(np.size(kp), np.size(ki), np.size(kd), np.size(dt))
+        self.n = int(n)
+        self.kp = self._column(kp)
+        self.ki = self._column(ki)
+        self.kd = self._column(kd)
+        self.dt = self._column(dt)
+        self.integral = np.zeros(self.n)
+        self.prev_error = np.zeros(self.n)
+        self._tmp = np.empty(self.n)
+
+    @classmethod
+    def from_controllers(cls, pids):
+        """Build a batch from scalar PIDControllers (gains and state copied)."""
+        pids = list(pids)
+        batch = cls([p.kp for p in pids], [p.ki for p in pids],
+                    [p.kd for p in pids], [p.dt for p in pids])
+        batch.integral[:] = [p.integral for p in pids]
+        batch.prev_error[:] = [p.prev_error for p in pids]
+        return batch
+
+    def _column(self, v):
+        out = np.empty(self.n)
+        out[:] = v
+        return out
+
+    def __len__(self):
+        return self.n
+
+    def reset(self, idx=None):
+        if idx is None:
+            self.integral.fill(0.0)
+            self.prev_error.fill(0.0)
+        else:
+            self.integral[idx] = 0.0
+            self.prev_error[idx] = 0.0
+
+    def set_gains(self, kp=None, ki=None, kd=None, idx=None):
+        """Update gains for all loops, or only the loops selected by idx."""
+        sel = slice(None) if idx is None else idx
+        if kp is not None:
+            self.kp[sel] = kp
+        if ki is not None:
+            self.ki[sel] = ki
+        if kd is not None:
+            self.kd[sel] = kd
+
+    def step(self, error, t=None):
+        e = np.asarray(error, dtype=float)
+        tmp = self._tmp
+
+        u = self.kp * e
+
+        np.multiply(e, self.dt, out=tmp)
+        self.integral += tmp
+        np.multiply(self.ki, self.integral, out=tmp)
+        u += tmp
+
+        np.subtract(e, self.prev_error, out=tmp)
+        tmp *= self.kd
+        tmp /= self.dt
+        u += tmp
+
+        self.prev_error[:] = e
+        return u
@@ -0,0 +1,72 @@
+from aitl.core.base import ControllerBase
+from aitl.controllers.fsm_table import ThresholdRule
+
+
+def _rule(rule):
+    # 4 要素タプル ("abs_e", ">", 0.4, "high") は宣言的ルール、2 要素は (cond, next)
+    if isinstance(rule, (tuple, list)) and len(rule) == 4:
+        return ThresholdRule.coerce(rule)
+    return rule
+
+
+class FSMController(ControllerBase):
+    """
+    Mode switcher: transitions[state] lists (cond, next_state) pairs or
+    declarative 4-tuples / ThresholdRule; the first match wins.
+
+    min_dwell[state] holds a state for that many seconds after it was
+    entered, measured with the `t` passed to update_state/step. Callers
+    that leave `t` out (HybridController.step without t, demos 02-04)
+    turn the hold off: every matching rule fires immediately.
+    """
+
+    def __init__(self, states, transitions, initial_state, name="fsm"):
+        super().__init__(name)
+        self.states = states
+        self.transitions = {s: [_rule(r) for r in rules] for s, rules in transitions.items()}
+        self.current_state = initial_state
+
+        # 状態遷移したときの時刻を保持
+        self.last_transition_time = 0.0
+
+        # 各状態の最低滞在時間（秒）
+        self.min_dwell = {
+            "normal": 0.0,   # normal → high は即時OK
+            "high":   0.5,   # high に入ったら最低 0.5秒は維持する
+        }
+
+    def reset(self):
+        self.current_state = "normal"
+        self.last_transition_time = 0.0
+
+    def update_state(self, observation, t=None):
+        """Apply the first matching rule; t=None skips the min_dwell hold."""
+        current = self.current_state
+        rules = self.transitions.get(current, [])
+
+        # 最低滞在時間未満 → 状態遷移を許可しない（t が無ければ滞在時間は見ない）
+        if t is not None and t - self.last_transition_time < self.min_dwell.get(current, 0.0):
+            return
+
+        # 通常の条件判定（ThresholdRule は宣言的ルール、タプルは lambda）
+        for rule in rules:
+            if isinstance(rule, ThresholdRule):
+                hit, next_state = rule.matches(observation), rule.target
+            else:
+                cond, next_state = rule
+                hit = cond(observation)
+            if hit:
+                self.current_state = next_state
+                if t is not None:
+                    self.last_transition_time = t
+                break
+
+    def compute(self, observation, t=None):
+        ctrl = self.states[self.current_state]
+        if hasattr(ctrl, "step"):
+            return ctrl.step(observation, t)
+        return ctrl(observation, t)
+
+    def step(self, observation, t=None):
+        self.update_state(observation, t)
+        return self.compute(observation, t)
@@ -0,0 +1,116 @@
+"""
+Declarative FSM transition rules and their compiled index tables.
+
+A rule is a threshold test on one signal:
+    "abs_e" : |e|
+    "e"     : e
+    other   : observation[name] (named metric)
+compared with one of ">", ">=", "<", "<=" and a target state.
+"""
+
+OPS = (">", ">=", "<", "<=")
+
+
+class ThresholdRule:
+    def __init__(self, signal, op, threshold, target):
+        if op not in OPS:
+            raise ValueError(f"Unknown comparison: {op!r}")
+        self.signal = signal
+        self.op = op
+        self.threshold = float(threshold)
+        self.target = target
+
+    @classmethod
+    def coerce(cls, rule):
+        if isinstance(rule, cls):
+            return rule
+        if isinstance(rule, (tuple, list)) and len(rule) == 4:
+            return cls(*rule)
+        raise TypeError(f"Not a declarative rule: {rule!r}")
+
+    def __repr__(self):
+        return (f"ThresholdRule({self.signal!r}, {self.op!r}, "
+                f"{self.threshold!r}, {self.target!r})")
+
+    def value(self, observation):
+        if self.signal in ("e", "abs_e"):
+            e = observation["e"] if isinstance(observation, dict) else observation
+            return abs(e) if self.signal == "abs_e" else e
+        return observation[self.signal]
+
+    def matches(self, observation):
+        v = self.value(observation)
+        if self.op == ">":
+            return v > self.threshold
+        if self.op == ">=":
+            return v >= self.threshold
+        if self.op == "<":
+            return v < self.threshold
+        return v <= self.threshold
+
+
+def is_declarative(transitions):
+    return all(
+        isinstance(r, ThresholdRule) or (isinstance(r, (tuple, list)) and len(r) == 4)
+        for rules in transitions.values() for r in rules
+    )
+
+
+class TransitionTable:
+    """
+    Transitions flattened to parallel index arrays, grouped by source state
+    in rule priority order:
+
+        src[r], signal[r], above[r], inclusive[r], threshold[r], dst[r]
+
+    plus min_dwell[s] per state index.
+    """
+
+    def __init__(self, states, rules, min_dwell):
+        self.states = list(states)
+        self.index = {s: k for k, s in enumerate(self.states)}
+        self.signals = sorted({r.signal for _, r in rules})
+
+        self.src = [self.index[s] for s, _ in rules]
+        self.signal = [self.signals.index(r.signal) for _, r in rules]
+        self.above = [r.op in (">", ">=") for _, r in rules]
+        self.inclusive = [r.op in (">=", "<=") for _, r in rules]
+        self.threshold = [r.threshold for _, r in rules]
+        self.dst = [self.index[r.target] for _, r in rules]
+        self.min_dwell = [float(min_dwell.get(s, 0.0)) for s in self.states]
+        self._arrays = None
+
+    @classmethod
+    def compile(cls, transitions, min_dwell=None, states=None):
+        if not is_declarative(transitions):
+            raise ValueError("Lambda transitions cannot be compiled; "
+                             "use ThresholdRule for every rule")
+
+        names = list(states) if states is not None else []
+        rules = []
+        for s, group in transitions.items():
+            for r in group:
+                r = ThresholdRule.coerce(r)
+                rules.append((s, r))
+                for name in (s, r.target):
+                    if name not in names:
+                        names.append(name)
+        return cls(names, rules, min_dwell or {})
+
+    def __len__(self):
+        return len(self.src)
+
+    def arrays(self):
+        """NumPy views of the tables (built once, on first use)."""
+        if self._arrays is None:
+            import numpy as np
+            self._arrays = dict(
+                src=np.asarray(self.src, dtype=np.intp),
+                signal=np.asarray(self.signal, dtype=np.intp),
+                above=np.asarray(self.above, dtype=bool),
+                inclusive=np.asarray(self.inclusive, dtype=bool),
+                threshold=np.asarray(self.threshold, dtype=float),
+                dst=np.asarray(self.dst, dtype=np.intp),
+                min_dwell=np.asarray(self.min_dwell, dtype=float),
+            )
+        return self._arrays
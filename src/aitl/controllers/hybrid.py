@@ -0,0 +1,59 @@
+from aitl.core.base import ControllerBase
+from aitl.core.timing import StageTimer
+
+
+class HybridController(ControllerBase):
+    STAGES = ("fsm", "pid", "tuner")
+
+    def __init__(self, fsm, pid_map, name="hybrid", tuner=None, instrument=False):
+        super().__init__(name)
+        self.fsm = fsm
+        self.pid_map = pid_map
+        # optional gain tuner with adjust(state, kp, error) -> kp (e.g. AITLLLM)
+        self.tuner = tuner
+        self.timer = None
+        self.enable_timing(instrument)
+
+    def reset(self):
+        self.fsm.reset()
+        for p in self.pid_map.values():
+            p.reset()
+
+    def enable_timing(self, on=True):
+        """Per-stage timing; when off, step() pays one attribute check."""
+        self.timer = StageTimer(self.STAGES) if on else None
+
+    def stats(self):
+        """Per-stage latency stats (count, mean/min/max/p50/p90/p99 in us)."""
+        return {} if self.timer is None else self.timer.stats()
+
+    def step(self, observation, t=None):
+        if self.timer is not None:
+            return self._step_timed(observation, t)
+
+        self.fsm.update_state(observation, t)
+        s = self.fsm.current_state
+        pid = self.pid_map[s]
+        u = pid.step(observation, t)
+        if self.tuner is not None:
+            pid.kp = self.tuner.adjust(s, pid.kp, observation)
+        return u, s
+
+    def _step_timed(self, observation, t):
+        clock, timer = self.timer.clock, self.timer
+
+        t0 = clock()
+        self.fsm.update_state(observation, t)
+        s = self.fsm.current_state
+        t1 = clock()
+        pid = self.pid_map[s]
+        u = pid.step(observation, t)
+        t2 = clock()
+        timer.record("fsm", t1 - t0)
+        timer.record("pid", t2 - t1)
+
+        if self.tuner is not None:
+            t3 = clock()
+            pid.kp = self.tuner.adjust(s, pid.kp, observation)
+            timer.record("tuner", clock() - t3)
+        return u, s
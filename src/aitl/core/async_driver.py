@@ -0,0 +1,114 @@
+# src/aitl/core/async_driver.py
+import asyncio
+import heapq
+import inspect
+import time
+
+from aitl.core.timing import LatencyHistogram
+
+
+class _Loop:
+    __slots__ = ("controller", "name", "period_ns", "sense", "act",
+                 "ticks", "lateness", "last_output")
+
+    def __init__(self, controller, name, period_ns, sense, act):
+        self.controller = controller
+        self.name = name
+        self.period_ns = period_ns
+        self.sense = sense
+        self.act = act
+        self.ticks = 0
+        self.lateness = LatencyHistogram()
+        self.last_output = None
+
+
+class AsyncScheduler:
+    """
+    Runs many ControllerBase instances at their own rates on one asyncio
+    event loop.
+
+    A single control coroutine sleeps until the earliest release, then
+    steps every controller that is due (release <= now + batch_window) in
+    one synchronous batch. Background jobs added with every() run while the
+    control coroutine sleeps; plain (non-async) callables are sent to the
+    default executor so slow work like retuning or log flushing never
+    blocks a control step.
+    """
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self, batch_window_s=0.0):
+        self.batch_window_ns = int(round(batch_window_s * 1e9))
+        self.loops = []
+        self.jobs = []
+        self.batches = 0
+        self.batched_steps = 0
+
+    def add(self, controller, period_s, sense, act=None, name=None):
+        if period_s <= 0:
+            raise ValueError(f"period_s must be > 0, got {period_s}")
+        name = name or f"{controller.name}[{len(self.loops)}]"
+        self.loops.append(_Loop(controller, name, int(round(period_s * 1e9)), sense, act))
+        return name
+
+    def every(self, period_s, fn, *args):
+        """Run fn(*args) every period_s in the background (async or blocking)."""
+        self.jobs.append((period_s, fn, args))
+
+    async def _job(self, period_s, fn, args):
+        loop = asyncio.get_running_loop()
+        while True:
+            if inspect.iscoroutinefunction(fn):
+                await fn(*args)
+            else:
+                await loop.run_in_executor(None, fn, *args)
+            await asyncio.sleep(period_s)
+
+    async def run(self, duration_s):
+        clock = self.clock
+        start = clock()
+        end = start + int(round(duration_s * 1e9))
+
+        heap = [(start, k) for k in range(len(self.loops))]
+        heapq.heapify(heap)
+        jobs = [asyncio.create_task(self._job(*j)) for j in self.jobs]
+
+        try:
+            while heap and heap[0][0] < end:
+                delay = heap[0][0] - clock()
+                await asyncio.sleep(max(0.0, delay / 1e9))
+
+                horizon = clock() + self.batch_window_ns
+                due = []
+                while heap and heap[0][0] <= horizon and heap[0][0] < end:
+                    due.append(heapq.heappop(heap))
+
+                for release, k in due:
+                    lp = self.loops[k]
+                    t = (release - start) / 1e9
+                    lp.lateness.record(clock() - release)
+                    out = lp.controller.step(lp.sense(t), t)
+                    if lp.act is not None:
+                        lp.act(out, t)
+                    lp.last_output = out
+                    lp.ticks += 1
+                    heapq.heappush(heap, (release + lp.period_ns, k))
+
+                if due:
+                    self.batches += 1
+                    self.batched_steps += len(due)
+        finally:
+            for task in jobs:
+                task.cancel()
+            await asyncio.gather(*jobs, return_exceptions=True)
+        return self.stats()
+
+    def stats(self):
+        """Per-controller tick counts and lateness (us), plus batching."""
+        return dict(
+            batches=self.batches,
+            mean_batch=self.batched_steps / self.batches if self.batches else 0.0,
+            loops={lp.name: dict(period_us=lp.period_ns / 1e3, ticks=lp.ticks,
+                                 lateness=lp.lateness.summary())
+                   for lp in self.loops},
+        )
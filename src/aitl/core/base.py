@@ -1,4 +1,4 @@
-# src/core/base.py
+# src/aitl/core/base.py
 
 class ControllerBase:
     """Base class for all controllers."""
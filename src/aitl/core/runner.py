@@ -0,0 +1,109 @@
+# src/aitl/core/runner.py
+import time
+from array import array
+
+from aitl.core.timing import LatencyHistogram
+
+
+class FixedRateRunner:
+    """
+    Fixed-rate loop around ControllerBase.step.
+
+    Iteration k is released at start + k * period on a monotonic clock
+    (perf_counter_ns). The runner sleeps until `spin_s` before the release
+    and busy-waits the rest, then calls
+
+        obs = sense(t);  out = controller.step(obs, t);  act(out, t)
+
+    with logical time t = k * period. Per iteration it records
+        jitter  : wake-up time - release time
+        latency : sense + step + act duration
+        miss    : finished after the next release (deadline = one period)
+    The schedule is absolute, so a late iteration does not shift later
+    ones; with skip_missed=True, releases already in the past are dropped.
+    """
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self, controller, period_s, spin_s=0.0005, skip_missed=False,
+                 keep_samples=False):
+        if period_s <= 0:
+            raise ValueError(f"period_s must be > 0, got {period_s}")
+        self.controller = controller
+        self.period_ns = int(round(period_s * 1e9))
+        self.spin_ns = int(round(spin_s * 1e9))
+        self.skip_missed = skip_missed
+        self.keep_samples = keep_samples
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.latency = LatencyHistogram()
+        self.jitter = LatencyHistogram()
+        self.iterations = 0
+        self.misses = 0
+        self.skipped = 0
+        self.max_overrun_ns = 0
+        self.samples = dict(latency=array("q"), jitter=array("q"), miss=array("b"))
+
+    def _wait_until(self, release):
+        clock = self.clock
+        remaining = release - clock()
+        if remaining > self.spin_ns:
+            time.sleep((remaining - self.spin_ns) / 1e9)
+        while clock() < release:
+            pass
+
+    def run(self, n_steps, sense, act=None):
+        clock = self.clock
+        period = self.period_ns
+        start = clock() + period
+        k = 0
+        outputs = 0
+
+        while outputs < n_steps:
+            release = start + k * period
+            self._wait_until(release)
+            woke = clock()
+
+            t = k * period / 1e9
+            out = self.controller.step(sense(t), t)
+            if act is not None:
+                act(out, t)
+            done = clock()
+
+            jitter = woke - release
+            latency = done - woke
+            overrun = done - (release + period)
+            miss = overrun > 0
+
+            self.latency.record(latency)
+            self.jitter.record(jitter)
+            self.iterations += 1
+            if miss:
+                self.misses += 1
+                self.max_overrun_ns = max(self.max_overrun_ns, overrun)
+            if self.keep_samples:
+                self.samples["latency"].append(latency)
+                self.samples["jitter"].append(jitter)
+                self.samples["miss"].append(miss)
+
+            outputs += 1
+            k += 1
+            if self.skip_missed and miss:
+                behind = (done - start) // period + 1
+                self.skipped += behind - k
+                k = behind
+        return self.stats()
+
+    def stats(self):
+        n = self.iterations
+        return dict(
+            period_us=self.period_ns / 1e3,
+            iterations=n,
+            deadline_misses=self.misses,
+            miss_rate=self.misses / n if n else 0.0,
+            skipped_releases=self.skipped,
+            max_overrun_us=self.max_overrun_ns / 1e3,
+            latency=self.latency.summary(),
+            jitter=self.jitter.summary(),
+        )
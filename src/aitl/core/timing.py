@@ -0,0 +1,95 @@
+# src/aitl/core/timing.py
+import time
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-scale latency histogram (4 sub-buckets per power of two).
+
+    Recording is O(1) and never allocates; percentiles are estimated from
+    bucket midpoints (relative error < 12.5%).
+    """
+
+    SUB = 4
+
+    def __init__(self, n_bins=128):
+        self.bins = [0] * n_bins
+        self.reset()
+
+    def reset(self):
+        for k in range(len(self.bins)):
+            self.bins[k] = 0
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    def _index(self, ns):
+        if ns < 4:
+            return ns
+        b = ns.bit_length()
+        k = 4 + (b - 3) * 4 + ((ns >> (b - 3)) - 4)
+        return min(k, len(self.bins) - 1)
+
+    @staticmethod
+    def _edges(k):
+        if k < 4:
+            return k, k + 1
+        shift, sub = divmod(k - 4, 4)
+        return (4 + sub) << shift, (5 + sub) << shift
+
+    def record(self, ns):
+        ns = max(0, int(ns))
+        self.bins[self._index(ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if self.min_ns is None or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, q):
+        if self.count == 0:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for k, c in enumerate(self.bins):
+            seen += c
+            if c and seen >= rank:
+                lo, hi = self._edges(k)
+                mid = 0.5 * (lo + hi)
+                return float(min(max(mid, self.min_ns), self.max_ns))
+        return float(self.max_ns)
+
+    def summary(self):
+        """Stats in microseconds."""
+        if self.count == 0:
+            return dict(count=0)
+        return dict(
+            count=self.count,
+            mean_us=self.total_ns / self.count / 1e3,
+            min_us=self.min_ns / 1e3,
+            max_us=self.max_ns / 1e3,
+            p50_us=self.percentile(50) / 1e3,
+            p90_us=self.percentile(90) / 1e3,
+            p99_us=self.percentile(99) / 1e3,
+        )
+
+
+class StageTimer:
+    """One LatencyHistogram per named stage."""
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self, stages, n_bins=128):
+        self.hist = {s: LatencyHistogram(n_bins) for s in stages}
+
+    def record(self, stage, ns):
+        self.hist[stage].record(ns)
+
+    def reset(self):
+        for h in self.hist.values():
+            h.reset()
+
+    def stats(self):
+        return {s: h.summary() for s, h in self.hist.items()}
@@ -0,0 +1,130 @@
+# src/aitl/core/window.py
+from collections import deque
+
+
+class RollingWindow:
+    """
+    Sliding window over the last `size` samples with O(1) statistics.
+
+    push() is amortized O(1): the running sum is updated incrementally
+    (and recomputed exactly once per `size` pushes to stop drift),
+    count_above() keeps one counter per threshold given at construction,
+    and min/max use monotonic deques. No numpy, so it is cheap to use
+    inside per-step controller code.
+    """
+
+    def __init__(self, size, thresholds=()):
+        self.size = int(size)
+        if self.size < 1:
+            raise ValueError("size must be >= 1")
+        self.thresholds = tuple(float(th) for th in thresholds)
+        self.reset()
+
+    def reset(self):
+        self._buf = [0.0] * self.size
+        self._n = 0          # samples pushed so far
+        self._sum = 0.0
+        self._above = [0] * len(self.thresholds)
+        self._min = deque()  # (index, value), values increasing
+        self._max = deque()  # (index, value), values decreasing
+
+    def push(self, x):
+        x = float(x)
+        size, n = self.size, self._n
+        pos = n % size
+
+        if n >= size:
+            old = self._buf[pos]
+            self._sum -= old
+            for j, th in enumerate(self.thresholds):
+                if old >= th:
+                    self._above[j] -= 1
+            for dq in (self._min, self._max):
+                if dq[0][0] <= n - size:
+                    dq.popleft()
+
+        self._buf[pos] = x
+        self._n = n + 1
+        if pos == size - 1:
+            self._sum = sum(self._buf)
+        else:
+            self._sum += x
+        for j, th in enumerate(self.thresholds):
+            if x >= th:
+                self._above[j] += 1
+
+        while self._min and self._min[-1][1] >= x:
+            self._min.pop()
+        self._min.append((n, x))
+        while self._max and self._max[-1][1] <= x:
+            self._max.pop()
+        self._max.append((n, x))
+
+    def __len__(self):
+        return min(self._n, self.size)
+
+    @property
+    def full(self):
+        return self._n >= self.size
+
+    @property
+    def first(self):
+        """Oldest sample still in the window."""
+        if self._n == 0:
+            raise IndexError("empty window")
+        return self._buf[self._n % self.size] if self.full else self._buf[0]
+
+    @property
+    def last(self):
+        if self._n == 0:
+            raise IndexError("empty window")
+        return self._buf[(self._n - 1) % self.size]
+
+    @property
+    def mean(self):
+        return self._sum / len(self) if self._n else 0.0
+
+    @property
+    def min(self):
+        return self._min[0][1]
+
+    @property
+    def max(self):
+        return self._max[0][1]
+
+    def count_above(self, k=0):
+        """Samples in the window >= thresholds[k]."""
+        return self._above[k]
+
+    def fraction_above(self, k=0):
+        """count_above(k) over the full window size (empty slots count as below)."""
+        return self._above[k] / self.size
+
+    def get_state(self):
+        """Plain-data snapshot (JSON-serializable)."""
+        return {"n": self._n, "values": self.values(), "sum": self._sum}
+
+    def set_state(self, state):
+        self.reset()
+        n, values = int(state["n"]), [float(x) for x in state["values"]]
+        for i, x in enumerate(values, n - len(values)):
+            self._buf[i % self.size] = x
+            for j, th in enumerate(self.thresholds):
+                if x >= th:
+                    self._above[j] += 1
+            while self._min and self._min[-1][1] >= x:
+                self._min.pop()
+            self._min.append((i, x))
+            while self._max and self._max[-1][1] <= x:
+                self._max.pop()
+            self._max.append((i, x))
+        self._n = n
+        self._sum = float(state["sum"])
+
+    def values(self):
+        """Window contents, oldest first."""
+        n, size = self._n, self.size
+        if n < size:
+            return self._buf[:n]
+        pos = n % size
+        return self._buf[pos:] + self._buf[:pos]
@@ -1,7 +1,11 @@
+from aitl.core.window import RollingWindow
+
+
 class AITLLLM:
     """
     A-type LLM（適応ゲイン調整）。
     high のときだけ kp を増減する。
+    window を指定すると |error| の移動平均（直近 window サンプル）で判定する。
     """
 
     def __init__(
@@ -12,6 +16,7 @@ class AITLLLM:
         kp_step_down=0.02,
         kp_min=0.5,
         kp_max=3.0,
+        window=None,
     ):
         self.high_thresh = high_thresh
         self.low_thresh = low_thresh
@@ -19,13 +24,17 @@ class AITLLLM:
         self.kp_step_down = kp_step_down
         self.kp_min = kp_min
         self.kp_max = kp_max
+        self.e_win = RollingWindow(window) if window else None
 
     def adjust(self, state, kp, error):
+        e = abs(error)
+        if self.e_win is not None:
+            self.e_win.push(e)
+            e = self.e_win.mean
+
         if state != "high":
             return kp
 
-        e = abs(error)
-
         if e > self.high_thresh:
             kp += self.kp_step_up
         elif e < self.low_thresh:
@@ -0,0 +1,63 @@
+import math
+
+
+class RLPlant:
+    """
+    RL current dynamics (V -> I):  L dI/dt + R(t) I = V
+
+    method="euler" : forward Euler, I += (V - R I) / L * dt
+    method="zoh"   : exact discrete-time solution with V held over the step.
+                     R(t) is taken piecewise constant, split at R_step_time and
+                     evaluated at each sub-interval midpoint, so coarse dt stays
+                     stable and accurate.
+    """
+
+    METHODS = ("euler", "zoh")
+
+    def __init__(self, L_h, R0_ohm, v_max, method="euler"):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        self.L = float(L_h)
+        self.R0 = float(R0_ohm)
+        self.v_max = float(v_max)
+        self.method = method
+        self.I = 0.0
+
+    def reset(self, I0=0.0):
+        self.I = float(I0)
+
+    def get_state(self):
+        return {"I": float(self.I)}
+
+    def set_state(self, state):
+        self.I = float(state["I"])
+
+    def R_of_t(self, t, R_step_time=math.inf, R_step_ratio=0.0, R_ramp_per_s=0.0):
+        R = self.R0
+        if t >= R_step_time:
+            R = self.R0 * (1.0 + R_step_ratio)
+        R *= (1.0 + R_ramp_per_s * t)
+        return max(1e-6, R)
+
+    def _zoh(self, I, V, R, h):
+        a = math.exp(-R * h / self.L)
+        return V / R + (I - V / R) * a
+
+    def step(self, V_cmd, t, dt, R_step_time=math.inf, R_step_ratio=0.0,
+             R_ramp_per_s=0.0, I_disturb=0.0):
+        V = min(max(float(V_cmd), -self.v_max), self.v_max)
+
+        if self.method == "euler":
+            R = self.R_of_t(t, R_step_time, R_step_ratio, R_ramp_per_s)
+            self.I += ((V - R * self.I) / self.L) * dt
+        else:
+            # split the step at the R step so each piece has smooth R(t)
+            edges = [t, t + dt]
+            if t < R_step_time < t + dt:
+                edges.insert(1, R_step_time)
+            for t0, t1 in zip(edges[:-1], edges[1:]):
+                R = self.R_of_t(0.5 * (t0 + t1), R_step_time, R_step_ratio, R_ramp_per_s)
+                self.I = self._zoh(self.I, V, R, t1 - t0)
+
+        self.I += I_disturb
+        return self.I, V, R
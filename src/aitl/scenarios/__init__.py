@@ -0,0 +1,39 @@
+"""
+Scenario registry.
+
+Scenarios are importable modules loaded lazily by name, so demos and
+worker processes share one import instead of exec'ing demo scripts:
+
+    from aitl.scenarios import get
+    fa = get("friction_aging")
+    t, x = fa.simulate_response("PID", 1000, "aging")
+"""
+
+import importlib
+
+_REGISTRY = {
+    "friction_aging": "aitl.scenarios.friction_aging",   # demo 06
+    "rl_current":     "aitl.scenarios.rl_current",       # demo 13
+}
+
+
+def register(name, module):
+    """Register a scenario by dotted module path (imported on first get)."""
+    _REGISTRY[name] = module
+
+
+def names():
+    return sorted(_REGISTRY)
+
+
+def module_name(name):
+    """Dotted module path registered for `name` (None if unknown)."""
+    return _REGISTRY.get(name)
+
+
+def get(name):
+    try:
+        module = _REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"Unknown scenario: {name!r} (known: {', '.join(names())})") from None
+    return importlib.import_module(module)
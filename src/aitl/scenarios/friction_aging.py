@@ -0,0 +1,446 @@
+"""
+Friction-aging positioning scenario (from demo 06).
+
+Plant with Stribeck friction growing with `day`, saturating PID with
+anti-windup, and the AITL FSM + retuning loop. Importable so demos and
+worker processes share one copy instead of re-executing demo 06.
+"""
+
+import copy
+
+import numpy as np
+
+from aitl.core.window import RollingWindow
+from aitl.sim.guards import check_guards
+from aitl.sim.montecarlo import run_monte_carlo
+from aitl.sim.peaks import DtStream, find_peaks, min_dist_steps
+from aitl.sim.sweep import run_sweep_shared
+from aitl.sim.tracestore import TraceStore
+
+# =========================================================
+# Utility
+# =========================================================
+
+def sat(x, lo, hi):
+    return np.minimum(np.maximum(x, lo), hi)
+
+# =========================================================
+# Plant (friction aging ONLY)
+# =========================================================
+
+def plant_params(day):
+    Fc0, Fs0 = 0.25, 0.45
+    b0 = 0.35
+    Kt0 = 0.9
+
+    Fc = Fc0 * (1 + 0.0040 * day)
+    Fs = Fs0 * (1 + 0.0050 * day)
+
+    return dict(
+        m=1.0,
+        Fc=Fc,
+        Fs=Fs,
+        vs=0.02,
+        kv=0.04,
+        b=b0,
+        Kt=Kt0,
+        R=2.0
+    )
+
+def friction(v, p):
+    sgn = np.sign(v) if abs(v) > 1e-6 else 0.0
+    return (p["Fc"] + (p["Fs"] - p["Fc"])
+            * np.exp(-(abs(v)/p["vs"])**2)) * sgn + p["kv"] * v
+
+def friction_batch(v, p):
+    """Stribeck friction for an array of velocities (p entries may be arrays)."""
+    av = np.abs(v)
+    sgn = np.where(av > 1e-6, np.sign(v), 0.0)
+    return (p["Fc"] + (p["Fs"] - p["Fc"])
+            * np.exp(-(av/p["vs"])**2)) * sgn + p["kv"] * v
+
+# =========================================================
+# PID Controller
+# =========================================================
+
+class PID:
+    def __init__(self, kp, ki, kd, dt):
+        self.kp, self.ki, self.kd = kp, ki, kd
+        self.dt = dt
+        self.i = 0.0
+        self.e_prev = 0.0
+
+    def reset(self):
+        self.i = 0.0
+        self.e_prev = 0.0
+
+    def step(self, e, u_sat, u_unsat):
+        self.i += (e + (u_sat - u_unsat)) * self.dt
+        de = (e - self.e_prev) / self.dt
+        self.e_prev = e
+        return self.kp * e + self.ki * self.i + self.kd * de
+
+# =========================================================
+# AITL : FSM + Retuning
+# =========================================================
+
+def fsm_state(metrics):
+    if metrics["isat_rate"] > 0.15:
+        return "SATURATION"
+    if metrics["low_speed_error"] > 0.03:
+        return "FRICTION"
+    return "NORMAL"
+
+def retune_pid(base, state):
+    kp, ki, kd = base
+    if state == "FRICTION":
+        kp *= 1.6
+        ki *= 0.8
+        kd *= 1.2
+    elif state == "SATURATION":
+        ki *= 0.6
+        kd *= 1.3
+
+    return (
+        float(sat(kp, 10, 120)),
+        float(sat(ki, 1, 120)),
+        float(sat(kd, 0.0, 3.0))
+    )
+
+# Batched (one lane per day): integer state codes instead of names
+FSM_STATES = ("NORMAL", "FRICTION", "SATURATION")
+
+# per-state (kp, ki, kd) multipliers, same as retune_pid
+_RETUNE_GAIN = np.array([
+    [1.0, 1.0, 1.0],
+    [1.6, 0.8, 1.2],
+    [1.0, 0.6, 1.3],
+])
+
+def fsm_state_batch(isat_rate, low_speed_error):
+    """Vectorized fsm_state: index into FSM_STATES per lane."""
+    return np.where(isat_rate > 0.15, 2,
+                    np.where(low_speed_error > 0.03, 1, 0))
+
+def retune_pid_batch(base, states):
+    """Vectorized retune_pid: (kp, ki, kd) arrays for each lane's state."""
+    g = np.asarray(base, dtype=float) * _RETUNE_GAIN[states]
+    return sat(g[:, 0], 10, 120), sat(g[:, 1], 1, 120), sat(g[:, 2], 0.0, 3.0)
+
+# =========================================================
+# Simulation
+# =========================================================
+
+def simulate(day, controller_type,
+             base_gains=(25.0, 50.0, 0.3),
+             T=20.0, dt=0.001,
+             Vmax=12.0, Imax=6.0,
+             store=None, guards=(), params=None, buffer=None):
+    """
+    params: optional overrides for plant_params(day) entries (e.g. a
+    sampled Fc/Fs/kv/b for manufacturing spread).
+    store: optional directory. If given, t/x/I are streamed to a
+    memory-mapped TraceStore there and (t, x) are returned as np.memmap.
+    guards: abort predicates (sim.guards) fed e, x, v, V and I each step;
+    the first violation stops the run and its Rejected record is returned
+    instead of (t, x).
+    buffer: optional array of length int(T/dt) to write x into (e.g. a
+    shared-memory row); returned as x.
+    """
+
+    p = plant_params(day)
+    if params:
+        p.update(params)
+    pid = PID(*base_gains, dt)
+    pid.reset()
+
+    x, v = 0.0, 0.0
+    x_ref = 1.0
+
+    n = int(T / dt)
+    slow_N = int(0.1 / dt)
+
+    # last 500 |I| samples for the AITL saturation metric (O(1) per step)
+    win_N = 500
+    Is_win = RollingWindow(win_N, thresholds=(Imax - 1e-6,))
+
+    guards = [copy.deepcopy(g) for g in guards or ()]
+    for g in guards:
+        g.reset()
+    rejected = None
+
+    if store is None:
+        xs = np.zeros(n) if buffer is None else buffer
+    else:
+        out = TraceStore(store, {"t": "f8", "x": "f8", "I": "f8"},
+                         attrs=dict(day=day, controller=controller_type, dt=dt))
+
+    try:
+        for k in range(n):
+            e = x_ref - x
+
+            u_unsat = pid.kp*e + pid.ki*pid.i \
+                      + pid.kd*((e - pid.e_prev)/dt)
+
+            V_pre = sat(u_unsat, -Vmax, Vmax)
+            I_pre = sat(V_pre / p["R"], -Imax, Imax)
+
+            if controller_type == "AITL" and k > win_N and k % slow_N == 0:
+                metrics = {
+                    "isat_rate": Is_win.fraction_above(),
+                    "low_speed_error": abs(e) if abs(v) < 0.01 else 0.0
+                }
+                state = fsm_state(metrics)
+                pid.kp, pid.ki, pid.kd = retune_pid(base_gains, state)
+
+            u = pid.step(e, V_pre, u_unsat)
+            V = sat(u, -Vmax, Vmax)
+            I = sat(V / p["R"], -Imax, Imax)
+
+            a = (p["Kt"]*I - p["b"]*v - friction(v, p)) / p["m"]
+            v += a * dt
+            x += v * dt
+
+            Is_win.push(abs(I))
+            if store is None:
+                xs[k] = x
+            else:
+                out.append(t=k * dt, x=x, I=I)
+
+            if guards:
+                rejected = check_guards(guards, dict(e=e, x=x, v=v, V=V, I=I), k, k * dt)
+                if rejected is not None:
+                    break
+    finally:
+        if store is not None:
+            out.close()
+
+    if rejected is not None:
+        return rejected
+
+    if store is not None:
+        trace = TraceStore.open(store)
+        return trace["t"], trace["x"]
+
+    t = np.arange(n) * dt
+    return t, xs
+
+def simulate_batch(days, controller_type,
+                   base_gains=(25.0, 50.0, 0.3),
+                   T=20.0, dt=0.001,
+                   Vmax=12.0, Imax=6.0,
+                   sink=None, chunk=4096):
+    """
+    Run one lane per entry of `days` in lockstep.
+
+    Same loop as simulate(), with the plant, saturation, PID and (for
+    "AITL") the FSM/retuning applied per lane on arrays.
+
+    Returns (t, X) with X of shape (len(days), n); X[j] matches
+    simulate(days[j], controller_type, ...)[1].
+
+    sink: optional callable. If given, positions are handed over as
+    (len(days), <=chunk) blocks instead of being kept, and X is None.
+    """
+    days = np.atleast_1d(np.asarray(days, dtype=float))
+    L = len(days)
+
+    p = plant_params(days)
+    kp0, ki0, kd0 = base_gains
+    kp = np.full(L, float(kp0))
+    ki = np.full(L, float(ki0))
+    kd = np.full(L, float(kd0))
+    i_acc = np.zeros(L)
+    e_prev = np.zeros(L)
+
+    x = np.zeros(L)
+    v = np.zeros(L)
+    x_ref = 1.0
+
+    n = int(T / dt)
+    slow_N = int(0.1 / dt)
+
+    # per-lane count of saturated samples in the last 500, updated per step
+    win_N = 500
+    Imax_th = Imax - 1e-6
+    sat_flags = np.zeros((win_N, L), dtype=bool)
+    sat_count = np.zeros(L, dtype=np.int64)
+
+    X = np.empty((n if sink is None else min(n, chunk), L))
+    k0 = 0
+
+    for k in range(n):
+        e = x_ref - x
+
+        u_unsat = kp*e + ki*i_acc + kd*((e - e_prev)/dt)
+
+        V_pre = sat(u_unsat, -Vmax, Vmax)
+
+        if controller_type == "AITL" and k > win_N and k % slow_N == 0:
+            isat_rate = sat_count / win_N
+            low_speed_error = np.where(np.abs(v) < 0.01, np.abs(e), 0.0)
+            states = fsm_state_batch(isat_rate, low_speed_error)
+            kp, ki, kd = retune_pid_batch(base_gains, states)
+
+        i_acc += (e + (V_pre - u_unsat)) * dt
+        de = (e - e_prev) / dt
+        e_prev = e
+        u = kp * e + ki * i_acc + kd * de
+
+        V = sat(u, -Vmax, Vmax)
+        I = sat(V / p["R"], -Imax, Imax)
+
+        a = (p["Kt"]*I - p["b"]*v - friction_batch(v, p)) / p["m"]
+        v = v + a * dt
+        x = x + v * dt
+
+        flag = np.abs(I) >= Imax_th
+        slot = sat_flags[k % win_N]
+        sat_count += flag
+        sat_count -= slot
+        slot[:] = flag
+        if sink is None:
+            X[k] = x
+        else:
+            X[k - k0] = x
+            if k - k0 + 1 == len(X) or k == n - 1:
+                sink(X[:k - k0 + 1].T)
+                k0 = k + 1
+
+    t = np.arange(n) * dt
+    if sink is not None:
+        return t, None
+    return t, np.ascontiguousarray(X.T)
+
+# =========================================================
+# Δt
+# =========================================================
+
+def find_peaks_simple(t, x, min_dist_s=0.8):
+    return find_peaks(x, min_dist_steps(t, min_dist_s)).astype(int)
+
+def compute_dt(t, x_ref, x_cmp):
+    pr = find_peaks_simple(t, x_ref)
+    pc = find_peaks_simple(t, x_cmp)
+    n = min(len(pr), len(pc))
+    return t[pc[:n]] - t[pr[:n]]
+
+def dt_mean_by_day(days, controller_type, min_dist_s=0.8, chunk=4096,
+                   base_gains=(25.0, 50.0, 0.3), T=20.0, dt=0.001,
+                   Vmax=12.0, Imax=6.0):
+    """
+    Mean Δt of each aging day against the day-0 PID response.
+
+    Days run in lockstep and are scored online (DtStream), so only
+    `chunk` samples per day are ever held in memory. base_gains, T, dt,
+    Vmax and Imax apply to both the reference and the aged runs.
+    """
+    kw = dict(base_gains=base_gains, Vmax=Vmax, Imax=Imax)
+    t, x_ref = simulate(0, "PID", T=T, dt=dt, **kw)
+    ref_times = t[find_peaks_simple(t, x_ref, min_dist_s)]
+
+    days = np.atleast_1d(days)
+    stream = DtStream(ref_times, dt, min_dist_steps(t, min_dist_s), lanes=len(days))
+    simulate_batch(days, controller_type, T=T, dt=dt,
+                   sink=stream.push, chunk=chunk, **kw)
+    return stream.mean
+
+# =========================================================
+# External API (for demos/07,08,09...)
+# =========================================================
+def simulate_response(controller: str, aging_days: int, variant: str,
+                      T=20.0, dt=0.001, Vmax=12.0, Imax=6.0,
+                      base_gains=(25.0, 50.0, 0.3), store=None, guards=()):
+    """
+    Public wrapper for other demos.
+
+    controller: "PID" or "AITL"
+    variant   : "initial" or "aging"
+    store     : optional TraceStore directory (stream instead of RAM)
+    guards    : optional abort predicates; a violated one returns a
+                sim.guards.Rejected record instead of (t, x)
+    """
+    if variant == "initial":
+        day = 0
+    elif variant == "aging":
+        day = int(aging_days)
+    else:
+        raise ValueError(f"Unknown variant: {variant}")
+
+    if controller not in ("PID", "AITL"):
+        raise ValueError(f"Unknown controller: {controller}")
+
+    return simulate(day, controller,
+                    base_gains=base_gains, T=T, dt=dt, Vmax=Vmax, Imax=Imax,
+                    store=store, guards=guards)
+
+# =========================================================
+# Trace sweeps (shared memory, sim.sweep.run_sweep_shared)
+# =========================================================
+def simulate_into(out, day, controller, **kw):
+    """simulate() writing x into out["x"] and 1 (ok) / 2 (rejected) into out["status"]."""
+    r = simulate(day, controller, buffer=out["x"], **kw)
+    out["status"][()] = 1 if isinstance(r, tuple) else 2
+
+def sweep_responses(tasks, workers=None, progress=None):
+    """
+    Run simulate() tasks (dicts with day, controller and common T/dt) in
+    the process pool; positions land in one shared (tasks × n) matrix.
+    Returns (t, X, status). Score X with sim.peaks.dt_batch.
+    """
+    tasks = list(tasks)
+    T = {t.get("T", 20.0) for t in tasks}
+    dt = {t.get("dt", 0.001) for t in tasks}
+    if len(T) != 1 or len(dt) != 1:
+        raise ValueError("sweep_responses needs one T/dt for all tasks")
+    T, dt = T.pop(), dt.pop()
+    n = int(T / dt)
+
+    out = run_sweep_shared(simulate_into, tasks,
+                           {"x": ((n,), "f8"), "status": ((), "u1")},
+                           workers=workers, progress=progress)
+    return np.arange(n) * dt, out["x"], out["status"]
+
+# =========================================================
+# Monte Carlo over plant spread (sim.montecarlo)
+# =========================================================
+MC_OUTPUTS = ("delta_t", "amp_ratio")
+
+_baselines = {}
+
+def _baseline(T, dt, min_dist_s):
+    key = (T, dt, min_dist_s)
+    if key not in _baselines:
+        t, x = simulate(0, "PID", T=T, dt=dt)
+        _baselines[key] = (t, t[find_peaks_simple(t, x, min_dist_s)], np.ptp(x))
+    return _baselines[key]
+
+def evaluate(params, day, controller, T=20.0, dt=0.001, min_dist_s=0.8, guards=()):
+    """
+    Mean peak Δt and amplitude ratio of one sampled plant against the
+    nominal day-0 PID response (computed once per process).
+    """
+    t, ref_times, ref_amp = _baseline(T, dt, min_dist_s)
+    out = simulate(day, controller, T=T, dt=dt, params=params, guards=guards)
+    if not isinstance(out, tuple):
+        return out
+
+    _, x = out
+    pc = find_peaks_simple(t, x, min_dist_s)
+    n = min(len(ref_times), len(pc))
+    dt_mean = float(np.mean(t[pc[:n]] - ref_times[:n])) if n else float("nan")
+    return dt_mean, float(np.ptp(x) / ref_amp)
+
+def monte_carlo(cases, space, n, day=1000, seed=0, workers=None, chunk=64,
+                progress=None, **kw):
+    """
+    Δt / amplitude-ratio distributions per controller ("PID", "AITL")
+    over `space` ({plant_params key: distribution spec}) at aging `day`.
+    All cases see the same plant draws.
+    """
+    return {
+        c: run_monte_carlo(evaluate, space, n, MC_OUTPUTS,
+                           fixed=dict(day=day, controller=c, **kw), seed=seed,
+                           workers=workers, chunk=chunk, progress=progress)
+        for c in cases
+    }
@@ -0,0 +1,515 @@
+"""
+RL current-control aging scenario (from demo 13).
+
+Plant: L dI/dt + R(t) I = V, with Fixed PID / PID×FSM / AITL cases.
+simulate_metrics() returns (Δt settle time, max|e|) for one grid point;
+sweep_metrics() runs a grid, sharing the pre-aging prefix between points.
+"""
+
+from __future__ import annotations
+
+import copy
+
+import numpy as np
+
+from aitl.core.window import RollingWindow
+from aitl.models.plant import RLPlant
+from aitl.sim.guards import Rejected, check_guards, guard
+from aitl.sim.metrics import settle_time
+from aitl.sim.montecarlo import run_monte_carlo
+from aitl.sim.profiles import Piecewise, Profile, Pulse, SineBurst, profile
+from aitl.sim.sweep import run_forked_sweep, run_sweep_shared
+
+
+# ----------------------------
+# PID
+# ----------------------------
+class PID:
+    def __init__(self, kp: float, ki: float, kd: float, dt: float, u_min: float, u_max: float):
+        self.kp = float(kp)
+        self.ki = float(ki)
+        self.kd = float(kd)
+        self.dt = float(dt)
+        self.u_min = float(u_min)
+        self.u_max = float(u_max)
+        self.e_int = 0.0
+        self.e_prev = 0.0
+
+    def reset(self):
+        self.e_int = 0.0
+        self.e_prev = 0.0
+
+    def get_state(self) -> dict:
+        return dict(kp=self.kp, ki=self.ki, kd=self.kd,
+                    e_int=float(self.e_int), e_prev=float(self.e_prev))
+
+    def set_state(self, state: dict):
+        self.set_gains(state["kp"], state["ki"], state["kd"])
+        self.e_int = float(state["e_int"])
+        self.e_prev = float(state["e_prev"])
+
+    def set_gains(self, kp: float | None = None, ki: float | None = None, kd: float | None = None):
+        if kp is not None:
+            self.kp = float(kp)
+        if ki is not None:
+            self.ki = float(ki)
+        if kd is not None:
+            self.kd = float(kd)
+
+    def update(self, e: float) -> float:
+        self.e_int += e * self.dt
+        de = (e - self.e_prev) / self.dt
+        self.e_prev = e
+
+        u = self.kp * e + self.ki * self.e_int + self.kd * de
+        u_sat = float(np.clip(u, self.u_min, self.u_max))
+
+        # simple anti-windup
+        if u != u_sat and abs(self.ki) > 1e-12:
+            self.e_int *= 0.98
+
+        return u_sat
+
+
+# ----------------------------
+# FSM
+# ----------------------------
+class ErrorFSM:
+    def __init__(self, e_hi: float, e_lo: float, hold_s: float, dt: float):
+        self.e_hi = float(e_hi)
+        self.e_lo = float(e_lo)
+        self.hold_steps = int(max(0, round(hold_s / dt)))
+        self.mode = "normal"
+        self.hold_counter = 0
+
+    def reset(self):
+        self.mode = "normal"
+        self.hold_counter = 0
+
+    def get_state(self) -> dict:
+        return dict(mode=self.mode, hold_counter=self.hold_counter)
+
+    def set_state(self, state: dict):
+        self.mode = str(state["mode"])
+        self.hold_counter = int(state["hold_counter"])
+
+    def update(self, e: float) -> str:
+        ae = abs(e)
+
+        if self.hold_counter > 0:
+            self.hold_counter -= 1
+            return self.mode
+
+        if self.mode == "normal":
+            if ae >= self.e_hi:
+                self.mode = "high"
+                self.hold_counter = self.hold_steps
+        else:  # high
+            if ae <= self.e_lo:
+                self.mode = "normal"
+                self.hold_counter = self.hold_steps
+
+        return self.mode
+
+
+# ----------------------------
+# "LLM" tuner (deterministic heuristic)
+# ----------------------------
+class KpTuner:
+    def __init__(self, kp_min: float, kp_max: float, step: float,
+                 improve_window_s: float, min_improve_ratio: float, dt: float):
+        self.kp_min = float(kp_min)
+        self.kp_max = float(kp_max)
+        self.step = float(step)
+        self.win = int(max(3, round(improve_window_s / dt)))
+        self.min_improve_ratio = float(min_improve_ratio)
+        self.e_hist = RollingWindow(self.win)
+
+    def reset(self):
+        self.e_hist.reset()
+
+    def get_state(self) -> dict:
+        return dict(e_hist=self.e_hist.get_state())
+
+    def set_state(self, state: dict):
+        self.e_hist.set_state(state["e_hist"])
+
+    def propose_kp(self, kp_now: float, e: float, mode: str) -> float:
+        self.e_hist.push(abs(e))
+
+        # act only in HIGH mode with enough history
+        if mode != "high" or len(self.e_hist) < self.win:
+            return kp_now
+
+        e0 = self.e_hist.first
+        e1 = self.e_hist.last
+        ratio = (e1 / (e0 + 1e-9))
+
+        kp_new = kp_now
+        if ratio > self.min_improve_ratio:
+            kp_new = min(self.kp_max, kp_now + self.step)
+        elif ratio < 0.35:
+            kp_new = max(self.kp_min, kp_now - 0.5 * self.step)
+
+        return float(kp_new)
+
+
+# ----------------------------
+# Reference + disturbance
+# ----------------------------
+IREF_PROFILE = Profile(Piecewise([0.6, 3.0], [1.2, 1.6]))
+
+DISTURBANCE_PROFILE = Profile(
+    Pulse(2.0, 2.12, -0.05),
+    SineBurst(3.6, 4.4, 0.006, 18.0),
+    SineBurst(3.6, 4.4, 0.004, 7.0),
+)
+
+
+# ----------------------------
+# Core sim: return Δt and max|e|
+# ----------------------------
+class CurrentLoop:
+    """
+    One closed-loop run, steppable in segments.
+
+    snapshot() captures the complete loop state (plant current, PID
+    integrator/prev error, FSM mode/hold counter, tuner history, logged
+    error so far) as plain data; restore() resumes from it. Runs that
+    differ only in R_step_ratio are identical before R_step_time, so a
+    sweep can simulate that prefix once and fork (see simulate_prefix).
+
+    guards: abort predicates (sim.guards) fed e, V (command) and I each
+    step; the first violation stops the run and metrics() returns the
+    Rejected record.
+    e_log: optional zeroed array of length n to log the error into.
+    """
+
+    def __init__(
+        self,
+        case: str,
+        T: float,
+        dt: float,
+        plant_params: dict,
+        pid_normal: tuple[float, float, float],
+        pid_high: tuple[float, float, float],
+        fsm_params: dict,
+        tuner_params: dict | None,
+        ref_profile: Profile = IREF_PROFILE,
+        dist_profile: Profile = DISTURBANCE_PROFILE,
+        guards=(),
+        e_log: np.ndarray | None = None,
+    ):
+        self.case = case
+        self.dt = dt
+        self.plant_params = plant_params
+        self.pid_normal = pid_normal
+        self.pid_high = pid_high
+
+        self.n = int(round(T / dt))
+        self.t_arr = np.linspace(0.0, T, self.n, endpoint=False)
+
+        self.plant = RLPlant(plant_params["L_h"], plant_params["R0_ohm"], plant_params["v_max"],
+                             method=plant_params.get("method", "euler"))
+        self.plant.reset(0.0)
+
+        self.pid = PID(*pid_normal, dt=dt, u_min=-plant_params["v_max"], u_max=plant_params["v_max"])
+        self.fsm = ErrorFSM(dt=dt, **fsm_params)
+
+        self.tuner = KpTuner(dt=dt, **tuner_params) if tuner_params is not None else None
+        if self.tuner is not None:
+            self.tuner.reset()
+
+        self.iref = ref_profile.sample(self.t_arr)
+        self.i_dist = dist_profile.sample(self.t_arr)
+
+        self.guards = [copy.deepcopy(g) for g in guards or ()]
+        for g in self.guards:
+            g.reset()
+        self.rejected = None
+
+        # error trace; may be a preallocated (e.g. shared-memory) row
+        self.e_log = np.zeros(self.n) if e_log is None else e_log
+        self.max_abs_e = 0.0
+        self.k = 0
+
+    def fork_step(self) -> int:
+        """Steps that finish by R_step_time, i.e. independent of R_step_ratio."""
+        return int(np.searchsorted(self.t_arr + self.dt, self.plant_params["R_step_time"],
+                                   side="right"))
+
+    def run(self, k_end: int | None = None):
+        if self.rejected is not None:
+            return self
+        k_end = self.n if k_end is None else min(int(k_end), self.n)
+        plant, pid, fsm, tuner = self.plant, self.pid, self.fsm, self.tuner
+        pp = self.plant_params
+        iref, i_dist, t_arr, e_log = self.iref, self.i_dist, self.t_arr, self.e_log
+        max_abs_e = self.max_abs_e
+        guards = self.guards
+
+        for k in range(self.k, k_end):
+            t = t_arr[k]
+            e = iref[k] - plant.I
+            e_log[k] = e
+            max_abs_e = max(max_abs_e, abs(e))
+
+            if self.case == "Fixed PID":
+                mode = "normal"
+            else:
+                mode = fsm.update(e)
+
+            if mode == "high":
+                pid.set_gains(*self.pid_high)
+            else:
+                pid.set_gains(*self.pid_normal)
+
+            if tuner is not None:
+                pid.set_gains(kp=tuner.propose_kp(pid.kp, e, mode))
+
+            V_cmd = pid.update(e)
+            plant.step(
+                V_cmd, t, self.dt,
+                R_step_time=pp["R_step_time"],
+                R_step_ratio=pp["R_step_ratio"],
+                R_ramp_per_s=pp["R_ramp_per_s"],
+                I_disturb=i_dist[k],
+            )
+
+            if guards:
+                self.rejected = check_guards(guards, dict(e=e, V=V_cmd, I=plant.I), k, t)
+                if self.rejected is not None:
+                    k_end = k + 1
+                    break
+
+        self.max_abs_e = max_abs_e
+        self.k = max(self.k, k_end)
+        return self
+
+    def snapshot(self) -> dict:
+        return dict(
+            k=self.k,
+            max_abs_e=float(self.max_abs_e),
+            e_log=self.e_log[:self.k].tolist(),
+            plant=self.plant.get_state(),
+            pid=self.pid.get_state(),
+            fsm=self.fsm.get_state(),
+            tuner=None if self.tuner is None else self.tuner.get_state(),
+            guards=[g.get_state() for g in self.guards],
+        )
+
+    def restore(self, state: dict):
+        k = int(state["k"])
+        if k > self.n:
+            raise ValueError(f"checkpoint at step {k} is past the end of this run ({self.n})")
+        if (state["tuner"] is None) != (self.tuner is None):
+            raise ValueError("checkpoint and run disagree on whether a tuner is used")
+
+        self.k = k
+        self.max_abs_e = float(state["max_abs_e"])
+        self.e_log[:] = 0.0
+        self.e_log[:k] = state["e_log"]
+        self.plant.set_state(state["plant"])
+        self.pid.set_state(state["pid"])
+        self.fsm.set_state(state["fsm"])
+        if self.tuner is not None:
+            self.tuner.set_state(state["tuner"])
+        for g, gs in zip(self.guards, state.get("guards", ())):
+            g.set_state(gs)
+        return self
+
+    def metrics(self, settle_band_A: float = 0.02, settle_hold_s: float = 0.2,
+                disturb_t0: float = 2.0) -> tuple[float, float] | Rejected:
+        if self.rejected is not None:
+            return self.rejected
+        # Δt: after disturb_t0, first time |e|<band for hold duration
+        delta_t = float(settle_time(self.e_log, self.dt, settle_band_A, settle_hold_s, disturb_t0))
+        return delta_t, self.max_abs_e
+
+
+def simulate_metrics(
+    case: str,
+    T: float,
+    dt: float,
+    plant_params: dict,
+    pid_normal: tuple[float, float, float],
+    pid_high: tuple[float, float, float],
+    fsm_params: dict,
+    tuner_params: dict | None,
+    settle_band_A: float = 0.02,
+    settle_hold_s: float = 0.2,
+    disturb_t0: float = 2.0,
+    ref_profile: Profile = IREF_PROFILE,
+    dist_profile: Profile = DISTURBANCE_PROFILE,
+    checkpoint: dict | Rejected | None = None,
+    guards=(),
+) -> tuple[float, float] | Rejected:
+    """
+    checkpoint: optional CurrentLoop.snapshot() of a run with the same
+    settings up to its step (e.g. from simulate_prefix); the run resumes
+    from there instead of step 0. A Rejected prefix is returned as is.
+    guards: abort predicates; a violated one returns a Rejected record
+    (reason, step reached) instead of (Δt, max|e|).
+    """
+    if isinstance(checkpoint, Rejected):
+        return checkpoint
+
+    loop = CurrentLoop(case, T, dt, plant_params, pid_normal, pid_high,
+                       fsm_params, tuner_params, ref_profile, dist_profile, guards)
+    if checkpoint is not None:
+        if checkpoint["k"] > loop.fork_step():
+            raise ValueError("checkpoint extends past this run's R_step_time")
+        loop.restore(checkpoint)
+    loop.run()
+    return loop.metrics(settle_band_A, settle_hold_s, disturb_t0)
+
+
+# ----------------------------
+# Forked sweeps
+# ----------------------------
+_PREFIX_KEYS = ("case", "T", "dt", "pid_normal", "pid_high", "fsm_params", "tuner_params",
+                "ref_profile", "dist_profile", "guards")
+
+
+def simulate_prefix(**task) -> dict | Rejected:
+    """
+    Snapshot of `task` at the last step unaffected by R_step_ratio
+    (or the Rejected record if a guard already stopped the prefix).
+    """
+    loop = CurrentLoop(**{k: task[k] for k in _PREFIX_KEYS + ("plant_params",) if k in task})
+    loop.run(loop.fork_step())
+    return loop.rejected if loop.rejected is not None else loop.snapshot()
+
+
+def prefix_key(task: dict) -> str:
+    """Tasks with equal keys share everything before R_step_time."""
+    shared = {k: task.get(k) for k in _PREFIX_KEYS}
+    shared["plant_params"] = {k: v for k, v in task["plant_params"].items() if k != "R_step_ratio"}
+    return repr(sorted(shared.items()))
+
+
+def sweep_metrics(tasks, workers=None, progress=None) -> list[tuple[float, float] | Rejected]:
+    """
+    simulate_metrics over many tasks, simulating each shared pre-step
+    prefix once (one per prefix_key) and forking every task from it.
+    Results equal [simulate_metrics(**task) for task in tasks].
+    """
+    return run_forked_sweep(simulate_prefix, simulate_metrics, tasks, key=prefix_key,
+                            workers=workers, progress=progress)
+
+
+# ----------------------------
+# Trace sweeps (shared memory)
+# ----------------------------
+REASON_BYTES = 64       # guard reasons are short ("max|e| > 0.5"); longer ones are cut
+def simulate_into(out: dict, settle_band_A: float = 0.02, settle_hold_s: float = 0.2,
+                  disturb_t0: float = 2.0, **task):
+    """
+    simulate_metrics that logs e straight into out["e"] and writes
+    out["delta_t"], out["max_abs_e"], out["status"] (1 ok, 2 rejected) and
+    out["reason"] (the guard's reason, UTF-8, empty when ok).
+    """
+    loop = CurrentLoop(**task, e_log=out["e"])
+    loop.run()
+    r = loop.metrics(settle_band_A, settle_hold_s, disturb_t0)
+    if isinstance(r, Rejected):
+        out["delta_t"][()] = out["max_abs_e"][()] = np.nan
+        out["status"][()] = 2
+        out["reason"][()] = r.reason.encode()[:REASON_BYTES]
+    else:
+        out["delta_t"][()], out["max_abs_e"][()] = r
+        out["status"][()] = 1
+        out["reason"][()] = b""
+
+
+def sweep_traces(tasks, workers=None, progress=None) -> dict:
+    """
+    Run tasks (same T and dt) in the process pool with error traces and
+    metrics written into shared memory. Returns arrays "e" (tasks × n),
+    "delta_t", "max_abs_e", "status" and "reason" (bytes, see simulate_into).
+    """
+    tasks = list(tasks)
+    if not tasks:
+        raise ValueError("no tasks")
+    n = {int(round(t["T"] / t["dt"])) for t in tasks}
+    if len(n) != 1:
+        raise ValueError("sweep_traces needs one T/dt for all tasks")
+
+    outputs = {"e": ((n.pop(),), "f8"), "delta_t": ((), "f8"),
+               "max_abs_e": ((), "f8"), "status": ((), "u1"),
+               "reason": ((), f"S{REASON_BYTES}")}
+    return run_sweep_shared(simulate_into, tasks, outputs, workers=workers, progress=progress)
+
+
+# ----------------------------
+# Monte Carlo over plant spread
+# ----------------------------
+MC_OUTPUTS = ("delta_t", "max_abs_e")
+
+
+def evaluate(params: dict, **task) -> tuple[float, float] | Rejected:
+    """simulate_metrics(**task) with plant_params entries overridden by params."""
+    return simulate_metrics(**dict(task, plant_params=dict(task["plant_params"], **params)))
+
+
+def monte_carlo(tasks: dict, space: dict, n: int, seed: int = 0,
+                workers=None, chunk: int = 256, progress=None) -> dict:
+    """
+    Δt / max|e| distributions per controller case.
+
+    tasks: {case label: simulate_metrics kwargs}; space: {plant_params
+    key: distribution spec}. Every case sees the same n plant draws
+    (same seed), so cases are compared on identical plants.
+    """
+    return {
+        label: run_monte_carlo(evaluate, space, n, MC_OUTPUTS, fixed=task, seed=seed,
+                               workers=workers, chunk=chunk, progress=progress)
+        for label, task in tasks.items()
+    }
+
+
+# ----------------------------
+# Scenario files (aitl-sim)
+# ----------------------------
+# demo 13 settings; a scenario file overrides any subset of these
+DEFAULT_CONFIG = dict(
+    T=6.0,
+    dt=0.001,
+    cases=["Fixed PID", "PID×FSM", "AITL"],
+    plant=dict(L_h=0.08, R0_ohm=1.2, v_max=6.0,
+               R_step_time=2.4, R_step_ratio=0.0, R_ramp_per_s=0.03),
+    pid=dict(normal=[2.2, 12.0, 0.0], high=[3.6, 16.0, 0.0]),
+    fsm=dict(e_hi=0.18, e_lo=0.08, hold_s=0.18),
+    tuner=dict(kp_min=1.6, kp_max=7.0, step=0.25,
+               improve_window_s=0.18, min_improve_ratio=0.82),
+    reference=[dict(type="piecewise", breaks=[0.6, 3.0], values=[1.2, 1.6])],
+    disturbance=[dict(type="pulse", t0=2.0, t1=2.12, value=-0.05),
+                 dict(type="sine_burst", t0=3.6, t1=4.4, amplitude=0.006, freq_hz=18.0),
+                 dict(type="sine_burst", t0=3.6, t1=4.4, amplitude=0.004, freq_hz=7.0)],
+    metrics=dict(settle_band_A=0.02, settle_hold_s=0.2, disturb_t0=2.0),
+    guards=[],
+)
+
+# only the AITL case runs the Kp tuner
+TUNED_CASES = ("AITL",)
+
+
+def make_task(config: dict, case: str) -> dict:
+    """simulate_metrics kwargs for one case of a resolved scenario config."""
+    if case not in ("Fixed PID", "PID×FSM", "AITL"):
+        raise ValueError(f"Unknown case: {case!r}")
+    return dict(
+        case=case,
+        T=float(config["T"]),
+        dt=float(config["dt"]),
+        plant_params={k: (v if isinstance(v, str) else float(v))
+                      for k, v in config["plant"].items()},
+        pid_normal=tuple(float(g) for g in config["pid"]["normal"]),
+        pid_high=tuple(float(g) for g in config["pid"]["high"]),
+        fsm_params=dict(config["fsm"]),
+        tuner_params=dict(config["tuner"]) if case in TUNED_CASES else None,
+        ref_profile=profile(config["reference"]),
+        dist_profile=profile(config["disturbance"]),
+        guards=[guard(g) for g in config["guards"]],
+        **config["metrics"],
+    )
@@ -0,0 +1,249 @@
+"""
+Headless animation rendering straight to a video file or frame buffer.
+
+A figure is built once per worker by a picklable setup(**kwargs) that
+returns (fig, update); update(i) moves the animated artists for frame i
+and returns them. Everything else is rendered once into a background
+that is restored before each frame (blitting), so only the changed
+artists are redrawn. Frames go to a writer as RGB arrays; no
+intermediate PNGs are written.
+
+    render_animation(cursor_setup, 500, "data/aitl_full_demo.mp4",
+                     setup_kwargs=dict(...), fps=25, workers=4)
+
+Writers: .gif through Pillow, .mp4/.webm through an ffmpeg pipe
+(ffmpeg must be on PATH), both streaming frame by frame, or FrameBuffer
+for in-memory frames.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+from aitl.sim.shm import SharedArrays
+from aitl.sim.sweep import run_sweep
+
+
+# -----------------------------
+# Writers
+# -----------------------------
+class FrameBuffer:
+    """Keeps frames in memory; array() stacks them as (n, H, W, 3) uint8."""
+
+    def __init__(self):
+        self.frames = []
+
+    def write(self, frame):
+        self.frames.append(np.array(frame, dtype=np.uint8))
+
+    def array(self):
+        return np.stack(self.frames) if self.frames else np.empty((0, 0, 0, 3), np.uint8)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GifWriter:
+    """
+    Animated GIF via Pillow, streamed to disk: each frame is
+    palette-quantized (own local palette) and appended to the file as it
+    arrives, so memory does not grow with the number of frames.
+    """
+
+    def __init__(self, path, fps=25, loop=0):
+        from PIL import GifImagePlugin, Image
+        self._gif = GifImagePlugin
+        self._image = Image
+        self.path = Path(path)
+        self.duration = int(round(1000 / fps))
+        self.loop = loop
+        self.n_frames = 0
+        self._fp = None
+
+    def write(self, frame):
+        img = self._image.fromarray(np.asarray(frame, dtype=np.uint8), "RGB").quantize(colors=256)
+        if self._fp is None:
+            header, _ = self._gif.getheader(img, info=dict(loop=self.loop, duration=self.duration))
+            self._fp = open(self.path, "wb")
+            self._fp.write(b"".join(header))
+        for block in self._gif.getdata(img, duration=self.duration, include_color_table=True):
+            self._fp.write(block)
+        self.n_frames += 1
+
+    def close(self):
+        if self._fp is None:
+            return
+        self._fp.write(b";")            # GIF trailer
+        self._fp.close()
+        self._fp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FFmpegWriter:
+    """Streams raw RGB frames into ffmpeg's stdin (MP4/H.264 or WebM/VP9)."""
+
+    CODECS = {".mp4": ["-c:v", "libx264", "-pix_fmt", "yuv420p"],
+              ".webm": ["-c:v", "libvpx-vp9", "-pix_fmt", "yuv420p"]}
+
+    def __init__(self, path, fps=25, ffmpeg="ffmpeg", extra_args=()):
+        self.path = Path(path)
+        self.fps = fps
+        self.ffmpeg = shutil.which(ffmpeg)
+        if self.ffmpeg is None:
+            raise RuntimeError(f"{ffmpeg!r} not found on PATH (needed for {self.path.suffix})")
+        self.extra_args = list(extra_args)
+        self.proc = None
+
+    def _open(self, h, w):
+        cmd = [self.ffmpeg, "-y", "-loglevel", "error",
+               "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}", "-r", str(self.fps),
+               "-i", "-", *self.CODECS.get(self.path.suffix, []),
+               # yuv420p needs even dimensions
+               "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", *self.extra_args, str(self.path)]
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+    def write(self, frame):
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        if self.proc is None:
+            self._open(*frame.shape[:2])
+        self.proc.stdin.write(frame.tobytes())
+
+    def close(self):
+        if self.proc is None:
+            return
+        self.proc.stdin.close()
+        if self.proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed writing {self.path}")
+        self.proc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_writer(path, fps=25):
+    """Writer for `path` chosen by suffix (.gif, .mp4, .webm)."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".gif":
+        return GifWriter(path, fps)
+    if suffix in FFmpegWriter.CODECS:
+        return FFmpegWriter(path, fps)
+    raise ValueError(f"Unsupported animation format: {suffix!r}")
+
+
+# -----------------------------
+# Rendering
+# -----------------------------
+class BlitRenderer:
+    """
+    Renders frames of one figure on the Agg canvas with blitting.
+
+    Artists returned by update() are marked animated and left out of the
+    cached background; each frame restores the background and draws only
+    those artists.
+    """
+
+    def __init__(self, setup, setup_kwargs=None, first=0):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.fig, self.update = setup(**(setup_kwargs or {}))
+        self.canvas = FigureCanvasAgg(self.fig)
+        for a in self.update(first):
+            a.set_animated(True)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    @property
+    def shape(self):
+        w, h = self.canvas.get_width_height()
+        return h, w, 3
+
+    def frame(self, i, out=None):
+        self.canvas.restore_region(self.background)
+        for a in self.update(i):
+            if a.axes is not None:
+                a.axes.draw_artist(a)
+            else:
+                self.fig.draw_artist(a)
+        rgba = np.asarray(self.canvas.buffer_rgba())
+        if out is None:
+            return rgba[..., :3].copy()
+        out[...] = rgba[..., :3]
+        return out
+
+    def close(self):
+        import matplotlib.pyplot as plt
+        plt.close(self.fig)
+
+
+def _render_chunk(setup, setup_kwargs, handle, lo, hi, base):
+    r = BlitRenderer(setup, setup_kwargs, first=lo)
+    try:
+        with SharedArrays.attach(handle) as sa:
+            frames = sa["frames"]
+            for i in range(lo, hi):
+                r.frame(i, out=frames[i - base])
+    finally:
+        r.close()
+    return lo, hi
+
+
+def render_animation(setup, n_frames, out, setup_kwargs=None, fps=25,
+                     workers=1, chunk=50, progress=None):
+    """
+    Render frames 0..n_frames-1 of setup(**setup_kwargs) into `out`
+    (a path for open_writer, or any object with write(frame)/close()).
+
+    workers > 1 renders chunks of `chunk` frames in a process pool; each
+    wave of workers * chunk frames lands in shared memory and is written
+    in order. setup must be picklable (module-level) for workers > 1.
+    progress, if given, is called as progress(done_frames, n_frames).
+    """
+    writer = open_writer(out, fps) if isinstance(out, (str, Path)) else out
+    try:
+        if workers == 1:
+            r = BlitRenderer(setup, setup_kwargs)
+            try:
+                for i in range(n_frames):
+                    writer.write(r.frame(i))
+                    if progress is not None:
+                        progress(i + 1, n_frames)
+            finally:
+                r.close()
+            return writer
+
+        probe = BlitRenderer(setup, setup_kwargs)
+        shape = probe.shape
+        probe.close()
+
+        wave = max(1, int(workers) * int(chunk))
+        with SharedArrays({"frames": ((min(wave, n_frames),) + shape, "u1")}) as sa:
+            for base in range(0, n_frames, wave):
+                stop = min(base + wave, n_frames)
+                tasks = [dict(setup=setup, setup_kwargs=setup_kwargs, handle=sa.handle(),
+                              lo=lo, hi=min(lo + chunk, stop), base=base)
+                         for lo in range(base, stop, chunk)]
+                run_sweep(_render_chunk, tasks, workers=workers)
+                for j in range(stop - base):
+                    writer.write(sa["frames"][j])
+                if progress is not None:
+                    progress(stop, n_frames)
+    finally:
+        if isinstance(out, (str, Path)):
+            writer.close()
+    return writer
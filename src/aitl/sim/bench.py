@@ -0,0 +1,179 @@
+"""
+Benchmark harness: steps/sec, step latency and peak memory for a hot
+path at several problem sizes, with JSON baselines.
+
+A Case builds a workload for one size:
+    kind="step": make(size) -> (step_fn, n_steps); every call is timed
+                 individually (timer overhead subtracted) and reported as
+                 per-step percentiles p50_us / p90_us / p99_us.
+    kind="run" : make(size) -> (run_fn, n_steps); run_fn executes n_steps
+                 steps and is timed as a whole, `repeat` times. Single
+                 steps are not visible, so these report the mean step time
+                 of each run instead: its median over the runs (mean_us)
+                 and the max - min spread between runs (spread_us).
+"""
+
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+import numpy as np
+
+METRICS = {
+    "step": ("steps_per_s", "p50_us", "p90_us", "p99_us", "peak_kb"),
+    "run":  ("steps_per_s", "mean_us", "spread_us", "peak_kb"),
+}
+
+# direction in which a change is a regression
+HIGHER_IS_BETTER = {"steps_per_s"}
+
+# absolute changes below these are noise, whatever the ratio
+NOISE_FLOOR = {"peak_kb": 64.0}
+
+
+@dataclass
+class Case:
+    name: str
+    make: Callable
+    sizes: Sequence[int]
+    kind: str = "step"
+    repeat: int = 5
+
+
+def _timer_overhead_ns(n=2000):
+    clock = time.perf_counter_ns
+    samples = np.empty(n)
+    for k in range(n):
+        t0 = clock()
+        samples[k] = clock() - t0
+    return float(np.median(samples))
+
+
+def _time_steps(step, n):
+    clock = time.perf_counter_ns
+    lat = np.empty(n)
+    for k in range(n):
+        t0 = clock()
+        step()
+        lat[k] = clock() - t0
+    return lat
+
+
+def _peak_kb(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024.0
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case, size):
+    if case.kind == "step":
+        overhead = _timer_overhead_ns()
+        step, n = case.make(size)
+        _time_steps(step, min(n, 100))                      # warm-up
+
+        step, n = case.make(size)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            step()
+        elapsed = time.perf_counter() - t0
+
+        step, n = case.make(size)
+        lat_ns = np.maximum(_time_steps(step, n) - overhead, 0.0)
+
+        step, n = case.make(size)
+
+        def loop():
+            for _ in range(n):
+                step()
+        peak = _peak_kb(loop)
+        steps_per_s = n / elapsed
+    elif case.kind == "run":
+        run, n = case.make(size)
+        run()                                               # warm-up
+        run_ns = []
+        for _ in range(case.repeat):
+            run, n = case.make(size)
+            t0 = time.perf_counter_ns()
+            run()
+            run_ns.append(time.perf_counter_ns() - t0)
+        mean_ns = np.asarray(run_ns) / n
+
+        run, n = case.make(size)
+        peak = _peak_kb(run)
+        return dict(name=case.name, kind="run", size=int(size), steps=int(n),
+                    steps_per_s=float(n * case.repeat / (sum(run_ns) / 1e9)),
+                    mean_us=float(np.median(mean_ns) / 1e3),
+                    spread_us=float(np.ptp(mean_ns) / 1e3),
+                    peak_kb=float(peak))
+    else:
+        raise ValueError(f"Unknown case kind: {case.kind}")
+
+    p50, p90, p99 = np.percentile(lat_ns, [50, 90, 99]) / 1e3
+    return dict(name=case.name, kind="step", size=int(size), steps=int(n),
+                steps_per_s=float(steps_per_s),
+                p50_us=float(p50), p90_us=float(p90), p99_us=float(p99),
+                peak_kb=float(peak))
+
+
+def run_suite(cases, only=None, progress=print):
+    results = []
+    for case in cases:
+        if only and case.name not in only:
+            continue
+        for size in case.sizes:
+            r = measure(case, size)
+            results.append(r)
+            if progress is not None:
+                progress(format_result(r))
+    return results
+
+
+def format_result(r):
+    if r.get("kind", "step") == "run":
+        lat = f"mean={r['mean_us']:8.2f}us spread={r['spread_us']:8.2f}us (per-run means)"
+    else:
+        lat = f"p50={r['p50_us']:8.2f}us p90={r['p90_us']:8.2f}us p99={r['p99_us']:8.2f}us"
+    return (f"{r['name']:28s} size={r['size']:>8d}  {r['steps_per_s']:12.0f} steps/s  "
+            f"{lat}  peak={r['peak_kb']:10.1f} KiB")
+
+
+def save_baseline(results, path):
+    Path(path).write_text(json.dumps({"results": results}, indent=2))
+
+
+def load_baseline(path):
+    return json.loads(Path(path).read_text())["results"]
+
+
+def compare(results, baseline, threshold=0.10,
+            metrics=("steps_per_s", "p50_us", "mean_us", "peak_kb")):
+    """
+    Regressions worse than threshold (relative) against the baseline,
+    matched by (name, size); metrics a result does not report are
+    skipped. Returns a list of dicts.
+    """
+    base = {(b["name"], b["size"]): b for b in baseline}
+    out = []
+    for r in results:
+        b = base.get((r["name"], r["size"]))
+        if b is None:
+            continue
+        for m in metrics:
+            if m not in r or m not in b:
+                continue
+            old, new = b[m], r[m]
+            if old <= 0:
+                continue
+            change = (old - new) / old if m in HIGHER_IS_BETTER else (new - old) / old
+            if abs(new - old) < NOISE_FLOOR.get(m, 0.0):
+                continue
+            if change > threshold:
+                out.append(dict(name=r["name"], size=r["size"], metric=m,
+                                baseline=old, current=new, change=change))
+    return out
@@ -0,0 +1,150 @@
+"""
+Content-addressed on-disk cache for simulation results.
+
+The key is a SHA-256 over the simulator's source file and every repo
+module it imports (transitively, see sim.sources), the function name and
+its keyword arguments, so editing the simulator or anything it uses
+invalidates old entries automatically. Each entry is one compressed .npz
+holding the returned tuple of arrays; uniform time grids
+(arange(n) * dt) are stored as (dt, n) only. The cache directory is
+created on the first write. Entries are evicted least-recently-used once
+the cache exceeds max_bytes (hits refresh the file mtime).
+
+    cache = ResultCache(default_cache_dir() / "simulate_response")
+    t, x = cache.call(env["simulate_response"], controller="PID",
+                      aging_days=0, variant="initial")
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import sysconfig
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from aitl.sim.sources import imported_files
+
+
+def default_cache_dir():
+    """$AITL_CACHE_DIR, else ~/.cache/aitl-controller."""
+    env = os.environ.get("AITL_CACHE_DIR")
+    return Path(env) if env else Path.home() / ".cache" / "aitl-controller"
+
+
+def _search_path():
+    """sys.path minus the stdlib and site-packages: where repo modules live."""
+    skip = [Path(sysconfig.get_path(k)).resolve()
+            for k in ("stdlib", "platstdlib", "purelib", "platlib")]
+    dirs = [Path(p or ".").resolve() for p in sys.path]
+    return [d for d in dict.fromkeys(dirs)
+            if d.is_dir() and not any(d == s or d.is_relative_to(s) for s in skip)]
+
+
+def source_digest(fn):
+    """
+    Hash of the file that defines fn and every repo module it imports
+    (falls back to fn's own source).
+    """
+    try:
+        path = Path(inspect.getsourcefile(fn))
+        files = imported_files(path, [path.parent, *_search_path()])
+        h = hashlib.sha256()
+        for f in files:
+            h.update(f.name.encode())
+            h.update(hashlib.sha256(f.read_bytes()).digest())
+        return h.hexdigest()
+    except (TypeError, OSError):
+        return hashlib.sha256(inspect.getsource(fn).encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, root, max_bytes=512 * 2**20):
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._src = {}
+
+    def key(self, fn, params):
+        code = fn.__code__
+        if code not in self._src:
+            self._src[code] = source_digest(fn)
+        blob = json.dumps(
+            dict(src=self._src[code], fn=fn.__qualname__, params=params),
+            sort_keys=True, default=repr,
+        )
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def _path(self, key):
+        return self.root / key[:2] / f"{key}.npz"
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with np.load(path) as z:
+                out = []
+                for k in range(int(z["n_items"])):
+                    if f"{k}_dt" in z.files:
+                        out.append(np.arange(int(z[f"{k}_n"])) * float(z[f"{k}_dt"]))
+                    else:
+                        out.append(z[str(k)])
+        except (OSError, KeyError, ValueError):
+            return None
+        os.utime(path)
+        return tuple(out)
+
+    def put(self, key, arrays):
+        items = {"n_items": np.int64(len(arrays))}
+        for k, a in enumerate(arrays):
+            a = np.asarray(a)
+            if a.ndim == 1 and len(a) > 1 and a.dtype.kind == "f":
+                dt = a[1] - a[0]
+                if np.array_equal(a, np.arange(len(a)) * dt):
+                    items[f"{k}_dt"] = np.float64(dt)
+                    items[f"{k}_n"] = np.int64(len(a))
+                    continue
+            items[str(k)] = a
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **items)
+        os.replace(tmp, path)
+        self.evict()
+
+    def call(self, fn, **params):
+        """fn(**params) through the cache; fn must return a tuple of arrays."""
+        key = self.key(fn, params)
+        hit = self.get(key)
+        if hit is not None:
+            self.hits += 1
+            return hit
+        self.misses += 1
+        out = tuple(np.asarray(a) for a in fn(**params))
+        self.put(key, out)
+        return out
+
+    def entries(self):
+        return list(self.root.glob("*/*.npz"))
+
+    def size_bytes(self):
+        return sum(p.stat().st_size for p in self.entries())
+
+    def evict(self):
+        """Drop least-recently-used entries until under max_bytes."""
+        files = [(p.stat().st_mtime, p.stat().st_size, p) for p in self.entries()]
+        total = sum(s for _, s, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for p in self.entries():
+            p.unlink(missing_ok=True)
@@ -0,0 +1,234 @@
+"""
+aitl-sim: run a scenario file without editing demo code.
+
+A scenario file (JSON or TOML) overrides any part of the scenario's
+DEFAULT_CONFIG (plant, PID gain sets, FSM thresholds, tuner, reference
+and disturbance profiles, guards) and may declare sweep axes as dotted
+paths into the config:
+
+    scenario = "rl_current"
+    cases = ["PID×FSM", "AITL"]
+
+    [plant]
+    R_ramp_per_s = 0.05
+
+    [sweep]
+    "plant.R_step_ratio" = {start = 0.0, stop = 1.2, num = 13}
+    "fsm.e_hi" = [0.12, 0.18]
+
+Every grid point (axes in file order, row-major) runs once per case.
+Results go to --out as columns: metrics.csv and metrics.npz (one row per
+run), plus traces.npz (t and the error trace of every run) with --traces.
+
+    aitl-sim demos/13_aging_sweep.toml --workers 8 --out runs/aging
+"""
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import sys
+import time
+from pathlib import Path
+
+from aitl.scenarios import get as get_scenario
+
+
+# -----------------------------
+# Scenario files
+# -----------------------------
+def load_config(path):
+    path = Path(path)
+    if path.suffix.lower() == ".toml":
+        try:
+            import tomllib
+        except ImportError:             # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(f"{path}: reading TOML on Python < 3.11 needs tomli "
+                                 "(pip install tomli), or use a .json scenario") from None
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def merge(base, override):
+    """Recursive dict update; lists and scalars in override replace base."""
+    out = copy.deepcopy(base)
+    for k, v in override.items():
+        if isinstance(v, dict) and isinstance(out.get(k), dict):
+            out[k] = merge(out[k], v)
+        else:
+            out[k] = copy.deepcopy(v)
+    return out
+
+
+def set_path(config, path, value):
+    """config["a"]["b"][0] = value for path "a.b.0"."""
+    *parents, last = path.split(".")
+    node = config
+    for key in parents:
+        node = node[int(key)] if isinstance(node, list) else node[key]
+    if isinstance(node, list):
+        node[int(last)] = value
+    elif last in node:
+        node[last] = value
+    else:
+        raise KeyError(f"sweep axis {path!r} does not name a config entry")
+
+
+def axis_values(spec):
+    """A list of values, or {"start", "stop", "num"} (inclusive linspace)."""
+    if isinstance(spec, dict):
+        import numpy as np
+        return np.linspace(float(spec["start"]), float(spec["stop"]), int(spec["num"])).tolist()
+    return list(spec)
+
+
+def expand(config):
+    """[(point, config)] for every sweep grid point; point maps axis -> value."""
+    axes = {name: axis_values(spec) for name, spec in config.get("sweep", {}).items()}
+    runs = []
+    for values in itertools.product(*axes.values()):
+        point = dict(zip(axes, values))
+        cfg = copy.deepcopy(config)
+        for name, v in point.items():
+            set_path(cfg, name, v)
+        runs.append((point, cfg))
+    return runs
+
+
+# -----------------------------
+# Output
+# -----------------------------
+def write_metrics(out, columns):
+    """metrics.csv and metrics.npz from equal-length columns."""
+    import numpy as np
+
+    names = list(columns)
+    n = len(columns[names[0]]) if names else 0
+    with open(out / "metrics.csv", "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(names)
+        for i in range(n):
+            w.writerow([columns[k][i] for k in names])
+    np.savez(out / "metrics.npz", **{k: np.asarray(v) for k, v in columns.items()})
+
+
+class Progress:
+    """progress(done, total) callback that rewrites one stderr line."""
+
+    def __init__(self, stream=sys.stderr, every=0.2):
+        self.stream = stream
+        self.every = every
+        self.t0 = time.perf_counter()
+        self._last = 0.0
+
+    def __call__(self, done, total):
+        now = time.perf_counter() - self.t0
+        if done < total and now - self._last < self.every:
+            return
+        self._last = now
+        eta = now / done * (total - done) if done else 0.0
+        self.stream.write(f"\r[{done:>{len(str(total))}}/{total}] {done / total:6.1%}  "
+                          f"{now:7.1f} s elapsed  {eta:7.1f} s left")
+        if done == total:
+            self.stream.write("\n")
+        self.stream.flush()
+
+
+# -----------------------------
+# Run
+# -----------------------------
+def resolve(config):
+    """(scenario module, config merged over its DEFAULT_CONFIG)."""
+    name = config.get("scenario", "rl_current")
+    mod = get_scenario(name)
+    if not hasattr(mod, "DEFAULT_CONFIG"):
+        raise ValueError(f"scenario {name!r} cannot be configured from a file")
+    return mod, merge(mod.DEFAULT_CONFIG, dict(config, scenario=name))
+
+
+def run(config, workers=None, traces=False, progress=None):
+    """
+    Run every (grid point, case) of a scenario config.
+
+    Returns (columns, trace) where columns holds one entry per run (axis
+    values, case, delta_t, max_abs_e, status, reason) and trace is
+    {"t", "e"} with traces=True, else None.
+    """
+    import numpy as np
+
+    mod, config = resolve(config)
+
+    points, tasks = [], []
+    for point, cfg in expand(config):
+        for case in cfg["cases"]:
+            points.append(dict(point, case=case))
+            tasks.append(mod.make_task(cfg, case))
+    if not tasks:
+        raise ValueError("scenario has no runs (empty cases or sweep axis)")
+
+    columns = {k: [p[k] for p in points] for k in points[0]}
+    trace = None
+    if traces:
+        r = mod.sweep_traces(tasks, workers=workers, progress=progress)
+        n = r["e"].shape[1]
+        trace = {"t": np.arange(n) * tasks[0]["dt"], "e": r["e"]}
+        columns.update(delta_t=r["delta_t"].tolist(), max_abs_e=r["max_abs_e"].tolist(),
+                       status=["ok" if s == 1 else "rejected" for s in r["status"]],
+                       reason=[b.decode("utf-8", "replace") for b in r["reason"]])
+    else:
+        results = mod.sweep_metrics(tasks, workers=workers, progress=progress)
+        rejected = [getattr(r, "rejected", False) for r in results]
+        columns.update(
+            delta_t=[float("nan") if rej else r[0] for r, rej in zip(results, rejected)],
+            max_abs_e=[float("nan") if rej else r[1] for r, rej in zip(results, rejected)],
+            status=["rejected" if rej else "ok" for rej in rejected],
+            reason=[r.reason if rej else "" for r, rej in zip(results, rejected)],
+        )
+    return columns, trace
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="aitl-sim", description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("scenario", type=Path, help="scenario file (.json or .toml)")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="process pool size (default: all cores, 1 = serial)")
+    ap.add_argument("--out", type=Path, default=None,
+                    help="output directory (default: runs/<scenario file stem>)")
+    ap.add_argument("--traces", action="store_true", help="also write error traces")
+    ap.add_argument("--quiet", action="store_true", help="no progress line")
+    args = ap.parse_args(argv)
+
+    try:
+        _, config = resolve(load_config(args.scenario))
+        out = args.out or Path("runs") / args.scenario.stem
+        out.mkdir(parents=True, exist_ok=True)
+
+        t0 = time.perf_counter()
+        columns, trace = run(config, workers=args.workers, traces=args.traces,
+                             progress=None if args.quiet else Progress())
+        elapsed = time.perf_counter() - t0
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        ap.error(str(e))
+
+    write_metrics(out, columns)
+    if trace is not None:
+        import numpy as np
+        np.savez(out / "traces.npz", **trace)
+    (out / "scenario.json").write_text(json.dumps(config, indent=2, ensure_ascii=False) + "\n",
+                                       encoding="utf-8")
+
+    n = len(columns["status"])
+    n_rej = columns["status"].count("rejected")
+    print(f"{n} runs ({n_rej} rejected) in {elapsed:.2f} s -> {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
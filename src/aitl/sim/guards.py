@@ -0,0 +1,161 @@
+"""
+Abort predicates (guards) for early termination of simulations.
+
+A guard sees one sample per step (a dict of named signals) and reports
+when its limit is violated; the simulation then stops and returns a
+Rejected record instead of its normal result, so sweeps and tuning
+searches can prune bad candidates without running the full horizon.
+"""
+
+from dataclasses import dataclass
+
+from aitl.core.window import RollingWindow
+
+
+@dataclass(frozen=True)
+class Rejected:
+    """Run stopped by a guard at `step` (time `t`); `value` tripped `reason`."""
+    reason: str
+    step: int
+    t: float
+    value: float
+
+    rejected = True
+
+
+def is_rejected(result):
+    return isinstance(result, Rejected)
+
+
+class MaxAbs:
+    """Violated when |signal| > limit."""
+
+    def __init__(self, signal, limit):
+        self.signal = signal
+        self.limit = float(limit)
+        self.reset()
+
+    def __repr__(self):
+        return f"MaxAbs({self.signal!r}, {self.limit!r})"
+
+    def reset(self):
+        self.value = 0.0
+
+    def get_state(self):
+        return {}
+
+    def set_state(self, state):
+        pass
+
+    @property
+    def reason(self):
+        return f"max|{self.signal}| > {self.limit:g}"
+
+    def update(self, sample):
+        self.value = abs(sample[self.signal])
+        return self.value > self.limit
+
+
+class RateAbove:
+    """
+    Violated when more than `rate` of the last `window` samples have
+    |signal| >= level (e.g. saturation rate of the command).
+    """
+
+    def __init__(self, signal, level, rate, window):
+        self.signal = signal
+        self.level = float(level)
+        self.rate = float(rate)
+        self.win = RollingWindow(window, thresholds=(self.level,))
+        self.reset()
+
+    def __repr__(self):
+        return f"RateAbove({self.signal!r}, {self.level!r}, {self.rate!r}, {self.win.size!r})"
+
+    def reset(self):
+        self.win.reset()
+        self.value = 0.0
+
+    def get_state(self):
+        return self.win.get_state()
+
+    def set_state(self, state):
+        self.win.set_state(state)
+
+    @property
+    def reason(self):
+        return f"|{self.signal}| >= {self.level:g} on > {self.rate:.0%} of {self.win.size} samples"
+
+    def update(self, sample):
+        self.win.push(abs(sample[self.signal]))
+        if not self.win.full:
+            return False
+        self.value = self.win.fraction_above()
+        return self.value > self.rate
+
+
+class RangeBelow:
+    """
+    Violated when the peak-to-peak of signal over the last `window`
+    samples falls below min_range (amplitude collapse), checked once
+    `after` samples have been seen.
+    """
+
+    def __init__(self, signal, min_range, window, after=0):
+        self.signal = signal
+        self.min_range = float(min_range)
+        self.after = int(after)
+        self.win = RollingWindow(window)
+        self.reset()
+
+    def __repr__(self):
+        return (f"RangeBelow({self.signal!r}, {self.min_range!r}, "
+                f"{self.win.size!r}, after={self.after!r})")
+
+    def reset(self):
+        self.win.reset()
+        self.n = 0
+        self.value = 0.0
+
+    def get_state(self):
+        return {"n": self.n, "win": self.win.get_state()}
+
+    def set_state(self, state):
+        self.n = int(state["n"])
+        self.win.set_state(state["win"])
+
+    @property
+    def reason(self):
+        return f"{self.signal} range < {self.min_range:g} over {self.win.size} samples"
+
+    def update(self, sample):
+        self.win.push(sample[self.signal])
+        self.n += 1
+        if self.n < self.after or not self.win.full:
+            return False
+        self.value = self.win.max - self.win.min
+        return self.value < self.min_range
+
+
+GUARDS = {"max_abs": MaxAbs, "rate_above": RateAbove, "range_below": RangeBelow}
+
+
+def guard(spec):
+    """Build a guard from a spec like {"type": "max_abs", "signal": "e", "limit": 0.5}."""
+    if not isinstance(spec, dict):
+        return spec
+    kw = dict(spec)
+    kind = kw.pop("type")
+    try:
+        cls = GUARDS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown guard: {kind!r}") from None
+    return cls(**kw)
+
+
+def check_guards(guards, sample, step, t):
+    """Update every guard with this sample; Rejected for the first violated one."""
+    for g in guards:
+        if g.update(sample):
+            return Rejected(g.reason, int(step), float(t), float(g.value))
+    return None
@@ -0,0 +1,55 @@
+"""
+Trace metrics computed in linear time on 1-D traces or 2-D batches
+(one trace per row, time along the last axis).
+"""
+
+import numpy as np
+
+
+def first_held_index(mask, hold_steps, start=0):
+    """
+    First index i >= start where mask[i:i + hold_steps] is all True.
+
+    Candidates stop at n - hold_steps - 1, matching the original
+    ``for i in range(start, n - hold_steps)`` scan. Uses one cumulative
+    sum over the trace, so cost is O(n) regardless of hold_steps.
+    Returns -1 (per row) when no such index exists.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    hold_steps = int(hold_steps)
+    n = mask.shape[-1]
+    stop = n - hold_steps
+
+    if stop <= start:
+        return np.full(mask.shape[:-1], -1, dtype=np.intp)[()]
+
+    c = np.zeros(mask.shape[:-1] + (n + 1,), dtype=np.intp)
+    np.cumsum(mask, axis=-1, out=c[..., 1:])
+
+    window = c[..., start + hold_steps:stop + hold_steps] - c[..., start:stop]
+    held = window == hold_steps
+
+    found = held.any(axis=-1)
+    idx = np.where(found, held.argmax(axis=-1) + start, -1)
+    return idx[()]
+
+
+def settle_index(e, band, hold_steps, start=0):
+    """First index after start where |e| < band holds for hold_steps samples."""
+    return first_held_index(np.abs(e) < band, hold_steps, start)
+
+
+def settle_time(e, dt, band, hold_s, t0):
+    """
+    Δt from t0 until |e| first stays inside band for hold_s seconds.
+    NaN where the trace never settles.
+    """
+    start = int(round(t0 / dt))
+    hold_steps = int(max(1, round(hold_s / dt)))
+    idx = np.asarray(settle_index(e, band, hold_steps, start))
+    out = np.where(idx >= 0, (idx * dt) - t0, np.nan)
+    return out[()] if out.ndim == 0 else out
+
+
+def max_abs(e):
+    return np.max(np.abs(e), axis=-1)
@@ -0,0 +1,192 @@
+"""
+Monte Carlo over plant-parameter distributions.
+
+Each sample draws plant parameters from configurable distributions and
+runs one evaluation fn(params, **fixed) -> tuple of metrics (or a
+sim.guards.Rejected record). Samples are split into chunks; every chunk
+gets its own RNG stream spawned from one SeedSequence, so results are
+reproducible and independent of the number of workers. Workers write
+parameters and metrics straight into shared-memory arrays (sim.shm) and
+hand back only their index range.
+
+    space = {"L_h": Normal(0.08, 0.004), "R0_ohm": Uniform(1.1, 1.3)}
+    mc = run_monte_carlo(rl_current.evaluate, space, 100_000,
+                         outputs=("delta_t", "max_abs_e"), fixed=task, seed=1)
+    mc.summary()
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from aitl.sim.guards import is_rejected
+from aitl.sim.shm import SharedArrays
+from aitl.sim.sweep import run_sweep
+
+
+# -----------------------------
+# Distributions
+# -----------------------------
+@dataclass(frozen=True)
+class Fixed:
+    value: float
+
+    def sample(self, rng, size):
+        return np.full(size, float(self.value))
+
+
+@dataclass(frozen=True)
+class Uniform:
+    lo: float
+    hi: float
+
+    def sample(self, rng, size):
+        return rng.uniform(self.lo, self.hi, size)
+
+
+@dataclass(frozen=True)
+class Normal:
+    """Gaussian, clipped to [lo, hi] when given."""
+    mean: float
+    std: float
+    lo: float = -np.inf
+    hi: float = np.inf
+
+    def sample(self, rng, size):
+        return np.clip(rng.normal(self.mean, self.std, size), self.lo, self.hi)
+
+
+@dataclass(frozen=True)
+class LogNormal:
+    """exp(N(log(median), sigma)): positive spread around median."""
+    median: float
+    sigma: float
+
+    def sample(self, rng, size):
+        return self.median * np.exp(rng.normal(0.0, self.sigma, size))
+
+
+DISTRIBUTIONS = {"fixed": Fixed, "uniform": Uniform, "normal": Normal, "lognormal": LogNormal}
+
+
+def distribution(spec):
+    """
+    Build a distribution from a plain spec: a number (Fixed), a
+    distribution object, or a dict like {"dist": "normal", "mean": 1.2,
+    "std": 0.05}.
+    """
+    if isinstance(spec, (int, float)):
+        return Fixed(spec)
+    if isinstance(spec, dict):
+        kw = dict(spec)
+        kind = kw.pop("dist")
+        try:
+            return DISTRIBUTIONS[kind](**kw)
+        except KeyError:
+            raise ValueError(f"Unknown distribution: {kind!r}") from None
+    if hasattr(spec, "sample"):
+        return spec
+    raise TypeError(f"Not a distribution spec: {spec!r}")
+
+
+# -----------------------------
+# Engine
+# -----------------------------
+STATUS_PENDING, STATUS_OK, STATUS_REJECTED = 0, 1, 2
+
+
+@dataclass
+class MonteCarloResult:
+    params: dict
+    outputs: dict
+    status: np.ndarray
+    seed: int
+
+    @property
+    def n(self):
+        return len(self.status)
+
+    @property
+    def rejected(self):
+        return self.status == STATUS_REJECTED
+
+    def summary(self, q=(0.05, 0.5, 0.95)):
+        """Per-output mean/std/quantiles over accepted samples, plus reject rate."""
+        ok = self.status == STATUS_OK
+        out = {}
+        for name, v in self.outputs.items():
+            v = v[ok & ~np.isnan(v)]
+            stats = dict(n=int(len(v)))
+            if len(v):
+                stats.update(mean=float(v.mean()), std=float(v.std()),
+                             **{f"q{round(p * 100):02d}": float(x)
+                                for p, x in zip(q, np.quantile(v, q))})
+            out[name] = stats
+        out["reject_rate"] = float(np.mean(self.rejected)) if self.n else 0.0
+        return out
+
+
+def _chunk(fn, fixed, space, handle, lo, hi, seed):
+    rng = np.random.default_rng(seed)
+    names = list(space)
+    draws = {k: space[k].sample(rng, hi - lo) for k in names}
+
+    with SharedArrays.attach(handle) as sa:
+        P, Y, status = sa["params"], sa["outputs"], sa["status"]
+        for j, k in enumerate(names):
+            P[lo:hi, j] = draws[k]
+        for i in range(hi - lo):
+            r = fn({k: float(draws[k][i]) for k in names}, **fixed)
+            if is_rejected(r):
+                status[lo + i] = STATUS_REJECTED
+            else:
+                Y[lo + i] = r
+                status[lo + i] = STATUS_OK
+    return lo, hi
+
+
+def run_monte_carlo(fn, space, n, outputs, fixed=None, seed=0,
+                    workers=None, chunk=256, progress=None):
+    """
+    Evaluate fn(params, **fixed) for n parameter draws from `space`
+    ({name: distribution spec}). fn must be picklable and return one
+    value per name in `outputs`, or a Rejected record.
+
+    Chunk c uses the c-th stream spawned from SeedSequence(seed).
+    progress, if given, is called as progress(done_samples, n).
+    """
+    space = {k: distribution(v) for k, v in space.items()}
+    outputs = tuple(outputs)
+    fixed = dict(fixed or {})
+    n, chunk = int(n), max(1, int(chunk))
+
+    bounds = [(lo, min(lo + chunk, n)) for lo in range(0, n, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(bounds))
+
+    spec = {
+        "params": ((n, len(space)), "f8"),
+        "outputs": ((n, len(outputs)), "f8"),
+        "status": ((n,), "u1"),
+    }
+    with SharedArrays(spec) as sa:
+        sa["outputs"][...] = np.nan
+        tasks = [dict(fn=fn, fixed=fixed, space=space, handle=sa.handle(),
+                      lo=lo, hi=hi, seed=s) for (lo, hi), s in zip(bounds, seeds)]
+
+        report = None
+        if progress is not None:
+            def report(done, total):
+                progress(min(done * chunk, n), n)
+
+        run_sweep(_chunk, tasks, workers=workers, progress=report)
+
+        P = sa["params"].copy()
+        Y = sa["outputs"].copy()
+        status = sa["status"].copy()
+
+    return MonteCarloResult(
+        params={k: P[:, j] for j, k in enumerate(space)},
+        outputs={k: Y[:, j] for j, k in enumerate(outputs)},
+        status=status,
+        seed=seed,
+    )
@@ -0,0 +1,186 @@
+"""
+Peak detection and peak-to-peak Δt without per-peak Python loops.
+
+Peaks are strict local maxima thinned greedily so kept peaks are at
+least `min_dist` samples apart (the first candidate always wins), as in
+demo 06's find_peaks_simple. Works on 1-D traces or 2-D batches (one
+trace per row, time along the last axis), offline or streamed in chunks.
+"""
+
+import numpy as np
+
+
+def _greedy_keep(pos, min_dist):
+    """
+    Mask of the greedy chain over sorted positions: keep pos[0], then
+    the first position >= last kept + min_dist, and so on.
+
+    Each candidate's successor is found with one searchsorted; the chain
+    from pos[0] is then collected by pointer doubling in O(log m) numpy
+    passes instead of one Python iteration per peak.
+    """
+    m = len(pos)
+    if m == 0 or min_dist <= 1:
+        return np.ones(m, dtype=bool)
+
+    jump = np.append(np.searchsorted(pos, pos + min_dist, side="left"), m)
+    keep = np.zeros(m + 1, dtype=bool)
+    keep[0] = True
+    for _ in range(m.bit_length()):
+        keep[jump[keep]] = True
+        jump = jump[jump]
+    return keep[:m]
+
+
+def _candidates(ext):
+    """(row, column) of strict local maxima in the interior of ext."""
+    mid = ext[:, 1:-1]
+    rows, cols = np.nonzero((mid > ext[:, :-2]) & (mid > ext[:, 2:]))
+    return rows, cols + 1
+
+
+def _thin(rows, idx, min_dist, last=None):
+    """
+    Apply the min-distance rule per row to candidates sorted by (row, idx).
+    `last` holds each row's most recent kept index (streaming carry).
+    """
+    if last is not None:
+        ok = idx >= last[rows] + min_dist
+        rows, idx = rows[ok], idx[ok]
+    if len(idx) == 0:
+        return rows, idx
+
+    # separate rows by more than min_dist so one chain covers every row
+    stride = int(idx.max()) + int(min_dist) + 1
+    keep = _greedy_keep(rows.astype(np.int64) * stride + idx, min_dist)
+    return rows[keep], idx[keep]
+
+
+def _split(rows, idx, n_rows):
+    bounds = np.searchsorted(rows, np.arange(1, n_rows))
+    return np.split(idx, bounds)
+
+
+def min_dist_steps(t, min_dist_s):
+    """Sample count for min_dist_s on grid t, as find_peaks_simple computes it."""
+    return int(min_dist_s / (t[1] - t[0]))
+
+
+def find_peaks(x, min_dist):
+    """
+    Indices of local maxima of x at least min_dist samples apart.
+
+    For 2-D x returns a list with one index array per row.
+    """
+    x = np.asarray(x)
+    X = np.atleast_2d(x)
+    rows, idx = _thin(*_candidates(X), min_dist)
+    out = _split(rows, idx, X.shape[0])
+    return out[0] if x.ndim == 1 else out
+
+
+def pair_dt(t, ref_peaks, cmp_peaks):
+    """Δt between the k-th comparison peak and the k-th reference peak."""
+    n = min(len(ref_peaks), len(cmp_peaks))
+    return t[cmp_peaks[:n]] - t[ref_peaks[:n]]
+
+
+def dt_batch(t, x_ref, X_cmp, min_dist_s=0.8):
+    """
+    Peak Δt of every row of X_cmp against one reference trace.
+
+    Returns an array of shape (rows, n_ref_peaks): row j holds
+    compute_dt(t, x_ref, X_cmp[j]) padded with NaN.
+    """
+    t = np.asarray(t)
+    min_dist = min_dist_steps(t, min_dist_s)
+    pr = find_peaks(x_ref, min_dist)
+
+    X = np.atleast_2d(np.asarray(X_cmp))
+    rows, idx = _thin(*_candidates(X), min_dist)
+    rank = np.arange(len(rows)) - np.searchsorted(rows, rows, side="left")
+
+    out = np.full((X.shape[0], len(pr)), np.nan)
+    ok = rank < len(pr)
+    out[rows[ok], rank[ok]] = t[idx[ok]] - t[pr[rank[ok]]]
+    return out
+
+
+def mean_dt(D):
+    """Row means of a NaN-padded Δt matrix; NaN for rows without pairs."""
+    D = np.asarray(D)
+    n = np.sum(~np.isnan(D), axis=-1)
+    s = np.nansum(D, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = np.where(n > 0, s / n, np.nan)
+    return out[()] if out.ndim == 0 else out
+
+
+# =========================================================
+# Streaming
+# =========================================================
+
+class PeakStream:
+    """
+    Online peak detector over `lanes` parallel traces.
+
+    push(chunk) takes the next samples (shape (chunk,) or (lanes, chunk))
+    and returns (lane, index) arrays of peaks confirmed by that chunk,
+    with indices counted from the first sample pushed. Over any chunking
+    the result equals find_peaks() on the concatenated trace.
+    """
+
+    def __init__(self, min_dist, lanes=1):
+        self.min_dist = int(min_dist)
+        self.lanes = int(lanes)
+        self.n_seen = 0
+        self._tail = np.empty((self.lanes, 0))
+        self._last = np.full(self.lanes, -(self.min_dist + 1), dtype=np.int64)
+
+    def push(self, chunk):
+        chunk = np.asarray(chunk, dtype=float).reshape(self.lanes, -1)
+        ext = np.concatenate([self._tail, chunk], axis=1)
+        base = self.n_seen - self._tail.shape[1]
+        self.n_seen += chunk.shape[1]
+        self._tail = ext[:, -2:].copy()
+
+        if ext.shape[1] < 3:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int64)
+
+        rows, cols = _candidates(ext)
+        rows, idx = _thin(rows, cols.astype(np.int64) + base, self.min_dist, self._last)
+        np.maximum.at(self._last, rows, idx)
+        return rows, idx
+
+
+class DtStream:
+    """
+    Online peak Δt of `lanes` traces against fixed reference peak times.
+
+    Samples are taken at t = k * dt. push(chunk) returns (lane, Δt) for
+    the peaks that chunk completes; count/mean summarize each lane so far
+    without keeping the waveforms.
+    """
+
+    def __init__(self, ref_times, dt, min_dist, lanes=1):
+        self.ref_times = np.asarray(ref_times, dtype=float)
+        self.dt = float(dt)
+        self.peaks = PeakStream(min_dist, lanes)
+        self.count = np.zeros(lanes, dtype=np.int64)
+        self.total = np.zeros(lanes)
+
+    def push(self, chunk):
+        rows, idx = self.peaks.push(chunk)
+        rank = self.count[rows] + (np.arange(len(rows))
+                                   - np.searchsorted(rows, rows, side="left"))
+        ok = rank < len(self.ref_times)
+        rows, dts = rows[ok], idx[ok] * self.dt - self.ref_times[rank[ok]]
+
+        np.add.at(self.count, rows, 1)
+        np.add.at(self.total, rows, dts)
+        return rows, dts
+
+    @property
+    def mean(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self.total / self.count, np.nan)
@@ -0,0 +1,157 @@
+"""
+Reference / disturbance profiles precomputed as arrays.
+
+A Profile is a sum of components, sampled once on the simulation time
+grid so the loop only indexes an array:
+
+    IREF = Profile(Piecewise([0.6, 3.0], [1.2, 1.6]))
+    iref = IREF.sample(t)          # shape (n,)
+    e = iref[k] - plant.I
+
+Windows are half-open [t0, t1). Sine terms use absolute time t.
+"""
+
+import math
+
+import numpy as np
+
+
+class Piecewise:
+    """initial for t < breaks[0], values[k] for t >= breaks[k]."""
+
+    def __init__(self, breaks, values, initial=0.0):
+        if len(breaks) != len(values):
+            raise ValueError("breaks and values must have the same length")
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.levels = np.r_[float(initial), np.asarray(values, dtype=float)]
+
+    def __repr__(self):
+        return (f"Piecewise({self.breaks.tolist()!r}, {self.levels[1:].tolist()!r}, "
+                f"initial={float(self.levels[0])!r})")
+
+    def sample(self, t):
+        return self.levels[np.searchsorted(self.breaks, t, side="right")]
+
+
+class Pulse:
+    """Constant value on [t0, t1)."""
+
+    def __init__(self, t0, t1, value):
+        self.t0, self.t1, self.value = float(t0), float(t1), float(value)
+
+    def __repr__(self):
+        return f"Pulse({self.t0!r}, {self.t1!r}, {self.value!r})"
+
+    def sample(self, t):
+        return np.where((t >= self.t0) & (t < self.t1), self.value, 0.0)
+
+
+class Ramp:
+    """rate * (t - t0) on [t0, t1); held at its end value afterwards if hold."""
+
+    def __init__(self, t0, t1, rate, hold=True):
+        self.t0, self.t1, self.rate, self.hold = float(t0), float(t1), float(rate), hold
+
+    def __repr__(self):
+        return f"Ramp({self.t0!r}, {self.t1!r}, {self.rate!r}, hold={self.hold!r})"
+
+    def sample(self, t):
+        tc = np.minimum(t, self.t1) if self.hold else t
+        out = np.where(t >= self.t0, self.rate * (tc - self.t0), 0.0)
+        if not self.hold:
+            out = np.where(t < self.t1, out, 0.0)
+        return out
+
+
+class SineBurst:
+    """amplitude * sin(2π f t + phase) on [t0, t1)."""
+
+    def __init__(self, t0, t1, amplitude, freq_hz, phase=0.0):
+        self.t0, self.t1 = float(t0), float(t1)
+        self.amplitude, self.freq_hz, self.phase = float(amplitude), float(freq_hz), float(phase)
+
+    def __repr__(self):
+        return (f"SineBurst({self.t0!r}, {self.t1!r}, {self.amplitude!r}, "
+                f"{self.freq_hz!r}, phase={self.phase!r})")
+
+    def sample(self, t):
+        # math.sin per sample, not np.sin: the two differ in the last bit,
+        # and profiles must reproduce the scalar per-step demo code exactly
+        w = 2 * math.pi * self.freq_hz
+        out = np.zeros(np.shape(t))
+        inside = (t >= self.t0) & (t < self.t1)
+        out[inside] = [self.amplitude * math.sin(w * ti + self.phase) for ti in t[inside].tolist()]
+        return out
+
+
+class Impulse:
+    """value added at the single sample nearest to time t_event."""
+
+    def __init__(self, t_event, value):
+        self.t_event, self.value = float(t_event), float(value)
+
+    def __repr__(self):
+        return f"Impulse({self.t_event!r}, {self.value!r})"
+
+    def sample(self, t):
+        out = np.zeros(np.shape(t))
+        if len(t) == 0:
+            return out
+        dt = t[1] - t[0] if len(t) > 1 else 1.0
+        k = int(round((self.t_event - t[0]) / dt))
+        if 0 <= k < len(t):
+            out[k] = self.value
+        return out
+
+
+class Profile:
+    """Sum of components, evaluated over a whole time grid at once."""
+
+    def __init__(self, *components):
+        self.components = components
+
+    def __repr__(self):
+        return f"Profile({', '.join(map(repr, self.components))})"
+
+    def sample(self, t):
+        t = np.asarray(t, dtype=float)
+        out = np.zeros(t.shape)
+        for c in self.components:
+            out += c.sample(t)
+        return out
+
+    def events(self):
+        """Times of Impulse components (for plot markers)."""
+        return [c.t_event for c in self.components if isinstance(c, Impulse)]
+
+
+COMPONENTS = {"piecewise": Piecewise, "pulse": Pulse, "ramp": Ramp,
+              "sine_burst": SineBurst, "impulse": Impulse}
+
+
+def profile(spec):
+    """
+    Build a Profile from a plain spec: a Profile, or a list of component
+    dicts like {"type": "pulse", "t0": 2.0, "t1": 2.12, "value": -0.05}.
+    """
+    if isinstance(spec, Profile):
+        return spec
+    components = []
+    for c in spec:
+        kw = dict(c)
+        kind = kw.pop("type")
+        try:
+            cls = COMPONENTS[kind]
+        except KeyError:
+            raise ValueError(f"Unknown profile component: {kind!r}") from None
+        components.append(cls(**kw))
+    return Profile(*components)
+
+
+def sample_batch(profiles, t):
+    """One row per scenario: shape (len(profiles), len(t))."""
+    t = np.asarray(t, dtype=float)
+    out = np.empty((len(profiles), t.size))
+    for b, p in enumerate(profiles):
+        out[b] = p.sample(t)
+    return out
@@ -0,0 +1,210 @@
+"""
+Headless batch report: run demo scripts on the Agg backend in a process
+pool and keep a manifest of what they produced.
+
+A Job names a demo script, its command-line args and the files it
+writes (relative to the repo root). A job is rebuilt only when its input
+digest changes: a SHA-256 over the script, every repo module it imports
+(found statically, see sim.sources), any extra input files and its
+args; or when one of its recorded outputs is missing or was modified.
+PNG outputs also get a PDF copy (Pillow, as convert_png_to_pdf.py does).
+
+    jobs = [Job("13_aging_sweep", "demos/13_aging_sweep_delta_t.py",
+                outputs=["data/13_aging_sweep_delta_t.png"], args=["--workers", "1"])]
+    build_report(jobs, root=".", manifest="data/manifest.json", workers=4)
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import runpy
+import sys
+import tempfile
+import time
+import traceback
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from aitl.sim.sources import imported_files
+from aitl.sim.sweep import run_sweep
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class Job:
+    name: str
+    script: str
+    outputs: Sequence[str]
+    args: Sequence[str] = ()
+    inputs: Sequence[str] = ()
+    pdf: bool = True
+
+
+# -----------------------------
+# Input digests
+# -----------------------------
+def file_digest(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def dependencies(script, root):
+    """Repo files imported (transitively) by `script`, relative to root."""
+    root = Path(root).resolve()
+    script = (root / script).resolve()
+    files = imported_files(script, [root / "src", script.parent])
+    return sorted(f.relative_to(root).as_posix() for f in files if f.is_relative_to(root))
+
+
+def input_digest(job, root):
+    """(digest, deps) for `job`; deps lists every hashed repo file."""
+    root = Path(root)
+    deps = sorted(set(dependencies(job.script, root)) | set(job.inputs))
+    blob = json.dumps(dict(args=list(job.args),
+                           files={p: file_digest(root / p) for p in deps}), sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest(), deps
+
+
+# -----------------------------
+# Worker
+# -----------------------------
+def to_pdf(png, pdf=None, resolution=150.0):
+    from PIL import Image
+
+    pdf = Path(png).with_suffix(".pdf") if pdf is None else Path(pdf)
+    with Image.open(png) as img:
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(pdf, "PDF", resolution=resolution)
+    return pdf
+
+
+def run_job(script, args, root, outputs, pdf=True):
+    """
+    Run one demo script as __main__ with cwd=root on the Agg backend.
+    Returns dict(ok, seconds, log, error, files).
+    """
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    import matplotlib.pyplot as plt
+
+    cwd, argv = os.getcwd(), sys.argv
+    log, error = io.StringIO(), None
+    t0, started = time.perf_counter(), time.time()
+    try:
+        os.chdir(root)
+        sys.argv = [script, *args]
+        with matplotlib.rc_context(), contextlib.redirect_stdout(log), \
+                warnings.catch_warnings():
+            # plt.show() on Agg only warns that it cannot show anything
+            warnings.filterwarnings("ignore", message=".*non-interactive.*")
+            runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            error = f"SystemExit({e.code!r})"
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        plt.close("all")
+        os.chdir(cwd)
+        sys.argv = argv
+
+    files = []
+    if error is None:
+        root = Path(root)
+        # an output left over from an earlier run does not count
+        missing = [p for p in outputs
+                   if not (root / p).is_file() or (root / p).stat().st_mtime < started - 1.0]
+        if missing:
+            error = f"outputs not written: {', '.join(missing)}"
+        else:
+            for p in outputs:
+                files.append(p)
+                if pdf and p.lower().endswith(".png"):
+                    files.append(to_pdf(root / p).relative_to(root).as_posix())
+
+    return dict(ok=error is None, seconds=time.perf_counter() - t0,
+                log=log.getvalue(), error=error, files=files)
+
+
+# -----------------------------
+# Manifest
+# -----------------------------
+def load_manifest(path):
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "jobs": {}}
+    if data.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "jobs": {}}
+    return data
+
+
+def save_manifest(data, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def _intact(entry, root):
+    """Every recorded output still exists with its recorded hash."""
+    try:
+        return all(file_digest(root / p) == h for p, h in entry["files"].items())
+    except OSError:
+        return False
+
+
+def build_report(jobs, root=".", manifest="data/manifest.json", workers=None,
+                 force=False, progress=None):
+    """
+    Rebuild every stale job in a process pool and update the manifest.
+
+    Returns {name: entry}; entry["status"] is "built", "skipped" or
+    "failed" (failed jobs keep no digest, so they rerun next time).
+    progress, if given, is called as progress(done, total) over the
+    jobs that actually run.
+    """
+    root = Path(root).resolve()
+    manifest = Path(manifest) if Path(manifest).is_absolute() else root / manifest
+    data = load_manifest(manifest)
+
+    results, todo = {}, []
+    for job in jobs:
+        digest, deps = input_digest(job, root)
+        prev = data["jobs"].get(job.name)
+        if (not force and prev is not None and prev.get("digest") == digest
+                and _intact(prev, root)):
+            results[job.name] = dict(prev, status="skipped")
+        else:
+            todo.append((job, digest, deps, (prev or {}).get("seconds", 0.0)))
+
+    # longest jobs first, so one slow demo does not start last
+    todo.sort(key=lambda item: -item[3])
+    tasks = [dict(script=job.script, args=list(job.args), root=str(root),
+                  outputs=list(job.outputs), pdf=job.pdf) for job, *_ in todo]
+    outs = run_sweep(run_job, tasks, workers=workers, progress=progress)
+
+    for (job, digest, deps, _), r in zip(todo, outs):
+        entry = dict(script=job.script, args=list(job.args), deps=deps,
+                     seconds=round(r["seconds"], 3),
+                     built=time.strftime("%Y-%m-%dT%H:%M:%S"))
+        if r["ok"]:
+            entry.update(status="built", digest=digest,
+                         files={p: file_digest(root / p) for p in r["files"]})
+        else:
+            entry.update(status="failed", digest=None, files={},
+                         error=r["error"], log=r["log"][-2000:])
+        results[job.name] = entry
+
+    data["jobs"].update({k: {f: v for f, v in e.items() if f != "status"}
+                         for k, e in results.items()})
+    save_manifest(data, manifest)
+    return {job.name: results[job.name] for job in jobs}
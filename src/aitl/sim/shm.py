@@ -0,0 +1,95 @@
+"""
+Named numpy arrays in one multiprocessing.shared_memory block.
+
+The parent allocates result arrays once; workers attach by handle and
+write their slice in place, so nothing but indices travels back through
+pickling.
+
+    with SharedArrays({"y": ((n, 2), "f8"), "done": ((n,), "u1")}) as sa:
+        run_sweep(work, [dict(handle=sa.handle(), lo=i, hi=i + 100) ...])
+        y = sa["y"].copy()
+
+    def work(handle, lo, hi):
+        with SharedArrays.attach(handle) as sa:
+            sa["y"][lo:hi] = ...
+"""
+
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+_ALIGN = 64
+
+
+def _layout(spec):
+    offsets, size = {}, 0
+    for name, (shape, dtype) in spec.items():
+        size = -(-size // _ALIGN) * _ALIGN
+        offsets[name] = size
+        size += int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize
+    return offsets, max(size, 1)
+
+
+class SharedArrays:
+    def __init__(self, spec, fill=0, _shm=None):
+        """
+        spec: {name: (shape, dtype)}. Arrays are created zero-filled (or
+        `fill`); the owner must close() and unlink() (or use `with`).
+        """
+        self.spec = {k: (tuple(np.atleast_1d(shape).tolist()) if np.ndim(shape) else (int(shape),),
+                         np.dtype(dtype).str)
+                     for k, (shape, dtype) in spec.items()}
+        offsets, size = _layout(self.spec)
+
+        self.owner = _shm is None
+        self.shm = shared_memory.SharedMemory(create=True, size=size) if self.owner else _shm
+        self.arrays = {
+            k: np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offsets[k])
+            for k, (shape, dtype) in self.spec.items()
+        }
+        if self.owner:
+            for a in self.arrays.values():
+                a[...] = fill
+
+    def handle(self):
+        """Picklable reference for attach() in another process."""
+        return (self.shm.name, self.spec)
+
+    @classmethod
+    def attach(cls, handle):
+        name, spec = handle
+        # The creating process owns the block; an attached one must not
+        # register it with a resource tracker, or the block is unlinked
+        # when that process exits.
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+            return cls(spec, _shm=shm)
+
+        # Before 3.13 attaching always registers (CPython gh-82300,
+        # bpo-38119). A spawned worker starts its own tracker, so undo the
+        # registration there; forked workers share the owner's tracker,
+        # where unregistering would drop the owner's entry instead.
+        own_tracker = getattr(resource_tracker._resource_tracker, "_fd", None) is None
+        shm = shared_memory.SharedMemory(name=name)
+        if own_tracker:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(spec, _shm=shm)
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def close(self):
+        self.arrays = {}
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
@@ -0,0 +1,62 @@
+"""
+Source files a script or module depends on, for content-addressed keys.
+
+modulefinder walks the import statements statically (nothing is
+executed) and only files found on `search` count, so stdlib and
+site-packages imports are ignored. Scenarios loaded at runtime through
+the registry (`scenarios.get("friction_aging")`, `register("x", "mod")`
+with literal arguments) are followed as if they were imported.
+"""
+
+import ast
+from modulefinder import ModuleFinder
+from pathlib import Path
+
+from aitl.scenarios import module_name
+
+
+def registry_targets(path):
+    """Module paths that literal scenario get()/register() calls in `path` load."""
+    tree = ast.parse(Path(path).read_bytes())
+    getters, registered, wanted = set(), {}, set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and (node.module or "").endswith("scenarios"):
+            getters.update(a.asname or a.name for a in node.names if a.name == "get")
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        f = node.func
+        attr = f.attr if isinstance(f, ast.Attribute) else None
+        on_registry = isinstance(f, ast.Attribute) and getattr(f.value, "id", None) == "scenarios"
+        args = [a.value for a in node.args if isinstance(a, ast.Constant) and isinstance(a.value, str)]
+        if args and ((on_registry and attr == "get") or getattr(f, "id", None) in getters):
+            wanted.add(args[0])
+        elif on_registry and attr == "register" and len(args) == 2:
+            registered[args[0]] = args[1]
+    return {registered.get(n) or module_name(n) for n in wanted} - {None}
+
+
+def imported_files(path, search):
+    """`path` plus every file it imports (transitively) from the `search` dirs."""
+    path = Path(path).resolve()
+    roots = [Path(p).resolve() for p in search]
+    mf = ModuleFinder(path=[str(r) for r in roots])
+    mf.run_script(str(path))
+
+    files, scanned = {path}, set()
+    while True:
+        for m in list(mf.modules.values()):
+            f = Path(m.__file__).resolve() if m.__file__ else None
+            if f is not None and any(f.is_relative_to(r) for r in roots):
+                files.add(f)
+        todo = sorted(f for f in files - scanned if f.suffix == ".py")
+        if not todo:
+            return sorted(files)
+        for f in todo:
+            scanned.add(f)
+            for target in registry_targets(f):
+                if target not in mf.modules:
+                    try:
+                        mf.import_hook(target)
+                    except ImportError:
+                        pass
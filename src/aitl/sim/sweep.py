@@ -0,0 +1,108 @@
+"""
+Process-pool sweep executor.
+
+Each task is a kwargs dict for one grid point. Results come back in task
+order regardless of which worker finished first, so callers can fill
+result arrays deterministically.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def grid_indices(*sizes):
+    """All index tuples of a grid, in C (row-major) order."""
+    return list(itertools.product(*(range(n) for n in sizes)))
+
+
+def _apply(fn, kwargs):
+    return fn(**kwargs)
+
+
+def run_sweep(fn, tasks, workers=None, chunksize=1, progress=None):
+    """
+    Evaluate fn(**task) for every task and return the results in order.
+
+    fn must be picklable (module-level function). workers=1 runs in-process
+    without a pool. progress, if given, is called as progress(done, total).
+    """
+    tasks = list(tasks)
+    workers = default_workers() if workers is None else int(workers)
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
+    total = len(tasks)
+    results = []
+
+    if workers == 1 or total <= 1:
+        for task in tasks:
+            results.append(fn(**task))
+            if progress is not None:
+                progress(len(results), total)
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(workers, total)) as pool:
+        for r in pool.map(_apply, itertools.repeat(fn), tasks, chunksize=chunksize):
+            results.append(r)
+            if progress is not None:
+                progress(len(results), total)
+    return results
+
+
+def run_forked_sweep(prefix, branch, tasks, key, workers=None, chunksize=1, progress=None):
+    """
+    Sweep whose tasks share expensive common prefixes.
+
+    Tasks with equal key(task) form a group: prefix(**task) runs once for
+    the group's first task and returns a picklable checkpoint, then
+    branch(checkpoint=..., **task) finishes every task from it. Both
+    stages go through run_sweep; results come back in task order.
+    """
+    tasks = list(tasks)
+    group_of, heads, groups = {}, [], []
+    for task in tasks:
+        k = key(task)
+        if k not in group_of:
+            group_of[k] = len(heads)
+            heads.append(task)
+        groups.append(group_of[k])
+
+    states = run_sweep(prefix, heads, workers=workers, chunksize=chunksize)
+    branches = [dict(task, checkpoint=states[g]) for task, g in zip(tasks, groups)]
+    return run_sweep(branch, branches, workers=workers, chunksize=chunksize, progress=progress)
+
+
+def _apply_shared(fn, handle, index, kwargs):
+    from aitl.sim.shm import SharedArrays
+
+    with SharedArrays.attach(handle) as sa:
+        row = {k: a[index:index + 1].reshape(a.shape[1:]) for k, a in sa.arrays.items()}
+        fn(out=row, **kwargs)
+    return index
+
+
+def run_sweep_shared(fn, tasks, outputs, workers=None, chunksize=1, progress=None):
+    """
+    Like run_sweep, but results are written in place instead of pickled.
+
+    outputs: {name: (per-task shape, dtype)}. One shared-memory matrix of
+    shape (len(tasks), *shape) is allocated per name (zero-filled), and
+    fn(out=row, **task) writes its results into `row` (views of row i).
+    Workers send back only their task index. Returns {name: ndarray}.
+    """
+    # sim.shm needs numpy; plain run_sweep callers should not pay for it
+    from aitl.sim.shm import SharedArrays
+
+    tasks = list(tasks)
+    spec = {k: ((len(tasks),) + tuple(shape), dtype) for k, (shape, dtype) in outputs.items()}
+    with SharedArrays(spec) as sa:
+        handle = sa.handle()
+        run_sweep(_apply_shared,
+                  [dict(fn=fn, handle=handle, index=i, kwargs=task) for i, task in enumerate(tasks)],
+                  workers=workers, chunksize=chunksize, progress=progress)
+        return {k: a.copy() for k, a in sa.arrays.items()}
@@ -0,0 +1,131 @@
+"""
+Preallocated columnar trace recorder.
+
+Columns are typed NumPy arrays sized up front; record() writes one row in
+place instead of appending boxed floats to Python lists. A tuple spec
+declares a categorical column (labels stored as uint8 codes):
+
+    rec = TraceRecorder({"t": "f8", "x": "f8", "state": ("normal", "high")},
+                        capacity=steps, decimate=10)
+    rec.record(t=t, x=x, state="high")
+    rec.to_npz("trace.npz")
+"""
+
+import math
+
+import numpy as np
+
+
+class TraceRecorder:
+    def __init__(self, columns, capacity, decimate=1):
+        if decimate < 1:
+            raise ValueError(f"decimate must be >= 1, got {decimate}")
+        self.decimate = int(decimate)
+        self.capacity = max(1, math.ceil(int(capacity) / self.decimate))
+        self.categories = {}
+        self._codes = {}
+        self._data = {}
+        for name, spec in columns.items():
+            if isinstance(spec, (tuple, list)):
+                self.categories[name] = tuple(spec)
+                self._codes[name] = {c: k for k, c in enumerate(spec)}
+                dtype = np.uint8
+            else:
+                dtype = np.dtype(spec)
+            self._data[name] = np.zeros(self.capacity, dtype=dtype)
+        self.n = 0
+        self._calls = 0
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def columns(self):
+        return list(self._data)
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, arr in self._data.items():
+            new = np.zeros(self.capacity, dtype=arr.dtype)
+            new[:self.n] = arr[:self.n]
+            self._data[name] = new
+
+    def _check_columns(self, values):
+        missing = [k for k in self._data if k not in values]
+        unknown = [k for k in values if k not in self._data]
+        raise KeyError(f"columns must match the recorder: missing {missing}, unknown {unknown}")
+
+    def record(self, **values):
+        """
+        Store one row (every decimate-th call); every column must be given.
+        Returns True if stored.
+        """
+        if values.keys() != self._data.keys():
+            self._check_columns(values)
+        k = self._calls
+        self._calls += 1
+        if k % self.decimate:
+            return False
+        if self.n == self.capacity:
+            self._grow()
+        for name, v in values.items():
+            codes = self._codes.get(name)
+            self._data[name][self.n] = codes[v] if codes is not None else v
+        self.n += 1
+        return True
+
+    def __getitem__(self, name):
+        """Filled part of a column (a view; categorical columns as codes)."""
+        return self._data[name][:self.n]
+
+    def labels(self, name):
+        """Categorical column decoded to its labels."""
+        return np.asarray(self.categories[name], dtype=object)[self[name]]
+
+    def to_npz(self, path, compressed=True):
+        arrays = {name: self[name] for name in self._data}
+        for name, cats in self.categories.items():
+            arrays[f"__categories__{name}"] = np.asarray(cats)
+        (np.savez_compressed if compressed else np.savez)(path, **arrays)
+
+    @classmethod
+    def from_npz(cls, path):
+        with np.load(path) as z:
+            cols = [k for k in z.files if not k.startswith("__categories__")]
+            spec = {}
+            for name in cols:
+                key = f"__categories__{name}"
+                spec[name] = tuple(z[key].tolist()) if key in z.files else z[name].dtype
+            n = len(z[cols[0]]) if cols else 0
+            rec = cls(spec, capacity=n)
+            for name in cols:
+                rec._data[name][:n] = z[name]
+        rec.n = n
+        return rec
+
+    def to_parquet(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("to_parquet() requires pyarrow (pip install pyarrow)") from exc
+
+        fields = {}
+        for name in self._data:
+            if name in self.categories:
+                fields[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(self[name]), pa.array(list(self.categories[name])))
+            else:
+                fields[name] = pa.array(self[name])
+        pq.write_table(pa.table(fields), path)
+
+    def to_csv(self, path, fmt):
+        """
+        Write rows with one str.format template, e.g. "{t:.4f},{state}".
+        Categorical columns are written as labels.
+        """
+        cols = {name: (self.labels(name) if name in self.categories else self[name].tolist())
+                for name in self._data}
+        rows = (fmt.format(**dict(zip(cols, row))) for row in zip(*cols.values()))
+        with open(path, "w") as f:
+            f.write("".join(r + "\n" for r in rows))
@@ -0,0 +1,130 @@
+"""
+Append-only, memory-mapped trace store.
+
+A store is a directory with one raw binary file per column plus meta.json.
+Samples are buffered in fixed-size chunks and appended to disk as each
+chunk fills, so a run never holds its whole waveform in RAM. Readers map
+the files with np.memmap (zero-copy, read-only).
+
+    with TraceStore(path, {"t": "f8", "x": "f8"}) as store:
+        for k in range(n):
+            store.append(t=k * dt, x=x)
+    trace = TraceStore.open(path)
+    trace["x"]        # np.memmap
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+META = "meta.json"
+
+
+class TraceStore:
+    def __init__(self, path, columns, chunk=1 << 16, attrs=None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dtypes = {name: np.dtype(dt) for name, dt in columns.items()}
+        self.chunk = int(chunk)
+        self.attrs = dict(attrs or {})
+        self.length = 0
+
+        self._buf = {name: np.empty(self.chunk, dtype=dt) for name, dt in self.dtypes.items()}
+        self._m = 0
+        self._files = {name: open(self.path / f"{name}.bin", "wb") for name in self.dtypes}
+        self._write_meta()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write_meta(self):
+        meta = dict(
+            columns={name: dt.str for name, dt in self.dtypes.items()},
+            length=self.length,
+            attrs=self.attrs,
+        )
+        (self.path / META).write_text(json.dumps(meta, indent=2))
+
+    def _check_columns(self, values):
+        missing = [k for k in self.dtypes if k not in values]
+        unknown = [k for k in values if k not in self.dtypes]
+        raise KeyError(f"columns must match the store: missing {missing}, unknown {unknown}")
+
+    def append(self, **values):
+        """Append one sample; every column must be given."""
+        if values.keys() != self._buf.keys():
+            self._check_columns(values)
+        m = self._m
+        for name, v in values.items():
+            self._buf[name][m] = v
+        self._m = m + 1
+        if self._m == self.chunk:
+            self.flush()
+
+    def extend(self, **arrays):
+        """Append equal-length arrays, one per column."""
+        if arrays.keys() != self._buf.keys():
+            self._check_columns(arrays)
+        arrays = {name: np.ascontiguousarray(a, dtype=self.dtypes[name])
+                  for name, a in arrays.items()}
+        lengths = {len(a) for a in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError("extend() arrays must have equal length")
+        self.flush()
+        for name, a in arrays.items():
+            a.tofile(self._files[name])
+        self.length += lengths.pop() if lengths else 0
+
+    def flush(self):
+        if self._m:
+            for name, f in self._files.items():
+                self._buf[name][:self._m].tofile(f)
+            self.length += self._m
+            self._m = 0
+        for f in self._files.values():
+            f.flush()
+        self._write_meta()
+
+    def close(self):
+        if self._files:
+            self.flush()
+            for f in self._files.values():
+                f.close()
+            self._files = {}
+
+    @staticmethod
+    def open(path):
+        return MappedTrace(path)
+
+
+class MappedTrace:
+    """Read-only view of a TraceStore directory; columns are np.memmap."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        meta = json.loads((self.path / META).read_text())
+        self.length = int(meta["length"])
+        self.attrs = meta.get("attrs", {})
+        self.dtypes = {name: np.dtype(dt) for name, dt in meta["columns"].items()}
+        self._cols = {}
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def columns(self):
+        return list(self.dtypes)
+
+    def __getitem__(self, name):
+        if name not in self._cols:
+            dt = self.dtypes[name]
+            if self.length == 0:
+                self._cols[name] = np.empty(0, dtype=dt)
+            else:
+                self._cols[name] = np.memmap(self.path / f"{name}.bin", dtype=dt,
+                                             mode="r", shape=(self.length,))
+        return self._cols[name]
@@ -0,0 +1,95 @@
+import shutil
+
+import matplotlib
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from aitl.sim.animate import FFmpegWriter, FrameBuffer, GifWriter, render_animation, open_writer
+
+
+def _setup(n=20, dpi=40):
+    t = np.linspace(0.0, 1.0, n)
+    fig, ax = plt.subplots(figsize=(3, 2), dpi=dpi)
+    ax.plot(t, np.sin(6 * t))
+    cursor = ax.axvline(0.0, color="gray")
+    dot, = ax.plot([0.0], [0.0], "o")
+
+    def update(i):
+        cursor.set_xdata([t[i], t[i]])
+        dot.set_data([t[i]], [np.sin(6 * t[i])])
+        return cursor, dot
+    return fig, update
+
+
+def test_blit_frames_match_full_redraw():
+    frames = render_animation(_setup, 20, FrameBuffer()).array()
+    assert frames.shape == (20, 80, 120, 3)
+    assert not np.array_equal(frames[0], frames[10])
+
+    fig, update = _setup()
+    update(10)
+    fig.canvas.draw()
+    full = np.asarray(fig.canvas.buffer_rgba())[..., :3]
+    plt.close(fig)
+    # animated artists are drawn above the axes spines: only crossings differ
+    diff = np.abs(full.astype(int) - frames[10]).max(axis=-1)
+    assert (diff > 1).sum() <= 4
+
+
+def test_parallel_chunks_match_serial():
+    serial = render_animation(_setup, 20, FrameBuffer()).array()
+    seen = []
+    parallel = render_animation(_setup, 20, FrameBuffer(), workers=2, chunk=3,
+                                progress=lambda done, n: seen.append(done)).array()
+    np.testing.assert_array_equal(serial, parallel)
+    assert seen[-1] == 20
+
+
+def test_gif_writer(tmp_path):
+    from PIL import Image
+
+    out = tmp_path / "anim.gif"
+    render_animation(_setup, 8, out, fps=10)
+
+    # same pictures as Pillow's own multi-frame save of the quantized frames
+    frames = [Image.fromarray(f).quantize(colors=256)
+              for f in render_animation(_setup, 8, FrameBuffer()).array()]
+    ref = tmp_path / "ref.gif"
+    frames[0].save(ref, save_all=True, append_images=frames[1:], duration=100, loop=0)
+
+    with Image.open(out) as im, Image.open(ref) as expected:
+        assert im.n_frames == 8 and im.size == (120, 80)
+        assert im.info["loop"] == 0 and im.info["duration"] == 100
+        for k in range(8):
+            im.seek(k)
+            expected.seek(k)
+            np.testing.assert_array_equal(np.asarray(im.convert("RGB")),
+                                          np.asarray(expected.convert("RGB")))
+
+
+def test_gif_writer_streams_frames(tmp_path):
+    out = tmp_path / "anim.gif"
+    noise = np.random.default_rng(0).integers(0, 256, (20, 64, 64, 3), dtype=np.uint8)
+    with GifWriter(out, fps=10) as w:
+        sizes = []
+        for frame in noise:
+            w.write(frame)
+            sizes.append(out.stat().st_size)
+        # frames reach the file while writing, not all at close()
+        assert 0 < sizes[5] < sizes[-1]
+        assert w.n_frames == 20
+    assert out.read_bytes().endswith(b";")
+
+
+def test_open_writer_by_suffix(tmp_path):
+    assert isinstance(open_writer(tmp_path / "a.gif"), GifWriter)
+    with pytest.raises(ValueError):
+        open_writer(tmp_path / "a.png")
+    if shutil.which("ffmpeg") is None:
+        with pytest.raises(RuntimeError):
+            open_writer(tmp_path / "a.mp4")
+    else:
+        assert isinstance(open_writer(tmp_path / "a.mp4"), FFmpegWriter)
@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import pytest
+
+from aitl.core.async_driver import AsyncScheduler
+from aitl.core.base import ControllerBase
+
+
+class Count(ControllerBase):
+    def __init__(self):
+        super().__init__("count")
+        self.n = 0
+
+    def step(self, observation, t=None):
+        self.n += 1
+        return observation
+
+
+def test_controllers_run_at_own_rates_and_batch():
+    sched = AsyncScheduler()
+    fast, slow = Count(), Count()
+    sched.add(fast, 0.002, sense=lambda t: t, name="fast")
+    sched.add(slow, 0.004, sense=lambda t: t, name="slow")
+
+    stats = asyncio.run(sched.run(0.1))
+
+    assert stats["loops"]["fast"]["ticks"] == 50
+    assert stats["loops"]["slow"]["ticks"] == 25
+    # every slow release coincides with a fast one
+    assert stats["mean_batch"] > 1.0
+    assert stats["loops"]["fast"]["lateness"]["count"] == 50
+
+
+def test_background_jobs_do_not_block_steps():
+    sched = AsyncScheduler()
+    ctl = Count()
+    sched.add(ctl, 0.002, sense=lambda t: 0.0, name="ctl")
+
+    flushed, retuned = [], []
+
+    async def flush():
+        await asyncio.sleep(0.01)
+        flushed.append(1)
+
+    sched.every(0.0, flush)
+    sched.every(0.0, lambda: (time.sleep(0.03), retuned.append(1)))
+
+    t0 = time.perf_counter()
+    asyncio.run(sched.run(0.1))
+
+    assert ctl.n == 50
+    assert flushed and retuned
+    assert time.perf_counter() - t0 < 0.5
+
+
+def test_invalid_period():
+    with pytest.raises(ValueError):
+        AsyncScheduler().add(Count(), 0, sense=lambda t: 0.0)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from aitl.controllers.fsm import FSMController
+from aitl.controllers.fsm_table import ThresholdRule, TransitionTable
+from aitl.controllers.batch_fsm import BatchFSM
+
+
+TRANSITIONS = {
+    "normal": [ThresholdRule("abs_e", ">", 0.40, "high")],
+    "high":   [ThresholdRule("abs_e", "<", 0.18, "normal")],
+}
+
+
+def test_rule_in_scalar_fsm():
+    fsm = FSMController({"normal": None, "high": None}, TRANSITIONS, "normal")
+
+    fsm.update_state(0.5, 1.0)
+    assert fsm.current_state == "high"
+
+    # min_dwell of "high" is 0.5 s
+    fsm.update_state(0.0, 1.2)
+    assert fsm.current_state == "high"
+    fsm.update_state(0.0, 1.6)
+    assert fsm.current_state == "normal"
+
+
+def test_batch_matches_scalar_fsms():
+    rng = np.random.default_rng(1)
+    n = 32
+    fsms = [FSMController({"normal": None, "high": None}, TRANSITIONS, "normal")
+            for _ in range(n)]
+    batch = BatchFSM.from_controller(fsms[0], n)
+
+    for k in range(400):
+        t = k * 0.01
+        e = rng.normal(scale=0.4, size=n)
+        for j in range(n):
+            fsms[j].update_state(e[j], t)
+        batch.update_state(e, t)
+        assert list(batch.current_state) == [f.current_state for f in fsms]
+
+
+def test_named_metric_and_priority():
+    transitions = {
+        "NORMAL": [
+            ("isat_rate", ">", 0.15, "SATURATION"),
+            ("low_speed_error", ">", 0.03, "FRICTION"),
+        ],
+    }
+    batch = BatchFSM.from_transitions(transitions, 3, "NORMAL")
+    batch.update_state({"isat_rate": np.array([0.2, 0.0, 0.2]),
+                        "low_speed_error": np.array([0.0, 0.05, 0.05])}, 0.0)
+
+    assert list(batch.current_state) == ["SATURATION", "FRICTION", "SATURATION"]
+
+
+def test_tuple_rules_in_scalar_fsm():
+    transitions = {
+        "NORMAL": [
+            ("isat_rate", ">", 0.15, "SATURATION"),
+            ("low_speed_error", ">", 0.03, "FRICTION"),
+        ],
+    }
+    fsm = FSMController({"NORMAL": None, "SATURATION": None, "FRICTION": None},
+                        transitions, "NORMAL")
+    fsm.update_state({"isat_rate": 0.0, "low_speed_error": 0.05}, 0.0)
+    assert fsm.current_state == "FRICTION"
+    assert list(BatchFSM.from_controller(fsm, 2).current_state) == ["FRICTION"] * 2
+
+
+def test_lambda_transitions_not_compilable():
+    with pytest.raises(ValueError):
+        TransitionTable.compile({"normal": [(lambda e: e > 1.0, "high")]})
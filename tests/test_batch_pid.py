@@ -0,0 +1,44 @@
+import numpy as np
+
+from aitl.controllers.pid import PIDController
+from aitl.controllers.batch_pid import BatchPIDController
+
+
+def test_batch_matches_scalar_controllers():
+    rng = np.random.default_rng(0)
+    n = 16
+    kp = rng.uniform(0.5, 3.0, n)
+    ki = rng.uniform(0.0, 1.0, n)
+    kd = rng.uniform(0.0, 0.1, n)
+
+    pids = [PIDController(kp[j], ki[j], kd[j], dt=0.01) for j in range(n)]
+    batch = BatchPIDController(kp, ki, kd, dt=0.01)
+
+    for _ in range(50):
+        e = rng.normal(size=n)
+        u_ref = [pids[j].step(e[j]) for j in range(n)]
+        u = batch.step(e)
+        assert np.array_equal(u, u_ref)
+
+
+def test_batch_per_loop_gain_update():
+    pids = [PIDController(1.0, 0.5, 0.01) for _ in range(4)]
+    batch = BatchPIDController.from_controllers(pids)
+
+    batch.set_gains(kp=2.5, idx=[1, 3])
+    pids[1].kp = 2.5
+    pids[3].kp = 2.5
+
+    e = np.array([0.3, -0.2, 1.0, 0.7])
+    for _ in range(5):
+        assert np.array_equal(batch.step(e), [p.step(x) for p, x in zip(pids, e)])
+
+
+def test_batch_reset_subset():
+    batch = BatchPIDController(1.0, 0.5, 0.01, n=3)
+    batch.step(np.ones(3))
+    batch.reset(idx=1)
+
+    assert batch.integral[1] == 0.0
+    assert batch.prev_error[1] == 0.0
+    assert batch.integral[0] > 0.0
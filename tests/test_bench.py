@@ -0,0 +1,48 @@
+from aitl.sim.bench import METRICS, Case, compare, load_baseline, measure, save_baseline
+
+
+def _make_sum(n):
+    acc = [0]
+
+    def step():
+        acc[0] += 1
+    return step, n
+
+
+def _make_run(n):
+    return (lambda: sum(range(n))), n
+
+
+def test_measure_step_and_run_cases():
+    for case in (Case("sum.step", _make_sum, sizes=(200,)),
+                 Case("sum.run", _make_run, sizes=(200,), kind="run", repeat=3)):
+        r = measure(case, 200)
+        assert r["name"] == case.name and r["steps"] == 200
+        assert set(r) >= set(METRICS[case.kind])
+        assert r["steps_per_s"] > 0
+        assert r["peak_kb"] >= 0
+
+    step = measure(Case("sum.step", _make_sum, sizes=(200,)), 200)
+    assert 0 <= step["p50_us"] <= step["p90_us"] <= step["p99_us"]
+
+    # whole-run timing: no per-step percentiles, only the spread of run means
+    run = measure(Case("sum.run", _make_run, sizes=(200,), kind="run", repeat=3), 200)
+    assert "p90_us" not in run and run["mean_us"] > 0 and run["spread_us"] >= 0
+
+
+def test_baseline_roundtrip_and_compare(tmp_path):
+    base = [dict(name="a", size=1, steps_per_s=1000.0, p50_us=1.0, p90_us=1.0,
+                 p99_us=1.0, peak_kb=1000.0)]
+    path = tmp_path / "baseline.json"
+    save_baseline(base, path)
+    assert load_baseline(path) == base
+
+    slower = [dict(base[0], steps_per_s=800.0, p50_us=1.05, peak_kb=1010.0)]
+    regs = compare(slower, base, threshold=0.10)
+    assert [r["metric"] for r in regs] == ["steps_per_s"]
+
+    assert compare(base, base) == []
+
+    run = [dict(name="r", kind="run", size=1, steps_per_s=10.0, mean_us=1.0,
+                spread_us=0.1, peak_kb=1.0)]
+    assert [r["metric"] for r in compare([dict(run[0], mean_us=1.5)], run)] == ["mean_us"]
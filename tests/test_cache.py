@@ -0,0 +1,75 @@
+import importlib.util
+import os
+
+import numpy as np
+
+from aitl.sim.cache import ResultCache, source_digest
+
+CALLS = []
+
+
+def simulate(day, T=1.0, dt=0.01):
+    CALLS.append(day)
+    t = np.arange(int(T / dt)) * dt
+    return t, np.sin(t) * (1 + day)
+
+
+def test_hit_returns_identical_arrays(tmp_path):
+    cache = ResultCache(tmp_path)
+    CALLS.clear()
+
+    t0, x0 = cache.call(simulate, day=3)
+    t1, x1 = cache.call(simulate, day=3)
+
+    assert CALLS == [3]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert np.array_equal(t0, t1) and np.array_equal(x0, x1)
+
+    cache.call(simulate, day=3, T=2.0)
+    assert CALLS == [3, 3]
+
+
+def test_key_depends_on_source(tmp_path):
+    cache = ResultCache(tmp_path)
+    k = cache.key(simulate, {"day": 1})
+    cache._src[simulate.__code__] = "edited"
+    assert cache.key(simulate, {"day": 1}) != k
+
+
+def test_digest_follows_imported_modules(tmp_path, monkeypatch):
+    (tmp_path / "cache_helper.py").write_text("GAIN = 1.0\n")
+    (tmp_path / "cache_sim.py").write_text(
+        "from cache_helper import GAIN\n\ndef run(x):\n    return (x * GAIN,)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    spec = importlib.util.spec_from_file_location("cache_sim", tmp_path / "cache_sim.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+
+    before = source_digest(mod.run)
+    (tmp_path / "cache_helper.py").write_text("GAIN = 2.0\n")
+    assert source_digest(mod.run) != before
+
+
+def test_root_created_on_first_write(tmp_path):
+    cache = ResultCache(tmp_path / "a" / "b")
+    assert not (tmp_path / "a").exists()
+    assert cache.entries() == []
+    cache.call(simulate, day=0)
+    assert len(cache.entries()) == 1
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(tmp_path)
+    for day in range(3):
+        cache.call(simulate, day=day)
+    size = cache.size_bytes() // 3
+
+    # make day 1 the least recently used
+    old = cache._path(cache.key(simulate, {"day": 1}))
+    os.utime(old, (1, 1))
+
+    cache.max_bytes = 2 * size + size // 2
+    cache.evict()
+
+    assert len(cache.entries()) == 2
+    assert not old.exists()
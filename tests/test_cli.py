@@ -0,0 +1,90 @@
+import json
+import sys
+
+import numpy as np
+import pytest
+
+from aitl.scenarios import rl_current
+from aitl.sim import cli
+
+SMALL = {
+    "cases": ["PID×FSM", "AITL"],
+    "plant": {"R_ramp_per_s": 0.05},
+    "sweep": {"plant.R_step_ratio": {"start": 0.0, "stop": 0.4, "num": 3},
+              "pid.normal.0": [2.0, 2.4]},
+}
+
+
+def test_expand_sets_dotted_paths():
+    _, config = cli.resolve(SMALL)
+    runs = cli.expand(config)
+    assert [p for p, _ in runs][:3] == [
+        {"plant.R_step_ratio": 0.0, "pid.normal.0": 2.0},
+        {"plant.R_step_ratio": 0.0, "pid.normal.0": 2.4},
+        {"plant.R_step_ratio": 0.2, "pid.normal.0": 2.0},
+    ]
+    _, cfg = runs[-1]
+    assert cfg["plant"]["R_step_ratio"] == 0.4 and cfg["pid"]["normal"][0] == 2.4
+    # untouched defaults survive the merge
+    assert cfg["plant"]["L_h"] == rl_current.DEFAULT_CONFIG["plant"]["L_h"]
+
+    with pytest.raises(KeyError):
+        cli.set_path(config, "plant.nope", 1.0)
+
+
+def test_run_matches_simulate_metrics():
+    columns, trace = cli.run(SMALL, workers=1)
+    assert trace is None
+    assert len(columns["case"]) == 12
+    _, config = cli.resolve(SMALL)
+    point, cfg = cli.expand(config)[4]
+    ref = rl_current.simulate_metrics(**rl_current.make_task(cfg, "AITL"))
+    i = 4 * 2 + 1
+    assert columns["case"][i] == "AITL"
+    assert not np.isnan(ref[0])
+    assert (columns["delta_t"][i], columns["max_abs_e"][i]) == ref
+
+
+def test_main_writes_columns(tmp_path):
+    scenario = tmp_path / "s.json"
+    scenario.write_text(json.dumps(dict(SMALL, guards=[
+        {"type": "max_abs", "signal": "e", "limit": 1.25}])))
+    out = tmp_path / "out"
+    assert cli.main([str(scenario), "--workers", "1", "--out", str(out),
+                     "--traces", "--quiet"]) == 0
+
+    m = np.load(out / "metrics.npz")
+    assert m["delta_t"].shape == (12,)
+    assert set(m["status"]) <= {"ok", "rejected"}
+    tr = np.load(out / "traces.npz")
+    assert tr["e"].shape == (12, 6000) and tr["t"].shape == (6000,)
+    assert (out / "metrics.csv").read_text(encoding="utf-8").splitlines()[0] == \
+        "plant.R_step_ratio,pid.normal.0,case,delta_t,max_abs_e,status,reason"
+    assert json.loads((out / "scenario.json").read_text(encoding="utf-8"))["plant"]["R_ramp_per_s"] == 0.05
+
+
+def test_rejected_runs_carry_reason():
+    columns, _ = cli.run(dict(SMALL, guards=[{"type": "max_abs", "signal": "e", "limit": 0.5}]),
+                         workers=1)
+    assert set(columns["status"]) == {"rejected"}
+    assert columns["reason"][0] == "max|e| > 0.5"
+    assert np.isnan(columns["delta_t"][0])
+
+
+def test_traces_carry_reason():
+    columns, trace = cli.run(dict(SMALL, guards=[{"type": "max_abs", "signal": "e", "limit": 0.5}]),
+                             workers=1, traces=True)
+    assert trace is not None
+    assert set(columns["status"]) == {"rejected"}
+    assert set(columns["reason"]) == {"max|e| > 0.5"}
+
+
+def test_toml_without_parser_is_a_usage_error(tmp_path, monkeypatch, capsys):
+    scenario = tmp_path / "s.toml"
+    scenario.write_text('scenario = "rl_current"\n')
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+    with pytest.raises(SystemExit) as e:
+        cli.main([str(scenario), "--out", str(tmp_path / "out")])
+    assert e.value.code == 2
+    assert "needs tomli" in capsys.readouterr().err
@@ -0,0 +1,62 @@
+import importlib.util
+import shutil
+from pathlib import Path
+
+import pytest
+
+from aitl.controllers.fsm import FSMController
+from aitl.controllers.hybrid import HybridController
+from aitl.controllers.pid import PIDController
+from aitl.sim.report import run_job
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _report_jobs():
+    spec = importlib.util.spec_from_file_location("make_report", REPO / "make_report.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return {job.name: job for job in mod.JOBS}
+
+
+JOBS = _report_jobs()
+
+TRANSITIONS = {
+    "normal": [(lambda e: e > 1.0, "high")],
+    "high":   [(lambda e: e < 0.5, "normal")],
+}
+
+
+def test_hybrid_step_without_t():
+    fsm = FSMController({"normal": None, "high": None}, TRANSITIONS, "normal")
+    hybrid = HybridController(fsm, {"normal": PIDController(1.0, 0.0, 0.0, dt=0.01),
+                                    "high": PIDController(2.0, 0.0, 0.0, dt=0.01)})
+    assert hybrid.step(2.0)[1] == "high"
+    # min_dwell["high"] is 0.5 s, but without t there is no clock to
+    # measure it: FSMController skips the hold and switches back at once
+    assert hybrid.step(0.1)[1] == "normal"
+
+    # with t the hold applies
+    fsm.reset()
+    assert hybrid.step(2.0, 0.0)[1] == "high"
+    assert hybrid.step(0.1, 0.1)[1] == "high"
+    assert hybrid.step(0.1, 0.6)[1] == "normal"
+
+
+# the quick make_report.py jobs; the others are covered by their own tests
+@pytest.mark.parametrize("name", ["02_fsm_mode_switch", "03_hybrid_pid_fsm", "04_hybrid_fsm_llm"])
+def test_demo_runs_end_to_end(tmp_path, name):
+    job = JOBS[name]
+    script = Path(job.script).name
+    # demos write to <script>/../data, so run a copy next to a linked src/
+    (tmp_path / "demos").mkdir()
+    shutil.copy(REPO / "demos" / script, tmp_path / "demos" / script)
+    (tmp_path / "src").symlink_to(REPO / "src")
+
+    r = run_job(job.script, list(job.args), str(tmp_path), list(job.outputs), pdf=False)
+    assert r["ok"], r["error"]
+
+    # text outputs match the committed copies
+    for p in job.outputs:
+        if not p.endswith(".png"):
+            assert (tmp_path / p).read_text() == (REPO / p).read_text()
@@ -0,0 +1,65 @@
+import pickle
+
+import pytest
+
+from aitl.sim.guards import MaxAbs, RangeBelow, RateAbove, Rejected, check_guards, guard, is_rejected
+
+
+def _feed(guard, values, signal="e"):
+    for k, v in enumerate(values):
+        if guard.update({signal: v}):
+            return k
+    return None
+
+
+def test_max_abs():
+    assert _feed(MaxAbs("e", 1.0), [0.1, -0.9, 1.0, -1.5, 0.0]) == 3
+    assert _feed(MaxAbs("e", 2.0), [0.1, -0.9, 1.5]) is None
+
+
+def test_rate_above_waits_for_full_window():
+    g = RateAbove("V", 6.0, 0.5, 4)
+    assert _feed(g, [6.0, 6.0, 6.0], "V") is None
+    g.reset()
+    assert _feed(g, [6.0, 6.0, 6.0, 0.0], "V") == 3
+    g.reset()
+    assert _feed(g, [6.0, 0.0, -6.0, 0.0, 0.0, 1.0], "V") is None
+
+
+def test_range_below_after_warmup():
+    g = RangeBelow("x", 0.5, 3, after=5)
+    assert _feed(g, [0.0, 0.0, 0.0, 0.0, 1.0, 0.1, 0.2, 0.3, 0.35], "x") == 7
+
+
+def test_check_guards_returns_first_violation():
+    guards = [MaxAbs("e", 1.0), MaxAbs("I", 5.0)]
+    assert check_guards(guards, dict(e=0.5, I=1.0), 0, 0.0) is None
+
+    r = check_guards(guards, dict(e=0.5, I=-7.0), 12, 0.012)
+    assert r == Rejected("max|I| > 5", 12, 0.012, 7.0)
+    assert is_rejected(r) and r.rejected
+    assert pickle.loads(pickle.dumps(r)) == r
+    assert not is_rejected((1.0, 2.0))
+
+
+def test_guard_state_roundtrip():
+    a = RangeBelow("x", 0.5, 3, after=2)
+    _feed(a, [0.0, 1.0], "x")
+    b = RangeBelow("x", 0.5, 3, after=2)
+    b.set_state(a.get_state())
+    assert _feed(a, [0.9, 0.8, 0.7], "x") == _feed(b, [0.9, 0.8, 0.7], "x") == 1
+    assert repr(b) == "RangeBelow('x', 0.5, 3, after=2)"
+
+
+def test_rate_above_rejects_bad_window():
+    with pytest.raises(ValueError):
+        RateAbove("V", 1.0, 0.5, 0)
+
+
+def test_guard_from_spec():
+    g = guard({"type": "rate_above", "signal": "V", "level": 5.9, "rate": 0.5, "window": 10})
+    assert repr(g) == "RateAbove('V', 5.9, 0.5, 10)"
+    assert guard(g) is g
+    with pytest.raises(ValueError):
+        guard({"type": "nope"})
+
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# PID / FSM / Hybrid / LLM tuner path used by short-lived workers and CLIs
+CORE = ("aitl.controllers.pid", "aitl.controllers.fsm", "aitl.controllers.hybrid", "aitl.models.llm")
+
+# cumulative import time of CORE; ~30 ms on one slow core, so this only
+# trips when something heavy sneaks in
+BUDGET_MS = 120.0
+
+HEAVY = ("numpy", "matplotlib", "scipy", "PIL")
+
+
+def _importtime(modules):
+    """{top-level module: cumulative us} and all imported names, via -X importtime."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    r = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+                       env=env, capture_output=True, text=True, check=True)
+    top, names = {}, set()
+    for line in r.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cum, name = line.split("|")
+        names.add(name.strip())
+        if name.strip() in modules and not name.startswith("  "):
+            top[name.strip()] = int(cum)
+    return top, names
+
+
+def test_core_path_is_numpy_free_and_within_budget():
+    best = None
+    for _ in range(3):          # the first run may byte-compile
+        top, names = _importtime(CORE)
+        assert set(top) == set(CORE)
+        assert not {n.split(".")[0] for n in names} & set(HEAVY)
+        total = sum(top.values()) / 1000.0
+        best = total if best is None else min(best, total)
+    assert best < BUDGET_MS, f"core import took {best:.1f} ms (budget {BUDGET_MS} ms)"
+
+
+def test_engines_load_numpy_on_first_use():
+    _, names = _importtime(("aitl.scenarios", "aitl.sim.sweep", "aitl.sim.guards", "aitl.sim.report"))
+    assert "numpy" not in names
@@ -0,0 +1,39 @@
+import numpy as np
+
+from aitl.sim.metrics import first_held_index, settle_index, settle_time
+
+
+def _scan(e, band, hold, start):
+    for i in range(start, len(e) - hold):
+        if np.all(np.abs(e[i:i + hold]) < band):
+            return i
+    return -1
+
+
+def test_settle_index_matches_window_scan():
+    rng = np.random.default_rng(2)
+    for _ in range(50):
+        e = rng.normal(scale=0.02, size=300)
+        e[rng.integers(0, 300, 5)] = 1.0
+        for hold in (1, 7, 40):
+            assert settle_index(e, 0.03, hold, start=20) == _scan(e, 0.03, hold, 20)
+
+
+def test_settle_index_on_batch():
+    rng = np.random.default_rng(3)
+    e = rng.normal(scale=0.02, size=(8, 200))
+    idx = settle_index(e, 0.025, 10, start=5)
+
+    assert idx.shape == (8,)
+    assert list(idx) == [_scan(row, 0.025, 10, 5) for row in e]
+
+
+def test_never_settles():
+    e = np.ones(100)
+    assert first_held_index(np.abs(e) < 0.1, 5) == -1
+    assert np.isnan(settle_time(e, 0.01, 0.1, 0.05, 0.2))
+
+
+def test_settle_time_value():
+    e = np.r_[np.ones(30), np.zeros(70)]
+    assert settle_time(e, 0.01, 0.02, 0.2, 0.1) == 30 * 0.01 - 0.1
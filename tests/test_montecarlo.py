@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from aitl.sim.guards import Rejected
+from aitl.sim.montecarlo import Fixed, LogNormal, Normal, Uniform, distribution, run_monte_carlo
+
+
+def _quadratic(params, scale):
+    if params["a"] > 0.95:
+        return Rejected("a too large", 0, 0.0, params["a"])
+    return scale * params["a"] ** 2, params["a"] + params["b"]
+
+
+def test_distribution_specs():
+    assert distribution(2.0) == Fixed(2.0)
+    assert distribution({"dist": "normal", "mean": 1.0, "std": 0.1}) == Normal(1.0, 0.1)
+    assert distribution(Uniform(0, 1)) == Uniform(0, 1)
+    with pytest.raises(ValueError):
+        distribution({"dist": "cauchy"})
+
+    rng = np.random.default_rng(0)
+    assert np.all(Normal(0.0, 10.0, lo=-1.0, hi=1.0).sample(rng, 1000) <= 1.0)
+    assert np.all(LogNormal(1.2, 0.5).sample(rng, 1000) > 0)
+
+
+def test_monte_carlo_reproducible_across_workers():
+    space = {"a": Uniform(0.0, 1.0), "b": {"dist": "normal", "mean": 0.0, "std": 1.0}}
+    seen = []
+    serial = run_monte_carlo(_quadratic, space, 103, ("y", "s"), fixed=dict(scale=2.0),
+                             seed=5, workers=1, chunk=10,
+                             progress=lambda done, n: seen.append(done))
+    parallel = run_monte_carlo(_quadratic, space, 103, ("y", "s"), fixed=dict(scale=2.0),
+                               seed=5, workers=2, chunk=10)
+
+    a, b = serial.params["a"], serial.params["b"]
+    ok = a <= 0.95
+    np.testing.assert_array_equal(serial.rejected, ~ok)
+    np.testing.assert_allclose(serial.outputs["y"][ok], 2.0 * a[ok] ** 2)
+    np.testing.assert_allclose(serial.outputs["s"][ok], (a + b)[ok])
+    assert np.isnan(serial.outputs["y"][~ok]).all()
+
+    for k in ("a", "b"):
+        np.testing.assert_array_equal(serial.params[k], parallel.params[k])
+    np.testing.assert_array_equal(serial.status, parallel.status)
+    assert seen[-1] == 103
+
+    s = serial.summary()
+    assert s["y"]["n"] == ok.sum()
+    assert s["reject_rate"] == pytest.approx(np.mean(~ok))
+    assert s["y"]["q05"] <= s["y"]["q50"] <= s["y"]["q95"]
+
+    other = run_monte_carlo(_quadratic, space, 103, ("y", "s"), fixed=dict(scale=2.0),
+                            seed=6, workers=1, chunk=10)
+    assert not np.array_equal(other.params["a"], a)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from aitl.sim.peaks import DtStream, PeakStream, dt_batch, find_peaks, mean_dt
+
+
+def _loop_peaks(x, min_dist):
+    idx = np.where((x[1:-1] > x[:-2]) & (x[1:-1] > x[2:]))[0] + 1
+    peaks, last = [], -10**9
+    for i in idx:
+        if i - last >= min_dist:
+            peaks.append(i)
+            last = i
+    return np.array(peaks, dtype=int)
+
+
+def _loop_dt(t, x_ref, x_cmp, min_dist):
+    pr, pc = _loop_peaks(x_ref, min_dist), _loop_peaks(x_cmp, min_dist)
+    n = min(len(pr), len(pc))
+    return t[pc[:n]] - t[pr[:n]]
+
+
+def _signals(rng, rows, n):
+    t = np.arange(n) * 0.01
+    freq = rng.uniform(0.3, 2.0, size=(rows, 1))
+    return np.sin(2 * np.pi * freq * t) + rng.normal(scale=0.3, size=(rows, n))
+
+
+@pytest.mark.parametrize("min_dist", [0, 1, 3, 40, 500])
+def test_find_peaks_matches_loop(min_dist):
+    X = _signals(np.random.default_rng(0), 6, 2000)
+    for row in X:
+        np.testing.assert_array_equal(find_peaks(row, min_dist), _loop_peaks(row, min_dist))
+
+    batch = find_peaks(X, min_dist)
+    assert len(batch) == len(X)
+    for got, row in zip(batch, X):
+        np.testing.assert_array_equal(got, _loop_peaks(row, min_dist))
+
+
+def test_find_peaks_flat_and_short():
+    assert len(find_peaks(np.zeros(100), 5)) == 0
+    assert len(find_peaks(np.array([1.0, 2.0]), 5)) == 0
+    assert [len(p) for p in find_peaks(np.zeros((3, 10)), 2)] == [0, 0, 0]
+
+
+def test_peak_stream_matches_offline_for_any_chunking():
+    rng = np.random.default_rng(1)
+    X = _signals(rng, 4, 3000)
+    expected = find_peaks(X, 30)
+
+    for sizes in ([1] * 50 + [2950], [2, 7, 1000, 1991], [3000]):
+        stream = PeakStream(30, lanes=4)
+        got = [[] for _ in range(4)]
+        start = 0
+        for size in sizes:
+            rows, idx = stream.push(X[:, start:start + size])
+            for r, i in zip(rows, idx):
+                got[r].append(i)
+            start += size
+        for g, e in zip(got, expected):
+            np.testing.assert_array_equal(g, e)
+
+
+def test_dt_batch_and_stream_match_pairwise_loop():
+    rng = np.random.default_rng(2)
+    t = np.arange(2500) * 0.01
+    x_ref = np.sin(2 * np.pi * 0.7 * t)
+    X = _signals(rng, 5, 2500)
+    min_dist = int(0.8 / 0.01)
+
+    D = dt_batch(t, x_ref, X, min_dist_s=0.8)
+    ref_times = t[find_peaks(x_ref, min_dist)]
+    stream = DtStream(ref_times, 0.01, min_dist, lanes=5)
+    for start in range(0, 2500, 333):
+        stream.push(X[:, start:start + 333])
+
+    for j, row in enumerate(X):
+        expected = _loop_dt(t, x_ref, row, min_dist)
+        got = D[j][~np.isnan(D[j])]
+        np.testing.assert_array_equal(got, expected)
+        assert stream.count[j] == len(expected)
+        assert stream.mean[j] == pytest.approx(np.mean(expected))
+    np.testing.assert_allclose(mean_dt(D), stream.mean)
@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+import pytest
+
+from aitl.sim.profiles import (Impulse, Piecewise, Profile, Pulse, Ramp, SineBurst, profile,
+                          sample_batch)
+
+
+T = np.linspace(0.0, 6.0, 6000, endpoint=False)
+
+
+def test_piecewise_and_burst_match_scalar_functions():
+    def iref(t):
+        if t < 0.6:
+            return 0.0
+        elif t < 3.0:
+            return 1.2
+        return 1.6
+
+    def dist(t):
+        if 2.0 <= t < 2.12:
+            return -0.05
+        if 3.6 <= t < 4.4:
+            return 0.006 * math.sin(2 * math.pi * 18 * t)
+        return 0.0
+
+    ref = Profile(Piecewise([0.6, 3.0], [1.2, 1.6])).sample(T)
+    d = Profile(Pulse(2.0, 2.12, -0.05), SineBurst(3.6, 4.4, 0.006, 18.0)).sample(T)
+
+    assert np.array_equal(ref, [iref(t) for t in T])
+    assert np.array_equal(d, [dist(t) for t in T])
+
+
+def test_ramp_hold():
+    t = np.array([0.0, 1.0, 1.5, 2.0, 3.0])
+    assert np.allclose(Ramp(1.0, 2.0, 0.5).sample(t), [0.0, 0.0, 0.25, 0.5, 0.5])
+    assert np.allclose(Ramp(1.0, 2.0, 0.5, hold=False).sample(t), [0.0, 0.0, 0.25, 0.0, 0.0])
+
+
+def test_impulse_lands_on_one_sample():
+    t = np.arange(2000) * 0.01
+    p = Profile(Impulse(5.0, 0.8), Impulse(15.0, -1.0))
+    d = p.sample(t)
+
+    assert d[500] == 0.8 and d[1500] == -1.0
+    assert np.count_nonzero(d) == 2
+    assert p.events() == [5.0, 15.0]
+
+
+def test_sample_batch_rows():
+    profiles = [Profile(Pulse(1.0, 2.0, a)) for a in (0.1, 0.2, 0.3)]
+    out = sample_batch(profiles, T)
+
+    assert out.shape == (3, T.size)
+    assert np.array_equal(out[2], profiles[2].sample(T))
+
+
+def test_profile_from_spec_matches_objects():
+    t = np.arange(0.0, 5.0, 0.01)
+    spec = [dict(type="piecewise", breaks=[0.6, 3.0], values=[1.2, 1.6]),
+            dict(type="sine_burst", t0=3.6, t1=4.4, amplitude=0.006, freq_hz=18.0)]
+    p = profile(spec)
+    ref = Profile(Piecewise([0.6, 3.0], [1.2, 1.6]), SineBurst(3.6, 4.4, 0.006, 18.0))
+    assert np.array_equal(p.sample(t), ref.sample(t))
+    # equal specs give equal reprs (used as sweep prefix keys)
+    assert repr(p) == repr(ref) == repr(profile(spec))
+    with pytest.raises(ValueError):
+        profile([dict(type="chirp")])
+
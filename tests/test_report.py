@@ -0,0 +1,96 @@
+import json
+import textwrap
+from pathlib import Path
+
+from aitl.sim.report import Job, build_report, dependencies
+
+REPO = Path(__file__).resolve().parents[1]
+
+SCRIPT = """
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+import matplotlib.pyplot as plt
+from helper import SCALE
+
+os.makedirs("data", exist_ok=True)
+fig = plt.figure(figsize=(2, 2), dpi=40)
+plt.plot([0, 1], [0, SCALE])
+fig.savefig("data/out.png")
+print("saved")
+plt.show()
+"""
+
+
+def _repo(tmp_path, scale=1.0):
+    (tmp_path / "demos").mkdir()
+    (tmp_path / "src").mkdir()
+    (tmp_path / "demos" / "fig.py").write_text(textwrap.dedent(SCRIPT))
+    (tmp_path / "src" / "helper.py").write_text(f"SCALE = {scale}\n")
+    return [Job("fig", "demos/fig.py", outputs=["data/out.png"])]
+
+
+def test_dependencies_follow_repo_imports(tmp_path):
+    _repo(tmp_path)
+    assert dependencies("demos/fig.py", tmp_path) == ["demos/fig.py", "src/helper.py"]
+
+
+REGISTRY_SCRIPT = """
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+from aitl import scenarios
+
+scenarios.register("helper", "helper")
+os.makedirs("data", exist_ok=True)
+with open("data/out.txt", "w") as f:
+    f.write(str(scenarios.get("helper").SCALE))
+"""
+
+
+def test_registry_loads_count_as_dependencies(tmp_path):
+    _repo(tmp_path)
+    (tmp_path / "demos" / "reg.py").write_text(textwrap.dedent(REGISTRY_SCRIPT))
+    jobs = [Job("reg", "demos/reg.py", outputs=["data/out.txt"])]
+    assert dependencies("demos/reg.py", tmp_path) == ["demos/reg.py", "src/helper.py"]
+
+    assert build_report(jobs, root=tmp_path, workers=1)["reg"]["status"] == "built"
+    assert build_report(jobs, root=tmp_path, workers=1)["reg"]["status"] == "skipped"
+    (tmp_path / "src" / "helper.py").write_text("SCALE = 2.0\n")
+    assert build_report(jobs, root=tmp_path, workers=1)["reg"]["status"] == "built"
+
+
+def test_registered_scenarios_are_followed():
+    deps = dependencies("demos/08_reliability_fsm_dt_amp_guard.py", REPO)
+    assert "src/aitl/scenarios/friction_aging.py" in deps
+    assert "src/aitl/sim/tracestore.py" in deps
+
+
+def test_build_skip_and_rebuild(tmp_path):
+    jobs = _repo(tmp_path)
+
+    r = build_report(jobs, root=tmp_path, workers=1)["fig"]
+    assert r["status"] == "built"
+    assert (tmp_path / "data" / "out.png").is_file()
+    assert (tmp_path / "data" / "out.pdf").read_bytes().startswith(b"%PDF")
+    manifest = json.loads((tmp_path / "data" / "manifest.json").read_text())
+    assert set(manifest["jobs"]["fig"]["files"]) == {"data/out.png", "data/out.pdf"}
+
+    assert build_report(jobs, root=tmp_path, workers=1)["fig"]["status"] == "skipped"
+    assert build_report(jobs, root=tmp_path, workers=1, force=True)["fig"]["status"] == "built"
+
+    # an imported module changed
+    (tmp_path / "src" / "helper.py").write_text("SCALE = 2.0\n")
+    assert build_report(jobs, root=tmp_path, workers=1)["fig"]["status"] == "built"
+
+    # an output went missing
+    (tmp_path / "data" / "out.pdf").unlink()
+    assert build_report(jobs, root=tmp_path, workers=1)["fig"]["status"] == "built"
+
+
+def test_failed_job_reruns(tmp_path):
+    _repo(tmp_path)
+    jobs = [Job("bad", "demos/fig.py", outputs=["data/missing.png"])]
+
+    r = build_report(jobs, root=tmp_path, workers=1)["bad"]
+    assert r["status"] == "failed"
+    assert "data/missing.png" in r["error"]
+    assert build_report(jobs, root=tmp_path, workers=1)["bad"]["status"] == "failed"
@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+from aitl.models.plant import RLPlant
+
+
+def test_zoh_is_exact_for_constant_R():
+    L, R, V = 0.08, 1.2, 3.0
+    plant = RLPlant(L, R, v_max=6.0, method="zoh")
+    dt = 0.02
+    for _ in range(10):
+        plant.step(V, 0.0, dt)
+
+    exact = V / R * (1.0 - math.exp(-R * 10 * dt / L))
+    assert plant.I == pytest.approx(exact, rel=1e-12)
+
+
+def test_zoh_coarse_dt_tracks_fine_euler():
+    params = dict(R_step_time=0.3, R_step_ratio=0.75, R_ramp_per_s=0.03)
+    fine = RLPlant(0.08, 1.2, 6.0)
+    coarse = RLPlant(0.08, 1.2, 6.0, method="zoh")
+
+    for k in range(60000):
+        fine.step(2.0, k * 1e-5, 1e-5, **params)
+    for k in range(60):
+        coarse.step(2.0, k * 0.01, 0.01, **params)
+
+    assert coarse.I == pytest.approx(fine.I, rel=1e-3)
+
+
+def test_euler_matches_demo_update_and_clips_voltage():
+    plant = RLPlant(0.08, 1.2, 6.0)
+    I, V, R = plant.step(10.0, 0.0, 0.001)
+
+    assert V == 6.0
+    assert R == 1.2
+    assert I == ((6.0 - 1.2 * 0.0) / 0.08) * 0.001
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        RLPlant(0.08, 1.2, 6.0, method="rk4")
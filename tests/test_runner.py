@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from aitl.core.base import ControllerBase
+from aitl.core.runner import FixedRateRunner
+
+
+class Echo(ControllerBase):
+    def __init__(self, delay_s=0.0):
+        super().__init__("echo")
+        self.delay_s = delay_s
+        self.seen = []
+
+    def step(self, observation, t=None):
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        self.seen.append(t)
+        return observation
+
+
+def test_paces_to_period_and_collects_stats():
+    ctl = Echo()
+    acted = []
+    runner = FixedRateRunner(ctl, period_s=0.002, keep_samples=True)
+
+    t0 = time.perf_counter()
+    stats = runner.run(50, sense=lambda t: 2 * t, act=lambda u, t: acted.append(u))
+    elapsed = time.perf_counter() - t0
+
+    assert elapsed >= 50 * 0.002
+    assert stats["iterations"] == 50
+    assert ctl.seen[:3] == pytest.approx([0.0, 0.002, 0.004])
+    assert acted[1] == pytest.approx(0.004)
+    assert stats["latency"]["count"] == 50 and stats["jitter"]["count"] == 50
+    assert len(runner.samples["latency"]) == 50
+
+
+def test_counts_deadline_misses_and_skips():
+    runner = FixedRateRunner(Echo(delay_s=0.003), period_s=0.001, skip_missed=True)
+    stats = runner.run(5, sense=lambda t: 0.0)
+
+    assert stats["deadline_misses"] == 5
+    assert stats["skipped_releases"] > 0
+    assert stats["max_overrun_us"] > 0
+
+
+def test_invalid_period():
+    with pytest.raises(ValueError):
+        FixedRateRunner(Echo(), period_s=0)
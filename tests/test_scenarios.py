@@ -0,0 +1,216 @@
+import numpy as np
+import pytest
+
+from aitl import scenarios
+from aitl.sim.sweep import run_sweep
+
+
+def test_registry_lazy_lookup():
+    assert {"friction_aging", "rl_current"} <= set(scenarios.names())
+    fa = scenarios.get("friction_aging")
+    for attr in ("plant_params", "friction", "simulate", "compute_dt", "simulate_response"):
+        assert callable(getattr(fa, attr))
+
+    with pytest.raises(KeyError):
+        scenarios.get("nope")
+
+
+def test_friction_aging_response():
+    fa = scenarios.get("friction_aging")
+    t, x = fa.simulate_response("PID", 1000, "aging", T=2.0)
+
+    assert len(t) == len(x) == 2000
+    assert np.array_equal(t, np.arange(2000) * 0.001)
+    with pytest.raises(ValueError):
+        fa.simulate_response("PID", 0, "bogus")
+
+
+def _rl_task(case="PID×FSM", ratio=0.5, tuner=False, method="euler"):
+    return dict(
+        case=case, T=6.0, dt=0.001,
+        plant_params=dict(L_h=0.08, R0_ohm=1.2, v_max=6.0, method=method,
+                          R_step_time=2.4, R_step_ratio=ratio, R_ramp_per_s=0.03),
+        pid_normal=(2.2, 12.0, 0.0), pid_high=(3.6, 16.0, 0.0),
+        fsm_params=dict(e_hi=0.18, e_lo=0.08, hold_s=0.18),
+        tuner_params=dict(kp_min=1.6, kp_max=7.0, step=0.25,
+                          improve_window_s=0.18, min_improve_ratio=0.82) if tuner else None,
+    )
+
+
+def test_rl_current_runs_in_worker_processes():
+    rl = scenarios.get("rl_current")
+    task = _rl_task()
+    serial = run_sweep(rl.simulate_metrics, [task], workers=1)
+    parallel = run_sweep(rl.simulate_metrics, [task, task], workers=2)
+
+    assert not np.isnan(serial[0][0])
+    assert parallel == serial * 2
+
+
+@pytest.mark.parametrize("controller", ["PID", "AITL"])
+def test_friction_aging_batch_matches_scalar(controller):
+    fa = scenarios.get("friction_aging")
+    days = [0, 400, 1000, 2000]
+    t, X = fa.simulate_batch(days, controller, T=1.5)
+
+    assert X.shape == (len(days), len(t))
+    for j, day in enumerate(days):
+        t1, x1 = fa.simulate(day, controller, T=1.5)
+        np.testing.assert_array_equal(t, t1)
+        np.testing.assert_array_equal(X[j], x1)
+
+
+def test_friction_aging_batch_fsm_matches_scalar():
+    fa = scenarios.get("friction_aging")
+    base = (25.0, 50.0, 0.3)
+    isat = np.array([0.0, 0.1, 0.16, 0.5, 0.0, 0.2])
+    low = np.array([0.0, 0.05, 0.0, 0.05, 0.031, 0.01])
+
+    states = fa.fsm_state_batch(isat, low)
+    kp, ki, kd = fa.retune_pid_batch(base, states)
+    for j in range(len(isat)):
+        name = fa.fsm_state({"isat_rate": isat[j], "low_speed_error": low[j]})
+        assert fa.FSM_STATES[states[j]] == name
+        assert (kp[j], ki[j], kd[j]) == fa.retune_pid(base, name)
+
+
+def test_friction_aging_dt_mean_by_day_streams():
+    fa = scenarios.get("friction_aging")
+    days = [0, 1000]
+    means = fa.dt_mean_by_day(days, "PID", T=6.0, chunk=700)
+
+    t, x_ref = fa.simulate(0, "PID", T=6.0)
+    for day, got in zip(days, means):
+        _, x = fa.simulate(day, "PID", T=6.0)
+        assert got == pytest.approx(np.mean(fa.compute_dt(t, x_ref, x)))
+
+
+def test_friction_aging_dt_mean_by_day_shared_options():
+    fa = scenarios.get("friction_aging")
+    gains = (20.0, 40.0, 0.3)
+    means = fa.dt_mean_by_day([1000], "PID", T=6.0, base_gains=gains, Imax=5.0)
+
+    t, x_ref = fa.simulate(0, "PID", T=6.0, base_gains=gains, Imax=5.0)
+    _, x = fa.simulate(1000, "PID", T=6.0, base_gains=gains, Imax=5.0)
+    assert means[0] == pytest.approx(np.mean(fa.compute_dt(t, x_ref, x)))
+
+    # simulate()-only options are not silently forwarded to simulate_batch
+    with pytest.raises(TypeError):
+        fa.dt_mean_by_day([1000], "PID", T=6.0, guards=())
+
+
+@pytest.mark.parametrize("method", ["euler", "zoh"])
+def test_rl_current_forked_sweep_matches_full_runs(method):
+    rl = scenarios.get("rl_current")
+    tasks = [_rl_task(case, ratio, tuner, method)
+             for case, tuner in (("Fixed PID", False), ("AITL", True))
+             for ratio in (0.0, 0.6, 1.2)]
+
+    assert len({rl.prefix_key(t) for t in tasks}) == 2
+    assert rl.sweep_metrics(tasks, workers=1) == [rl.simulate_metrics(**t) for t in tasks]
+
+
+def test_rl_current_snapshot_is_plain_data():
+    import json
+
+    rl = scenarios.get("rl_current")
+    task = _rl_task("AITL", 0.6, tuner=True)
+    snap = json.loads(json.dumps(rl.simulate_prefix(**task)))
+
+    assert snap["k"] == 2400 and len(snap["e_log"]) == 2400
+    assert rl.simulate_metrics(**task, checkpoint=snap) == rl.simulate_metrics(**task)
+
+    late = dict(task, plant_params=dict(task["plant_params"], R_step_time=1.0))
+    with pytest.raises(ValueError):
+        rl.simulate_metrics(**late, checkpoint=snap)
+
+
+def test_rl_current_guard_rejects_early():
+    from aitl.sim.guards import MaxAbs, Rejected
+
+    rl = scenarios.get("rl_current")
+    task = _rl_task("Fixed PID", 0.6)
+
+    r = rl.simulate_metrics(**task, guards=[MaxAbs("e", 0.5)])
+    assert isinstance(r, Rejected)
+    assert (r.step, r.reason) == (600, "max|e| > 0.5")
+
+    assert rl.simulate_metrics(**task, guards=[MaxAbs("e", 2.0)]) == rl.simulate_metrics(**task)
+
+    tasks = [dict(task, guards=[MaxAbs("e", limit)]) for limit in (0.5, 2.0)]
+    assert rl.sweep_metrics(tasks, workers=1) == [rl.simulate_metrics(**t) for t in tasks]
+
+
+def test_friction_aging_guard_rejects_early():
+    from aitl.sim.guards import RangeBelow, Rejected
+
+    fa = scenarios.get("friction_aging")
+    r = fa.simulate_response("PID", 1000, "aging", T=4.0,
+                             guards=[RangeBelow("x", 10.0, 500, after=1000)])
+    assert isinstance(r, Rejected) and r.step == 999
+
+    t, x = fa.simulate_response("PID", 1000, "aging", T=4.0,
+                                guards=[RangeBelow("x", 1e-6, 500, after=1000)])
+    assert len(x) == 4000
+
+
+def test_rl_current_monte_carlo_per_case():
+    from aitl.sim.montecarlo import Normal
+
+    rl = scenarios.get("rl_current")
+    tasks = {"Fixed PID": dict(_rl_task("Fixed PID", 0.6), T=3.0),
+             "PID×FSM": dict(_rl_task("PID×FSM", 0.6), T=3.0)}
+    mc = rl.monte_carlo(tasks, {"L_h": Normal(0.08, 0.004, lo=0.05)}, 6, seed=1,
+                        workers=2, chunk=3)
+
+    assert set(mc) == set(tasks)
+    np.testing.assert_array_equal(mc["Fixed PID"].params["L_h"], mc["PID×FSM"].params["L_h"])
+    for case, res in mc.items():
+        j = 3
+        task = dict(tasks[case], plant_params=dict(tasks[case]["plant_params"],
+                                                   L_h=res.params["L_h"][j]))
+        expected = rl.simulate_metrics(**task)
+        got = (res.outputs["delta_t"][j], res.outputs["max_abs_e"][j])
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_friction_aging_plant_overrides():
+    fa = scenarios.get("friction_aging")
+    nominal = fa.simulate(1000, "PID", T=2.0)[1]
+    same = fa.simulate(1000, "PID", T=2.0, params=fa.plant_params(1000))[1]
+    heavier = fa.simulate(1000, "PID", T=2.0, params=dict(m=2.0))[1]
+
+    np.testing.assert_array_equal(nominal, same)
+    assert not np.array_equal(nominal, heavier)
+
+
+def test_rl_current_sweep_traces_in_shared_memory():
+    from aitl.sim.guards import MaxAbs
+
+    rl = scenarios.get("rl_current")
+    tasks = [_rl_task("PID×FSM", r) for r in (0.0, 1.2)]
+    tasks.append(dict(tasks[0], guards=[MaxAbs("e", 0.5)]))
+    out = rl.sweep_traces(tasks, workers=2)
+
+    assert out["e"].shape == (3, 6000)
+    assert list(out["status"]) == [1, 1, 2]
+    assert list(out["reason"]) == [b"", b"", b"max|e| > 0.5"]
+    for j in range(2):
+        loop = rl.CurrentLoop(**tasks[j]).run()
+        np.testing.assert_array_equal(out["e"][j], loop.e_log)
+        assert (out["delta_t"][j], out["max_abs_e"][j]) == rl.simulate_metrics(**tasks[j])
+    assert np.isnan(out["delta_t"][2])
+
+
+def test_friction_aging_sweep_responses():
+    from aitl.sim.peaks import dt_batch
+
+    fa = scenarios.get("friction_aging")
+    tasks = [dict(day=d, controller=c, T=3.0) for d, c in ((0, "PID"), (1000, "PID"), (1000, "AITL"))]
+    t, X, status = fa.sweep_responses(tasks, workers=2)
+
+    assert X.shape == (3, 3000) and list(status) == [1, 1, 1]
+    for row, task in zip(X, tasks):
+        np.testing.assert_array_equal(row, fa.simulate(task["day"], task["controller"], T=3.0)[1])
+    D = dt_batch(t, X[0], X[1:])
+    np.testing.assert_array_equal(D[0][~np.isnan(D[0])], fa.compute_dt(t, X[0], X[1]))
@@ -0,0 +1,23 @@
+import numpy as np
+
+from aitl.sim.shm import SharedArrays
+from aitl.sim.sweep import run_sweep
+
+
+def _fill(handle, lo, hi):
+    with SharedArrays.attach(handle) as sa:
+        sa["y"][lo:hi] = np.arange(lo, hi)[:, None] * [1.0, -1.0]
+        sa["done"][lo:hi] = 1
+    return lo, hi
+
+
+def test_workers_write_into_shared_arrays():
+    spec = {"y": ((10, 2), "f8"), "done": ((10,), "u1")}
+    with SharedArrays(spec) as sa:
+        assert sa["y"].shape == (10, 2) and not sa["done"].any()
+        tasks = [dict(handle=sa.handle(), lo=lo, hi=lo + 5) for lo in (0, 5)]
+        assert run_sweep(_fill, tasks, workers=2) == [(0, 5), (5, 10)]
+
+        np.testing.assert_array_equal(sa["y"][:, 0], np.arange(10))
+        np.testing.assert_array_equal(sa["y"][:, 1], -np.arange(10))
+        assert sa["done"].all()
@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pytest
+
+from aitl.sim.sweep import grid_indices, run_forked_sweep, run_sweep, run_sweep_shared
+
+
+def _square_and_pid(x):
+    return x * x, os.getpid()
+
+
+def test_grid_indices_row_major():
+    assert grid_indices(2, 3) == [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)]
+
+
+def test_run_sweep_keeps_task_order():
+    tasks = [dict(x=x) for x in range(20)]
+    serial = run_sweep(_square_and_pid, tasks, workers=1)
+    parallel = run_sweep(_square_and_pid, tasks, workers=2)
+
+    assert [r[0] for r in serial] == [x * x for x in range(20)]
+    assert [r[0] for r in parallel] == [r[0] for r in serial]
+
+
+def test_run_sweep_progress_and_invalid_workers():
+    seen = []
+    run_sweep(_square_and_pid, [dict(x=1), dict(x=2)], workers=1,
+              progress=lambda done, total: seen.append((done, total)))
+    assert seen == [(1, 2), (2, 2)]
+
+    with pytest.raises(ValueError):
+        run_sweep(_square_and_pid, [dict(x=1)], workers=0)
+
+
+def _prefix(x, base):
+    return dict(base=base * 10)
+
+
+def _branch(x, base, checkpoint):
+    return checkpoint["base"] + x
+
+
+def test_run_forked_sweep_branches_from_group_prefix():
+    tasks = [dict(x=x, base=x % 2) for x in range(6)]
+
+    def key(task):
+        return task["base"]
+
+    results = run_forked_sweep(_prefix, _branch, tasks, key=key, workers=1)
+    assert results == [10 * (x % 2) + x for x in range(6)]
+    assert run_forked_sweep(_prefix, _branch, tasks, key=key, workers=2) == results
+
+
+def _write_row(out, x):
+    out["y"][:] = x * np.arange(3)
+    out["s"][()] = -x
+
+
+def test_run_sweep_shared_writes_rows_in_place():
+    tasks = [dict(x=float(x)) for x in range(7)]
+    serial = run_sweep_shared(_write_row, tasks, {"y": ((3,), "f8"), "s": ((), "f4")}, workers=1)
+    parallel = run_sweep_shared(_write_row, tasks, {"y": ((3,), "f8"), "s": ((), "f4")}, workers=2)
+
+    assert serial["y"].shape == (7, 3) and serial["s"].dtype == np.float32
+    np.testing.assert_array_equal(serial["y"], np.arange(7)[:, None] * np.arange(3))
+    np.testing.assert_array_equal(serial["s"], -np.arange(7))
+    for k in serial:
+        np.testing.assert_array_equal(serial[k], parallel[k])
@@ -0,0 +1,52 @@
+import pytest
+
+from aitl.controllers.fsm import FSMController
+from aitl.controllers.hybrid import HybridController
+from aitl.controllers.pid import PIDController
+from aitl.core.timing import LatencyHistogram
+from aitl.models.llm import AITLLLM
+
+
+def _hybrid(**kw):
+    pid_map = {
+        "normal": PIDController(1.0, 0.4, 0.01, 0.01),
+        "high":   PIDController(3.2, 0.4, 0.08, 0.01),
+    }
+    transitions = {
+        "normal": [(lambda e: abs(e) > 0.40, "high")],
+        "high":   [(lambda e: abs(e) < 0.18, "normal")],
+    }
+    fsm = FSMController({k: None for k in pid_map}, transitions, "normal")
+    return HybridController(fsm, pid_map, **kw)
+
+
+def test_histogram_percentiles():
+    h = LatencyHistogram()
+    for ns in range(1, 10001):
+        h.record(ns)
+
+    s = h.summary()
+    assert s["count"] == 10000
+    assert s["min_us"] == 0.001 and s["max_us"] == 10.0
+    assert s["p50_us"] == pytest.approx(5.0, rel=0.125)
+    assert s["p99_us"] == pytest.approx(9.9, rel=0.125)
+
+
+def test_stats_off_by_default():
+    hybrid = _hybrid()
+    hybrid.step(0.5, 0.0)
+    assert hybrid.stats() == {}
+
+
+def test_stage_stats_and_same_output():
+    plain = _hybrid(tuner=AITLLLM())
+    timed = _hybrid(tuner=AITLLLM(), instrument=True)
+
+    for k in range(200):
+        e = 0.6 if (k // 50) % 2 == 0 else 0.05
+        assert plain.step(e, k * 0.01) == timed.step(e, k * 0.01)
+
+    stats = timed.stats()
+    assert set(stats) == {"fsm", "pid", "tuner"}
+    assert all(s["count"] == 200 for s in stats.values())
+    assert stats["pid"]["p50_us"] <= stats["pid"]["max_us"]
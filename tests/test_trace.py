@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from aitl.sim.trace import TraceRecorder
+
+
+def _filled(decimate=1, capacity=100):
+    rec = TraceRecorder({"t": "f8", "x": "f4", "state": ("normal", "high")},
+                        capacity=capacity, decimate=decimate)
+    for k in range(100):
+        rec.record(t=k * 0.01, x=float(k), state="high" if k % 3 == 0 else "normal")
+    return rec
+
+
+def test_record_and_decimate():
+    rec = _filled(decimate=10)
+
+    assert len(rec) == 10
+    assert np.allclose(rec["t"], np.arange(0, 100, 10) * 0.01)
+    assert rec["x"].dtype == np.float32
+    assert list(rec.labels("state")[:2]) == ["high", "normal"]
+
+
+def test_grows_past_capacity():
+    rec = _filled(capacity=8)
+    assert len(rec) == 100
+    assert rec["x"][-1] == 99.0
+
+
+def test_record_requires_every_column():
+    rec = TraceRecorder({"t": "f8", "state": ("normal", "high")}, capacity=4)
+    with pytest.raises(KeyError, match="missing \\['state'\\]"):
+        rec.record(t=0.0)
+    with pytest.raises(KeyError, match="unknown \\['y'\\]"):
+        rec.record(t=0.0, state="high", y=1.0)
+    assert len(rec) == 0
+
+
+def test_npz_roundtrip(tmp_path):
+    rec = _filled()
+    path = tmp_path / "trace.npz"
+    rec.to_npz(path)
+
+    back = TraceRecorder.from_npz(path)
+    assert back.columns == rec.columns
+    assert np.array_equal(back["x"], rec["x"])
+    assert list(back.labels("state")) == list(rec.labels("state"))
+
+
+def test_csv(tmp_path):
+    rec = _filled(decimate=50)
+    path = tmp_path / "states.csv"
+    rec.to_csv(path, "{t:.4f},{state}")
+
+    assert path.read_text() == "0.0000,high\n0.5000,normal\n"
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    _filled().to_parquet(tmp_path / "trace.parquet")
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from aitl.sim.tracestore import TraceStore
+
+
+def test_stream_in_chunks_and_map(tmp_path):
+    path = tmp_path / "run"
+    with TraceStore(path, {"t": "f8", "x": "f4"}, chunk=7, attrs={"dt": 0.1}) as store:
+        for k in range(50):
+            store.append(t=k * 0.1, x=k)
+
+    trace = TraceStore.open(path)
+    assert len(trace) == 50
+    assert trace.attrs == {"dt": 0.1}
+    assert isinstance(trace["x"], np.memmap)
+    assert np.array_equal(trace["x"], np.arange(50, dtype=np.float32))
+    assert trace["t"][-1] == 49 * 0.1
+
+
+def test_partial_chunk_visible_after_flush(tmp_path):
+    store = TraceStore(tmp_path / "run", {"x": "f8"}, chunk=100)
+    store.append(x=1.0)
+    assert len(TraceStore.open(store.path)) == 0
+
+    store.flush()
+    assert list(TraceStore.open(store.path)["x"]) == [1.0]
+    store.close()
+
+
+def test_extend_and_empty(tmp_path):
+    empty = tmp_path / "empty"
+    TraceStore(empty, {"x": "f8"}).close()
+    assert TraceStore.open(empty)["x"].shape == (0,)
+
+    with TraceStore(tmp_path / "run", {"a": "f8", "b": "f8"}) as store:
+        store.append(a=0.0, b=0.0)
+        store.extend(a=np.ones(3), b=np.ones(3))
+        with pytest.raises(ValueError):
+            store.extend(a=np.ones(2), b=np.ones(3))
+
+
+def test_append_requires_every_column(tmp_path):
+    with TraceStore(tmp_path / "run", {"a": "f8", "b": "f8"}) as store:
+        with pytest.raises(KeyError, match="missing \\['b'\\]"):
+            store.append(a=1.0)
+        with pytest.raises(KeyError, match="unknown \\['c'\\]"):
+            store.append(a=1.0, b=2.0, c=3.0)
+        with pytest.raises(KeyError):
+            store.extend(a=np.ones(2))
+        store.append(a=1.0, b=2.0)
+    assert len(TraceStore.open(tmp_path / "run")) == 1
+
+
+class _Boom:
+    def reset(self):
+        self.n = 0
+
+    def update(self, sample):
+        self.n += 1
+        if self.n == 100:
+            raise RuntimeError("boom")
+        return False
+
+
+def test_simulate_closes_store_on_error(tmp_path):
+    from aitl.scenarios.friction_aging import simulate
+
+    with pytest.raises(RuntimeError):
+        simulate(0, "PID", T=1.0, store=tmp_path / "run", guards=[_Boom()])
+    # flushed and meta written by close()
+    assert len(TraceStore.open(tmp_path / "run")) == 100
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from aitl.core.window import RollingWindow
+from aitl.models.llm import AITLLLM
+
+
+@pytest.mark.parametrize("size", [1, 3, 50])
+def test_rolling_window_matches_slice(size):
+    rng = np.random.default_rng(size)
+    xs = rng.normal(size=400)
+    w = RollingWindow(size, thresholds=(0.0, 1.0))
+
+    for n, x in enumerate(xs, 1):
+        w.push(x)
+        ref = xs[max(0, n - size):n]
+        assert len(w) == len(ref)
+        assert w.full == (n >= size)
+        assert w.values() == list(ref)
+        assert (w.first, w.last) == (ref[0], ref[-1])
+        assert (w.min, w.max) == (ref.min(), ref.max())
+        assert w.mean == pytest.approx(ref.mean())
+        assert w.count_above(0) == np.sum(ref >= 0.0)
+        assert w.count_above(1) == np.sum(ref >= 1.0)
+        assert w.fraction_above(1) == np.sum(ref >= 1.0) / size
+
+
+def test_rolling_window_reset_and_errors():
+    w = RollingWindow(4)
+    with pytest.raises(IndexError):
+        w.first
+    for x in (1.0, 2.0, 3.0):
+        w.push(x)
+    w.reset()
+    assert len(w) == 0 and w.mean == 0.0
+    with pytest.raises(ValueError):
+        RollingWindow(0)
+
+
+def test_llm_window_smooths_error():
+    plain, smoothed = AITLLLM(), AITLLLM(window=4)
+    kp_plain = kp_smooth = 1.0
+    for e in (0.0, 0.0, 0.0, 1.0):
+        kp_plain = plain.adjust("high", kp_plain, e)
+        kp_smooth = smoothed.adjust("high", kp_smooth, e)
+
+    # last step: |e| = 1.0 boosts kp, the window mean 0.25 does not
+    assert kp_plain == pytest.approx(1.0 - 3 * 0.02 + 0.05)
+    assert kp_smooth == pytest.approx(1.0 - 3 * 0.02)
+
+
+def test_rolling_window_state_roundtrip():
+    rng = np.random.default_rng(7)
+    xs = rng.normal(size=60)
+    a, b = RollingWindow(16, thresholds=(0.5,)), RollingWindow(16, thresholds=(0.5,))
+    for x in xs[:37]:
+        a.push(x)
+    b.set_state(a.get_state())
+    for x in xs[37:]:
+        a.push(x)
+        b.push(x)
+        assert (b.first, b.last, b.min, b.max, b.mean, b.count_above()) == \
+            (a.first, a.last, a.min, a.max, a.mean, a.count_above())